@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any
 
 from ethicrawl.core import Resource
 
@@ -37,6 +38,36 @@ class Client(ABC):
         """
         pass
 
+    def for_domain(self, base: str, config: Any) -> "Client":
+        """Get a client to use for one bound domain.
+
+        Called once when a domain is bound, so that clients can apply the
+        per-domain overrides in Config().domains. The default implementation
+        has nothing to configure and returns this client.
+
+        Args:
+            base: Url.base of the domain being bound
+            config: ConfigSnapshot taken at bind time
+
+        Returns:
+            The client to use for the domain
+        """
+        return self
+
+    def close(self) -> None:
+        """Release the resources held by this client.
+
+        The default implementation holds nothing and does nothing. Clients
+        can also be used as context managers, which close them on exit.
+        """
+        return None
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 
 class NoneClient(Client):
     """Null object implementation of Client that returns empty responses.
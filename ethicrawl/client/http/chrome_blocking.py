@@ -0,0 +1,93 @@
+from typing import Iterable
+
+
+def _extensions(*extensions: str) -> tuple[str, ...]:
+    """Patterns for URLs whose path ends in one of the extensions.
+
+    Chrome matches a pattern against the whole URL, so "*.gif" only
+    matches URLs ending in .gif; "*.gif?*" covers those with a query.
+    Hosts and paths that merely contain ".gif" (giftcards.com) are not
+    matched.
+    """
+    return tuple(
+        pattern
+        for extension in extensions
+        for pattern in (f"*.{extension}", f"*.{extension}?*")
+    )
+
+
+def _hosts(*hosts: str) -> tuple[str, ...]:
+    """Patterns for URLs on the hosts or any of their subdomains."""
+    return tuple(
+        pattern for host in hosts for pattern in (f"*://{host}/*", f"*://*.{host}/*")
+    )
+
+
+# URL patterns (Network.setBlockedURLs wildcards) for each resource type
+RESOURCE_PATTERNS: dict[str, tuple[str, ...]] = {
+    "image": _extensions(
+        "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"
+    ),
+    "font": _extensions("woff", "woff2", "ttf", "otf", "eot"),
+    "media": _extensions("mp4", "webm", "ogg", "mp3", "wav", "m4a", "mov", "m3u8"),
+    "stylesheet": _extensions("css"),
+}
+
+# Types blocked unless told otherwise; only the DOM is needed for scraping
+DEFAULT_BLOCKED_TYPES: tuple[str, ...] = ("image", "font", "media")
+
+# Common analytics, advertising and session-recording hosts
+TRACKER_PATTERNS: tuple[str, ...] = _hosts(
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adservice.google.*",
+    "facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "scorecardresearch.com",
+    "newrelic.com",
+    "nr-data.net",
+)
+
+
+def blocked_url_patterns(
+    resource_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+    urls: Iterable[str] = (),
+    trackers: bool = True,
+) -> list[str]:
+    """Build the URL pattern list for Network.setBlockedURLs.
+
+    Args:
+        resource_types: Resource types to block (keys of RESOURCE_PATTERNS)
+        urls: Extra URL patterns to block, matched against the whole URL;
+            '*' matches any characters
+        trackers: Whether to block the hosts in TRACKER_PATTERNS
+
+    Returns:
+        List of unique patterns, in order
+
+    Raises:
+        TypeError: If a resource type or URL pattern is not a string
+        ValueError: If a resource type is unknown
+    """
+    patterns: list[str] = []
+    for resource_type in resource_types:
+        if not isinstance(resource_type, str):
+            raise TypeError(
+                f"Expected str resource type, got {type(resource_type).__name__}"
+            )
+        if resource_type not in RESOURCE_PATTERNS:
+            valid = ", ".join(RESOURCE_PATTERNS)
+            raise ValueError(
+                f"Unknown resource type: {resource_type}. Valid types are: {valid}"
+            )
+        patterns.extend(RESOURCE_PATTERNS[resource_type])
+    for url in urls:
+        if not isinstance(url, str):
+            raise TypeError(f"Expected str URL pattern, got {type(url).__name__}")
+        patterns.append(url)
+    if trackers:
+        patterns.extend(TRACKER_PATTERNS)
+    return list(dict.fromkeys(patterns))
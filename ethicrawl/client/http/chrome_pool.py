@@ -0,0 +1,237 @@
+from contextlib import contextmanager
+from threading import Condition
+from time import monotonic
+from typing import Any, Callable, Iterator
+
+
+class ChromePool:
+    """Bounded pool of Chrome WebDriver instances.
+
+    Drivers are created on demand, up to ``size`` at once, and handed out
+    with checkout()/checkin() or the driver() context manager. A driver is
+    health-checked when it is returned and quit instead of reused if it no
+    longer responds, or once it has loaded ``max_pages`` pages, since
+    long-lived browsers slowly leak memory. Its replacement is created the
+    next time one is needed.
+
+    The pool is thread-safe; threads that find every driver busy wait
+    until one is returned.
+
+    Attributes:
+        size: Maximum number of drivers alive at the same time
+        max_pages: Pages a driver loads before it is recycled (None for
+            no limit)
+
+    Example:
+        >>> pool = ChromePool(lambda: webdriver.Chrome(options=options), size=4)
+        >>> with pool.driver() as driver:
+        ...     driver.get("https://example.com")
+        >>> pool.close()
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 1,
+        max_pages: int | None = None,
+    ) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            factory: Callable that starts a new driver
+            size: Maximum number of drivers alive at the same time
+            max_pages: Pages a driver loads before it is recycled
+
+        Raises:
+            TypeError: If size or max_pages is not an integer
+            ValueError: If size or max_pages is less than 1
+        """
+        if isinstance(size, bool) or not isinstance(size, int):
+            raise TypeError(f"size must be an integer, got {type(size).__name__}")
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if max_pages is not None:
+            if isinstance(max_pages, bool) or not isinstance(max_pages, int):
+                raise TypeError(
+                    f"max_pages must be an integer or None, got {type(max_pages).__name__}"
+                )
+            if max_pages < 1:
+                raise ValueError("max_pages must be at least 1")
+        self._factory = factory
+        self.size = size
+        self.max_pages = max_pages
+        self._idle: list[Any] = []
+        # Pages loaded by every live driver, keyed by id(driver)
+        self._pages: dict[int, int] = {}
+        self._condition = Condition()
+        self._closed = False
+
+    @property
+    def alive(self) -> int:
+        """Number of drivers currently running, idle or checked out."""
+        return len(self._pages)
+
+    @property
+    def idle(self) -> int:
+        """Number of drivers waiting to be checked out."""
+        return len(self._idle)
+
+    def add(self, driver: Any) -> None:
+        """Add an already running driver to the pool as idle.
+
+        Args:
+            driver: Driver to manage
+
+        Raises:
+            RuntimeError: If the pool is closed or already full
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("ChromePool is closed")
+            if self.alive >= self.size:
+                raise RuntimeError("ChromePool is full")
+            self._pages[id(driver)] = 0
+            self._idle.append(driver)
+            self._condition.notify()
+
+    def replace(self, old: Any, new: Any) -> None:
+        """Swap an idle driver for another one, quitting the old driver.
+
+        Args:
+            old: Idle driver to remove, or None to just add new
+            new: Driver to add in its place
+        """
+        with self._condition:
+            if old is not None and old is not new and old in self._idle:
+                self._idle.remove(old)
+                del self._pages[id(old)]
+                self._quit(old)
+            if new not in self._idle:
+                self._pages[id(new)] = 0
+                self._idle.append(new)
+                self._condition.notify()
+
+    def checkout(self, timeout: float | None = None) -> Any:
+        """Take a driver, starting one if below size, else waiting.
+
+        Args:
+            timeout: Seconds to wait for a driver (None waits forever)
+
+        Returns:
+            A driver for the caller's exclusive use until checkin()
+
+        Raises:
+            RuntimeError: If the pool is closed
+            TimeoutError: If no driver became available in time
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("ChromePool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self.alive < self.size:
+                    # Reserve the slot so other threads do not overshoot
+                    # size while this driver starts
+                    placeholder = object()
+                    self._pages[id(placeholder)] = 0
+                    break
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No Chrome driver available")
+                self._condition.wait(remaining)
+        try:
+            driver = self._factory()
+        except BaseException:
+            with self._condition:
+                del self._pages[id(placeholder)]
+                self._condition.notify()
+            raise
+        with self._condition:
+            del self._pages[id(placeholder)]
+            self._pages[id(driver)] = 0
+        return driver
+
+    def checkin(self, driver: Any, healthy: bool | None = None) -> None:
+        """Return a driver after use.
+
+        Args:
+            driver: Driver obtained from checkout()
+            healthy: Whether the driver is still usable; None runs a
+                health check
+        """
+        if healthy is None:
+            healthy = self._is_healthy(driver)
+        with self._condition:
+            pages = self._pages.get(id(driver), 0) + 1
+            recycle = (
+                not healthy
+                or self._closed
+                or (self.max_pages is not None and pages >= self.max_pages)
+            )
+            if recycle:
+                self._pages.pop(id(driver), None)
+            else:
+                self._pages[id(driver)] = pages
+                self._idle.append(driver)
+            self._condition.notify()
+        if recycle:
+            self._quit(driver)
+
+    @contextmanager
+    def driver(self, timeout: float | None = None) -> Iterator[Any]:
+        """Check out a driver for the duration of a with block.
+
+        If the block raises, the driver is health-checked before it is
+        reused, so a crashed browser is replaced rather than handed out
+        again.
+
+        Args:
+            timeout: Seconds to wait for a driver (None waits forever)
+
+        Yields:
+            A driver for exclusive use inside the block
+        """
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        except BaseException:
+            self.checkin(driver)
+            raise
+        self.checkin(driver, healthy=True)
+
+    @staticmethod
+    def _is_healthy(driver: Any) -> bool:
+        """Check that the browser behind a driver still responds."""
+        try:
+            driver.execute_script("return 1;")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver: Any) -> None:
+        try:
+            driver.quit()
+        except Exception:  # pragma: no cover
+            pass  # already gone
+
+    def close(self, release: Callable[[Any], None] | None = None) -> None:
+        """Quit idle drivers now and checked-out ones when returned.
+
+        Args:
+            release: Called with each idle driver instead of quitting it,
+                to hand it over for reuse elsewhere
+        """
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            for driver in idle:
+                self._pages.pop(id(driver), None)
+            self._condition.notify_all()
+        for driver in idle:
+            if release is not None:
+                release(driver)
+            else:
+                self._quit(driver)
@@ -0,0 +1,259 @@
+from abc import ABC, abstractmethod
+from json import loads
+from time import monotonic
+from time import sleep as time_sleep
+from typing import Any, Callable
+
+from selenium.webdriver.common.by import By
+
+LogEntries = list[dict[str, Any]]
+
+# Records when the DOM last changed, in page time (performance.now())
+_MUTATION_PROBE = """
+if (window.__ethicrawlLastMutation === undefined) {
+    window.__ethicrawlLastMutation = performance.now();
+    new MutationObserver(function () {
+        window.__ethicrawlLastMutation = performance.now();
+    }).observe(document, {childList: true, subtree: true, attributes: true,
+                          characterData: true});
+}
+return performance.now() - window.__ethicrawlLastMutation;
+"""
+
+
+class _Clock:
+    """Deadline tracking that also counts time passed to sleep().
+
+    Counting slept time as well as wall time keeps the bound meaningful
+    when sleep is replaced, e.g. by a no-op in tests.
+    """
+
+    def __init__(self, timeout: float, sleep: Callable[[float], Any]) -> None:
+        self._start = monotonic()
+        self._slept = 0.0
+        self._sleep = sleep
+        self.timeout = timeout
+
+    @property
+    def elapsed(self) -> float:
+        return max(monotonic() - self._start, self._slept)
+
+    @property
+    def remaining(self) -> float:
+        return max(self.timeout - self.elapsed, 0.0)
+
+    def pause(self, seconds: float) -> None:
+        seconds = min(seconds, self.remaining)
+        if seconds > 0:
+            self._sleep(seconds)
+            self._slept += seconds
+
+
+class ReadinessStrategy(ABC):
+    """Decides when a page loaded in Chrome has finished rendering.
+
+    ChromeTransport runs a strategy after the page's load event and before
+    reading the DOM. Strategies poll the browser and return as soon as the
+    page is ready, or when the transport's wait_time runs out.
+    """
+
+    poll_interval = 0.05
+
+    def wait(
+        self,
+        driver: Any,
+        timeout: float,
+        sleep: Callable[[float], Any] = time_sleep,
+    ) -> LogEntries:
+        """Wait until the page is ready or timeout seconds have passed.
+
+        Args:
+            driver: WebDriver that has loaded the page
+            timeout: Upper bound on the wait in seconds
+            sleep: Function used to pause between polls
+
+        Returns:
+            Performance log entries read from the driver while waiting,
+            which are no longer available from driver.get_log()
+        """
+        clock = _Clock(timeout, sleep)
+        entries: LogEntries = []
+        # Per-call state, so one strategy can serve several browsers at once
+        state: dict[Any, Any] = {}
+        while not self._ready(driver, clock, entries, state):
+            if clock.remaining <= 0:
+                break
+            clock.pause(self.poll_interval)
+        return entries
+
+    @abstractmethod
+    def _ready(
+        self, driver: Any, clock: _Clock, entries: LogEntries, state: dict
+    ) -> bool:
+        """Check readiness once.
+
+        Args:
+            driver: WebDriver that has loaded the page
+            clock: Time budget of this wait
+            entries: List to add any performance log entries read to
+            state: Dictionary kept between polls of the same wait
+
+        Returns:
+            True if the page is ready
+        """
+
+
+class FixedDelay(ReadinessStrategy):
+    """Always wait the full wait_time (the behaviour before strategies)."""
+
+    def _ready(
+        self, driver: Any, clock: _Clock, entries: LogEntries, state: dict
+    ) -> bool:
+        clock.pause(clock.remaining)
+        return True
+
+
+class NetworkIdle(ReadinessStrategy):
+    """Ready when no requests have been in flight for idle_time seconds.
+
+    Requests are tracked from the Network.requestWillBeSent and
+    Network.loadingFinished/loadingFailed events in Chrome's performance
+    log, so this needs the performance logging ChromeTransport enables.
+
+    Attributes:
+        idle_time: Seconds without network activity that count as idle
+    """
+
+    _STARTED = "Network.requestWillBeSent"
+    _ENDED = ("Network.loadingFinished", "Network.loadingFailed")
+
+    def __init__(self, idle_time: float = 0.5) -> None:
+        """Initialize the strategy.
+
+        Args:
+            idle_time: Seconds without network activity that count as idle
+        """
+        self.idle_time = idle_time
+
+    def _ready(
+        self, driver: Any, clock: _Clock, entries: LogEntries, state: dict
+    ) -> bool:
+        pending: set[str] = state.setdefault("pending", set())
+        new = driver.get_log("performance")
+        entries.extend(new)
+        for entry in new:
+            message = entry.get("message", "")
+            # Only request lifecycle events matter; skip parsing the rest
+            if '"Network.request' not in message and '"Network.loading' not in message:
+                continue
+            try:
+                event = loads(message)["message"]
+                method = event["method"]
+                request_id = event["params"]["requestId"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            if method == self._STARTED:
+                pending.add(request_id)
+            elif method in self._ENDED:
+                pending.discard(request_id)
+            else:
+                continue
+            state["last_activity"] = clock.elapsed
+        if pending:
+            state["last_activity"] = clock.elapsed
+            return False
+        return clock.elapsed - state.get("last_activity", 0.0) >= self.idle_time
+
+
+class DomQuiescence(ReadinessStrategy):
+    """Ready when the DOM has not changed for quiet_time seconds.
+
+    Installs a MutationObserver in the page on the first poll, so changes
+    made by scripts after the load event are seen.
+
+    Attributes:
+        quiet_time: Seconds without DOM mutations that count as settled
+    """
+
+    def __init__(self, quiet_time: float = 0.5) -> None:
+        """Initialize the strategy.
+
+        Args:
+            quiet_time: Seconds without DOM mutations that count as settled
+        """
+        self.quiet_time = quiet_time
+
+    def _ready(
+        self, driver: Any, clock: _Clock, entries: LogEntries, state: dict
+    ) -> bool:
+        since_change = driver.execute_script(_MUTATION_PROBE)
+        if not isinstance(since_change, (int, float)):
+            return True  # Cannot observe this page; nothing to wait for
+        return since_change >= self.quiet_time * 1000
+
+
+class SelectorPresent(ReadinessStrategy):
+    """Ready once an element matching a CSS selector is in the DOM.
+
+    Attributes:
+        selector: CSS selector to wait for
+    """
+
+    def __init__(self, selector: str) -> None:
+        """Initialize the strategy.
+
+        Args:
+            selector: CSS selector to wait for
+
+        Raises:
+            TypeError: If selector is not a string
+            ValueError: If selector is empty
+        """
+        if not isinstance(selector, str):
+            raise TypeError(f"selector must be a string, got {type(selector).__name__}")
+        if not selector.strip():
+            raise ValueError("selector cannot be empty")
+        self.selector = selector
+
+    def _ready(
+        self, driver: Any, clock: _Clock, entries: LogEntries, state: dict
+    ) -> bool:
+        return bool(driver.find_elements(By.CSS_SELECTOR, self.selector))
+
+
+class AllOf(ReadinessStrategy):
+    """Ready when each of several strategies is, checked in order.
+
+    All strategies share one wait_time budget.
+
+    Example:
+        >>> AllOf(NetworkIdle(), SelectorPresent("#results"))
+    """
+
+    def __init__(self, *strategies: ReadinessStrategy) -> None:
+        """Initialize the strategy.
+
+        Args:
+            *strategies: Strategies to satisfy, in order
+
+        Raises:
+            TypeError: If any argument is not a ReadinessStrategy
+        """
+        for strategy in strategies:
+            if not isinstance(strategy, ReadinessStrategy):
+                raise TypeError(
+                    f"Expected ReadinessStrategy, got {type(strategy).__name__}"
+                )
+        self.strategies = strategies
+
+    def _ready(
+        self, driver: Any, clock: _Clock, entries: LogEntries, state: dict
+    ) -> bool:
+        index = state.get("index", 0)
+        while index < len(self.strategies):
+            strategy = self.strategies[index]
+            if not strategy._ready(driver, clock, entries, state.setdefault(index, {})):
+                break
+            index += 1
+        state["index"] = index
+        return index == len(self.strategies)
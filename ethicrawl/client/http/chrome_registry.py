@@ -0,0 +1,88 @@
+import atexit
+from threading import Lock
+from typing import Any, Callable
+
+from .chrome_pool import ChromePool
+
+
+class DriverRegistry:
+    """Process-wide store of warm Chrome drivers, keyed by launch options.
+
+    A ChromeTransport that is closed hands its idle browsers to the
+    registry instead of quitting them, and new transports launched with
+    the same options take them back, skipping Chrome's startup time.
+    Drivers are health-checked and have their cookies cleared before
+    being stored, and anything left is quit when the process exits.
+
+    Attributes:
+        max_idle: Most drivers kept waiting for reuse; extra drivers are
+            quit when released
+    """
+
+    def __init__(self, max_idle: int = 4) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            max_idle: Most drivers kept waiting for reuse
+        """
+        self.max_idle = max_idle
+        self._lock = Lock()
+        self._idle: list[tuple[str, Any]] = []
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def acquire(self, key: str, launch: Callable[[], Any]) -> Any:
+        """Take a warm driver started with the given options, or launch one.
+
+        Args:
+            key: Launch options the driver must have been started with
+            launch: Callable that starts a new driver if none is waiting
+
+        Returns:
+            A running driver
+        """
+        while True:
+            with self._lock:
+                index = next(
+                    (i for i, (k, _) in enumerate(self._idle) if k == key), None
+                )
+                if index is None:
+                    break
+                _, driver = self._idle.pop(index)
+            if ChromePool._is_healthy(driver):
+                return driver
+            ChromePool._quit(driver)
+        return launch()
+
+    def release(self, key: str, driver: Any) -> None:
+        """Keep a driver for reuse, or quit it if the registry is full.
+
+        Args:
+            key: Launch options the driver was started with
+            driver: Driver no longer used by its transport
+        """
+        try:
+            # Leave nothing from the last crawl behind for the next one
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.get("about:blank")
+        except Exception:
+            ChromePool._quit(driver)
+            return
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append((key, driver))
+                return
+        ChromePool._quit(driver)
+
+    def clear(self) -> None:
+        """Quit every waiting driver."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for _, driver in idle:
+            ChromePool._quit(driver)
+
+
+registry = DriverRegistry()
+atexit.register(registry.clear)
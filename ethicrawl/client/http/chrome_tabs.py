@@ -0,0 +1,212 @@
+from threading import RLock
+from time import monotonic, sleep
+from typing import Any
+
+# Key of the target id chromedriver adds to every performance log entry
+_WEBVIEW_KEY = '"webview"'
+
+# Flag the document shown before a navigation, so that polling can tell it
+# from the document the navigation commits
+_MARK_DOCUMENT = "document.__ethicrawlPrevious = true; return location.href;"
+_READY_STATE = "return document.__ethicrawlPrevious ? 'previous' : document.readyState;"
+
+
+class ChromeTabs:
+    """Shares one Chrome instance between several tabs.
+
+    WebDriver sends commands to whichever window is current, one command
+    at a time, so every command from a tab takes a lock, switches to its
+    window if needed, and runs. Pages load in the background while other
+    tabs issue commands, which requires the "none" page load strategy so
+    that get() does not hold the lock until the load finishes.
+
+    Chrome writes the performance log entries of all tabs to one log, so
+    entries are sorted into per-tab buffers by their webview (target) id.
+
+    Attributes:
+        driver: The shared WebDriver
+        isolate: Whether each tab gets its own browser context, with its
+            own cookies and storage
+        open: Number of tabs currently open
+    """
+
+    def __init__(self, driver: Any, isolate: bool = True) -> None:
+        """Manage tabs of a running browser.
+
+        Args:
+            driver: WebDriver started with page_load_strategy "none"
+            isolate: Give each tab its own browser context
+        """
+        self.driver = driver
+        self.isolate = isolate
+        self.open = 0
+        self._lock = RLock()
+        self._current: str | None = None
+        self._buffers: dict[str, list[dict[str, Any]]] = {}
+        self._retired = False
+
+    def open_tab(self) -> "TabDriver":
+        """Open a blank tab.
+
+        Returns:
+            TabDriver for the new tab
+        """
+        with self._lock:
+            context_id = None
+            params: dict[str, Any] = {"url": "about:blank"}
+            if self.isolate:
+                context_id = self.driver.execute_cdp_cmd(
+                    "Target.createBrowserContext", {}
+                )["browserContextId"]
+                params["browserContextId"] = context_id
+            target = self.driver.execute_cdp_cmd("Target.createTarget", params)
+            handle = target["targetId"]
+            self._buffers[handle] = []
+            self.open += 1
+        return TabDriver(self, handle, context_id)
+
+    def close_tab(self, tab: "TabDriver") -> None:
+        """Close a tab and dispose of its browser context.
+
+        Quits the browser if it was retired and this was its last tab.
+        """
+        with self._lock:
+            if self._buffers.pop(tab.handle, None) is None:
+                return
+            self.open -= 1
+            if self._current == tab.handle:
+                self._current = None
+            try:
+                self.driver.execute_cdp_cmd(
+                    "Target.closeTarget", {"targetId": tab.handle}
+                )
+                if tab.context_id is not None:
+                    self.driver.execute_cdp_cmd(
+                        "Target.disposeBrowserContext",
+                        {"browserContextId": tab.context_id},
+                    )
+            except Exception:  # pragma: no cover
+                pass  # browser already gone
+            if self._retired and not self.open:
+                self.quit()
+
+    def retire(self) -> bool:
+        """Quit the browser once the tabs still open are closed.
+
+        Returns:
+            True if no tabs are open, in which case nothing is quit and the
+            browser is left for the caller to quit or hand over
+        """
+        with self._lock:
+            if not self.open:
+                return True
+            self._retired = True
+            return False
+
+    def call(self, handle: str, name: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a driver method (or read an attribute) in a tab."""
+        with self._lock:
+            if self._current != handle:
+                self.driver.switch_to.window(handle)
+                self._current = handle
+            attr = getattr(self.driver, name)
+            return attr(*args, **kwargs) if callable(attr) else attr
+
+    def get_log(self, handle: str) -> list[dict[str, Any]]:
+        """Get the performance log entries of one tab."""
+        with self._lock:
+            buffers = self._buffers
+            for entry in self.driver.get_log("performance"):
+                message = entry.get("message", "")
+                start = message.rfind(_WEBVIEW_KEY)
+                if start < 0:
+                    continue
+                # Skip the colon and any whitespace up to the opening quote
+                start = message.find('"', start + len(_WEBVIEW_KEY)) + 1
+                webview = message[start : message.find('"', start)]
+                if webview in buffers:
+                    buffers[webview].append(entry)
+            entries = buffers.get(handle, [])
+            if handle in buffers:
+                buffers[handle] = []
+            return entries
+
+    def quit(self) -> None:
+        """Quit the browser and every tab in it."""
+        with self._lock:
+            self._buffers.clear()
+            self.open = 0
+            self.driver.quit()
+
+
+class TabDriver:
+    """WebDriver-like handle for one tab of a shared browser.
+
+    Supports the subset of the WebDriver API ChromeTransport uses. get()
+    returns once the document has loaded, like the default page load
+    strategy, but releases the browser to other tabs while it waits.
+    quit() closes only this tab.
+
+    Attributes:
+        handle: Window handle (target id) of the tab
+        context_id: Browser context of the tab, or None if shared
+    """
+
+    poll_interval = 0.05
+
+    def __init__(
+        self, tabs: ChromeTabs, handle: str, context_id: str | None = None
+    ) -> None:
+        self._tabs = tabs
+        self.handle = handle
+        self.context_id = context_id
+        self._page_load_timeout = 30.0
+
+    def get(self, url: str) -> None:
+        # With the "none" strategy the driver returns before the navigation
+        # commits, while the previous document (often already "complete")
+        # is still current, so wait for the marked document to be replaced
+        previous = self.execute_script(_MARK_DOCUMENT)
+        if "#" in url and url.split("#")[0] == str(previous).split("#")[0]:
+            # Fragment navigation keeps the document, mark and all
+            self.execute_script("delete document.__ethicrawlPrevious;")
+        self._tabs.call(self.handle, "get", url)
+        deadline = monotonic() + self._page_load_timeout
+        while monotonic() < deadline:
+            state = self.execute_script(_READY_STATE)
+            if state == "complete":
+                return
+            sleep(self.poll_interval)
+        raise TimeoutError(f"Timed out loading {url}")
+
+    def set_page_load_timeout(self, timeout: float) -> None:
+        # Enforced by get(); the driver's own timeout is shared by all tabs
+        self._page_load_timeout = timeout
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        return self._tabs.call(self.handle, "execute_script", script, *args)
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> Any:
+        return self._tabs.call(self.handle, "execute_cdp_cmd", cmd, cmd_args)
+
+    def find_element(self, by: str, value: str) -> Any:
+        return self._tabs.call(self.handle, "find_element", by, value)
+
+    def find_elements(self, by: str, value: str) -> list[Any]:
+        return self._tabs.call(self.handle, "find_elements", by, value)
+
+    def get_log(self, log_type: str) -> list[dict[str, Any]]:
+        if log_type != "performance":
+            return self._tabs.call(self.handle, "get_log", log_type)
+        return self._tabs.get_log(self.handle)
+
+    @property
+    def page_source(self) -> str:
+        return self._tabs.call(self.handle, "page_source")
+
+    @property
+    def current_url(self) -> str:
+        return self._tabs.call(self.handle, "current_url")
+
+    def quit(self) -> None:
+        self._tabs.close_tab(self)
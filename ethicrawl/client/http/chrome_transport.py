@@ -1,6 +1,8 @@
-from json import loads
+from json import dumps, loads
+from threading import Lock
 from time import sleep
-from typing import Any
+from typing import Any, Iterable
+from weakref import WeakKeyDictionary
 
 from lxml import etree, html
 from selenium import webdriver
@@ -14,8 +16,34 @@ from ethicrawl.config import Config
 from ethicrawl.context import Context
 from ethicrawl.core import Headers, Url
 
+from .chrome_blocking import DEFAULT_BLOCKED_TYPES, blocked_url_patterns
+from .chrome_pool import ChromePool
+from .chrome_readiness import NetworkIdle, ReadinessStrategy
+from .chrome_registry import registry
+from .chrome_tabs import ChromeTabs, TabDriver
 from .http_request import HttpRequest
 from .http_response import HttpResponse
+from .render_cache import RenderCache
+from .requests_transport import RequestsTransport
+
+# Headers that Network.setExtraHTTPHeaders would add to every resource a
+# page loads, not just the page: conditional headers turn those loads into
+# 304s with no body, and credentials would go to every third-party origin
+_DOCUMENT_ONLY_HEADERS = frozenset(
+    {
+        "if-none-match",
+        "if-modified-since",
+        "if-match",
+        "if-unmodified-since",
+        "if-range",
+        "authorization",
+        "proxy-authorization",
+        "cookie",
+    }
+)
+
+# Headers that make a page specific to one session, so it is not cached
+_CREDENTIAL_HEADERS = frozenset({"authorization", "proxy-authorization", "cookie"})
 
 
 class ChromeTransport(Transport):
@@ -31,11 +59,25 @@ class ChromeTransport(Transport):
     - Network traffic inspection via Chrome DevTools Protocol
     - Automatic XML content extraction from browser rendering
     - Proxy configuration support
-    - Configurable wait time for dynamic content
+    - Request headers and user agent applied over CDP; a Cookie header
+      becomes cookies for the requested site
+    - Blocking of images, fonts, media and trackers that the rendered DOM
+      does not need
+    - Waits for dynamic content until the page is ready (network idle by
+      default), bounded by a configurable wait time
+    - A pool of browsers, sized by Config().concurrency.chrome, so several
+      threads can render pages at once
+    - Optionally several tabs per browser, each with its own cookies
+    - Browsers handed to a process-wide registry on close(), so the next
+      transport with the same options starts without waiting for Chrome
+    - An optional on-disk cache of rendered pages, revalidated with
+      conditional requests so unchanged pages are not rendered again
 
     Attributes:
-        driver: Selenium WebDriver instance controlling Chrome
-        _wait_time: Time to wait for dynamic content to load (seconds)
+        driver: The first Selenium WebDriver started for this transport
+        pool: ChromePool managing every browser of this transport
+        _wait_time: Longest time to wait for dynamic content (seconds)
+        _readiness: Strategy deciding when dynamic content has loaded
         _user_agent: Browser's actual user agent string
 
     Example:
@@ -50,24 +92,104 @@ class ChromeTransport(Transport):
         True
     """
 
-    def __init__(self, context: Context, headless=True, wait_time=3):
+    # Concurrency setting a domain override uses to limit HttpClient
+    concurrency_setting = "chrome"
+
+    def __init__(
+        self,
+        context: Context,
+        headless=True,
+        wait_time=3,
+        pool_size: int | None = None,
+        max_pages: int | None = None,
+        tabs: int = 1,
+        isolate_tabs: bool = True,
+        readiness: ReadinessStrategy | None = None,
+        block_resources: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+        block_urls: Iterable[str] = (),
+        block_trackers: bool = True,
+        reuse_drivers: bool = True,
+        cache: RenderCache | None = None,
+    ):
         """Initialize the Chrome transport with browser configuration.
 
         Sets up a Chrome browser instance with appropriate options for
         web scraping, including performance logging for network inspection.
+        Further browsers, up to pool_size, are started when concurrent
+        requests need them.
 
         Args:
             context: The context to use for logging and resource resolution
             headless: Whether to run Chrome in headless mode (no GUI)
-            wait_time: Time to wait for dynamic content after page load (seconds)
+            wait_time: Longest time to wait for dynamic content after page
+                load (seconds); 0 disables waiting
+            pool_size: Maximum number of browsers (default:
+                Config().concurrency.chrome, or 1 when that is below 1)
+            max_pages: Pages each browser (or tab, when tabs > 1) loads
+                before it is restarted (default: no limit)
+            tabs: Pages each browser renders at once, one per tab. With
+                more than one, up to pool_size * tabs requests run in
+                parallel while only pool_size Chrome processes are started.
+            isolate_tabs: Give each tab its own browser context, so tabs
+                do not share cookies or storage (only used when tabs > 1)
+            reuse_drivers: Take warm browsers from the process-wide
+                registry, and hand them back on close() instead of quitting
+            cache: Cache of rendered pages to serve unchanged pages from;
+                requests with Cookie or authorization headers bypass it
+            readiness: Strategy deciding when dynamic content has loaded
+                (default: NetworkIdle(); FixedDelay() always waits the
+                full wait_time)
+            block_resources: Resource types not to load, from "image",
+                "font", "media" and "stylesheet" (default: images, fonts
+                and media). Types are matched by file extension, so a page
+                requested directly with a blocked extension fails to load.
+            block_urls: Extra URL patterns not to load, matched against the
+                whole URL; '*' is a wildcard
+            block_trackers: Whether to skip common analytics and ad hosts
+
+        Raises:
+            TypeError: If readiness is not a ReadinessStrategy, tabs is
+                not an integer, or cache is not a RenderCache
+            ValueError: If block_resources names an unknown type, or tabs
+                is less than 1
 
         Note:
             Chrome/Chromium must be installed on the system for this to work
         """
         self._context = context
         self._logger = self._context.logger("client.chrome")
+        if isinstance(tabs, bool) or not isinstance(tabs, int):
+            raise TypeError(f"tabs must be an integer, got {type(tabs).__name__}")
+        if tabs < 1:
+            raise ValueError("tabs must be at least 1")
+        self._tabs = tabs
+        self._isolate_tabs = isolate_tabs
+        self._browsers: list[ChromeTabs] = []
+        self._browsers_lock = Lock()
         self._wait_time = wait_time
+        if readiness is None:
+            readiness = NetworkIdle()
+        if not isinstance(readiness, ReadinessStrategy):
+            raise TypeError(
+                f"Expected ReadinessStrategy, got {type(readiness).__name__}"
+            )
+        self._readiness = readiness
+        block_resources = tuple(block_resources)
+        self._blocked_urls = blocked_url_patterns(
+            block_resources, block_urls, block_trackers
+        )
+        if cache is not None and not isinstance(cache, RenderCache):
+            raise TypeError(f"Expected RenderCache, got {type(cache).__name__}")
+        self._cache = cache
+        # Cheap conditional requests to check whether cached pages changed
+        self._revalidator = RequestsTransport(context) if cache is not None else None
         self._user_agent = None  # Will be populated after first request
+        self._user_agent_override: str | None = None
+        # (extra headers, user agent) last sent to each driver over CDP
+        self._applied_headers: WeakKeyDictionary = WeakKeyDictionary()
+        config = Config().snapshot()
+        self._timeout = config.http.timeout
+        self._default_user_agent = config.http.user_agent
 
         # Set up Chrome options
         options = Options()
@@ -78,11 +200,14 @@ class ChromeTransport(Transport):
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
-        options.add_argument(f"--user-agent={Config().http.user_agent}")
+        options.add_argument(f"--user-agent={config.http.user_agent}")
+        if "image" in block_resources:
+            # Also catches images whose URLs have no recognisable extension
+            options.add_argument("--blink-settings=imagesEnabled=false")
 
         # Set up proxy if configured
-        http_proxy = Config().http.proxies.http
-        https_proxy = Config().http.proxies.https
+        http_proxy = config.http.proxies.http
+        https_proxy = config.http.proxies.https
 
         if http_proxy or https_proxy:
             # If both HTTP and HTTPS use the same proxy (common case)
@@ -100,8 +225,184 @@ class ChromeTransport(Transport):
             "goog:loggingPrefs", {"performance": "ALL", "browser": "ALL"}
         )
 
-        # Initialize the driver
-        self.driver = webdriver.Chrome(options=options)
+        if tabs > 1:
+            # Let get() return at once so one tab loading does not hold up
+            # commands from the others; TabDriver.get waits for the load
+            options.page_load_strategy = "none"
+
+        self._options = options
+        self._reuse = reuse_drivers
+        self._closed = False
+        # Reused browsers must have been launched, and blocked, the same way
+        self._registry_key = dumps(
+            [options.to_capabilities(), self._blocked_urls],
+            sort_keys=True,
+            default=str,
+        )
+        if pool_size is None:
+            pool_size = max(int(config.concurrency.chrome), 1)
+        self._max_browsers = pool_size
+
+        # Start the first browser now so configuration problems show up here
+        if tabs > 1:
+            self.pool = ChromePool(self._open_tab, pool_size * tabs, max_pages)
+            self._driver = self._launch()
+            self._browsers.append(ChromeTabs(self._driver, isolate_tabs))
+        else:
+            self.pool = ChromePool(self._start_driver, pool_size, max_pages)
+            self.driver = self._start_driver()
+
+    def _launch(self):
+        """Get a Chrome instance with this transport's options.
+
+        Takes a warm one from the registry when allowed, else starts one.
+        """
+        if self._reuse:
+            return registry.acquire(self._registry_key, self._new_browser)
+        return self._new_browser()
+
+    def _new_browser(self):
+        return webdriver.Chrome(options=self._options)
+
+    def _start_driver(self):
+        """Launch a browser for the pool, with request blocking applied."""
+        driver = self._launch()
+        self._apply_blocking(driver)
+        return driver
+
+    def _open_tab(self) -> TabDriver:
+        """Open a tab in a browser with room, starting one if needed."""
+        with self._browsers_lock:
+            for browser in list(self._browsers):
+                if browser.open < self._tabs:
+                    try:
+                        tab = browser.open_tab()
+                        break
+                    except Exception as exc:
+                        # Browser is gone; forget it and try the next
+                        self._logger.warning("Dropping unresponsive Chrome: %s", exc)
+                        self._browsers.remove(browser)
+            else:
+                if len(self._browsers) >= self._max_browsers:  # pragma: no cover
+                    raise RuntimeError("All Chrome instances are full")
+                browser = ChromeTabs(self._launch(), self._isolate_tabs)
+                self._browsers.append(browser)
+                tab = browser.open_tab()
+        self._apply_blocking(tab)
+        return tab
+
+    def _apply_blocking(self, driver) -> None:
+        """Send the blocked URL patterns to a browser or tab."""
+        if self._blocked_urls:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd(
+                    "Network.setBlockedURLs", {"urls": self._blocked_urls}
+                )
+            except Exception as exc:  # pragma: no cover
+                self._logger.warning("Could not enable request blocking: %s", exc)
+
+    def _apply_headers(self, driver, headers: Headers | None, url: Url) -> list[str]:
+        """Send request headers and the user agent to a driver over CDP.
+
+        Headers set with Network.setExtraHTTPHeaders go with every request
+        the page makes, so the ones in _DOCUMENT_ONLY_HEADERS are not sent
+        that way. A Cookie header is set as cookies for the requested site,
+        which Chrome then only sends there. Cookies set for one request are
+        deleted before the next request with other (or no) cookies, so they
+        do not outlive it. Conditional and authorization headers cannot be
+        limited to the page request over CDP and are not sent; a rendered
+        page needs a full response anyway.
+
+        Commands are only sent when they differ from what the driver
+        already has, so repeated requests with the same headers cost
+        nothing extra.
+
+        Returns:
+            Names of the request headers in effect for the next page load
+        """
+        agent = self._user_agent_override or self._default_user_agent
+        extra: dict[str, str] = {}
+        cookies = None
+        applied = []
+        withheld = []
+        for name, value in (headers or {}).items():
+            lower = name.lower()
+            if lower == "user-agent":
+                agent = value
+                applied.append(name)
+            elif lower == "cookie":
+                cookies = (url.base, value)
+                applied.append(name)
+            elif lower in _DOCUMENT_ONLY_HEADERS:
+                withheld.append(name)
+            else:
+                extra[name] = value
+                applied.append(name)
+        if withheld:
+            self._logger.debug(
+                "Not sending %s: Chrome would send them with every resource",
+                ", ".join(withheld),
+            )
+        state = (tuple(extra.items()), agent, cookies)
+        previous = self._applied_headers.get(driver)
+        if previous == state:
+            return applied
+        try:
+            if previous is None:
+                driver.execute_cdp_cmd("Network.enable", {})
+            if previous is None or previous[0] != state[0]:
+                driver.execute_cdp_cmd(
+                    "Network.setExtraHTTPHeaders", {"headers": extra}
+                )
+            # Always on first use: a reused browser may have another override
+            if previous is None or previous[1] != agent:
+                driver.execute_cdp_cmd(
+                    "Network.setUserAgentOverride", {"userAgent": agent}
+                )
+            if previous is not None and previous[2] not in (None, cookies):
+                # Credentials from the last request must not reach this one
+                base, value = previous[2]
+                for cookie in value.split(";"):
+                    name = cookie.strip().partition("=")[0]
+                    if name:
+                        driver.execute_cdp_cmd(
+                            "Network.deleteCookies", {"name": name, "url": base}
+                        )
+            if cookies is not None and (previous is None or previous[2] != cookies):
+                for cookie in cookies[1].split(";"):
+                    name, _, value = cookie.strip().partition("=")
+                    if name:
+                        driver.execute_cdp_cmd(
+                            "Network.setCookie",
+                            {
+                                "name": name,
+                                "value": value,
+                                "url": str(url),
+                                "path": "/",
+                            },
+                        )
+            self._applied_headers[driver] = state
+        except Exception as exc:  # pragma: no cover
+            self._logger.warning("Could not apply request headers: %s", exc)
+            return []
+        return applied
+
+    @property
+    def driver(self):
+        """The first browser of the pool.
+
+        Prefer pool.driver() when making requests, which hands each thread
+        a browser of its own.
+        """
+        return self._driver
+
+    @driver.setter
+    def driver(self, driver):
+        previous = getattr(self, "_driver", None)
+        self._driver = driver
+        if hasattr(self, "pool"):
+            self.pool.replace(previous, driver)
 
     @property
     def user_agent(self) -> str:
@@ -113,16 +414,20 @@ class ChromeTransport(Transport):
         Returns:
             The actual Chrome user agent string
         """
+        if self._user_agent_override:
+            return self._user_agent_override
+
         # If we already know the UA, return it
         if self._user_agent:
             return self._user_agent
 
         # If we haven't made a request yet, get it from the browser
         try:
-            # Navigate to a simple page to avoid external requests
-            self.driver.get("about:blank")
-            # Execute JavaScript to get the user agent
-            self._user_agent = self.driver.execute_script("return navigator.userAgent;")
+            with self.pool.driver() as driver:
+                # Navigate to a simple page to avoid external requests
+                driver.get("about:blank")
+                # Execute JavaScript to get the user agent
+                self._user_agent = driver.execute_script("return navigator.userAgent;")
             return str(self._user_agent)
         except Exception as e:
             # Return a default value if we can't determine it yet
@@ -130,21 +435,18 @@ class ChromeTransport(Transport):
 
     @user_agent.setter
     def user_agent(self, agent: str):
-        """Record requested user agent (not actually applied).
+        """Override the browser's user agent.
 
-        For Chrome, we don't modify the browser's actual User-Agent to
-        maintain browser authenticity and avoid detection. This method
-        logs that a change was requested but doesn't apply it.
+        Applied with Network.setUserAgentOverride before the next page is
+        loaded, so it changes both the request header and
+        navigator.userAgent. A User-Agent header on a request takes
+        precedence for that request.
 
         Args:
-            agent: Requested user agent string
+            agent: User agent string to use
         """
-        # For Chrome, we just record that this was requested but don't modify
-        # the browser's actual User-Agent to maintain authenticity
-        self._logger.debug(
-            "Note: User-Agent override requested to %s but Chrome uses browser's native User-Agent",
-            agent,
-        )
+        self._user_agent_override = agent
+        self._logger.debug("User-Agent override requested: %s", agent)
 
     def get(self, request: HttpRequest) -> HttpResponse:
         """Fetch a page using Chrome/Selenium with full JavaScript rendering.
@@ -164,92 +466,150 @@ class ChromeTransport(Transport):
             IOError: If the navigation or page processing fails
 
         Note:
-            Headers provided in the request are logged but may not be fully
-            applied due to limitations in Selenium's header control
+            Request headers are sent with Network.setExtraHTTPHeaders, so
+            they apply to the page and every resource it loads. Cookie
+            headers become cookies for the requested site; conditional and
+            authorization headers are not sent (see _apply_headers)
         """
         url = "unknown"
 
         try:
-
-            # Extract parameters from request object
             url = str(request.url)
-            timeout = request.timeout
-
-            # Clear logs before request
-            if self.driver.get_log("performance"):
-                pass  # Just accessing to clear buffer
-
-            # Set page load timeout
-            self.driver.set_page_load_timeout(timeout)
-
-            # Navigate to URL
-            self.driver.get(url)
-
-            # Note: While we can't directly set most headers in Selenium,
-            # we can record that headers were requested
-            if request.headers:
-                # Just log that headers were requested but can't be fully applied
-                header_names = ", ".join(request.headers.keys())
-                self._logger.debug(
-                    "Note: Headers requested (%s) but Chrome has limited header support",
-                    header_names,
-                )
+            # The cache is keyed on the URL alone, so a page rendered for
+            # one session must not be stored or served for another
+            cache = self._cache
+            if any(name.lower() in _CREDENTIAL_HEADERS for name in request.headers):
+                cache = None
+            if cache is not None:
+                cached = self._from_cache(request)
+                if cached is not None:
+                    return cached
+            with self.pool.driver(request.timeout) as driver:
+                response = self._render(driver, request)
+            if cache is not None and response.status_code == 200:
+                cache.put(request.url, response)
+            return response
+        except Exception as e:  # pragma: no cover
+            raise IOError(f"Error fetching {url} with Chrome: {e}")
+
+    def _from_cache(self, request: HttpRequest) -> HttpResponse | None:
+        """Get a cached rendering of a page that has not changed since.
 
-            # Update user agent information
-            self._user_agent = self.driver.execute_script("return navigator.userAgent;")
+        Entries older than the cache's max_age are revalidated with a
+        conditional GET; None is returned if the server reports a change,
+        or if the entry has no validators to check it with.
 
-            # Wait for page to load
+        The conditional GET is for the URL and headers of the request
+        itself, which the client has already rate limited and checked
+        against robots.txt. If the page is then rendered, that is a second
+        request, so request.throttle is called first.
+        """
+        cache, revalidator = self._cache, self._revalidator
+        if cache is None or revalidator is None:
+            return None
+        entry = cache.get(request.url)
+        if entry is None:
+            return None
+        if not cache.is_fresh(entry):
+            validators = cache.validators(entry)
+            if not validators:
+                return None
+            check = HttpRequest(
+                url=request.url, headers=request.headers.merged(validators)
+            )
+            check.timeout = request.timeout
+            status_code = None
             try:
-                WebDriverWait(self.driver, timeout or Config().http.timeout).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-            except Exception as exc:  # pragma: no cover
-                self._logger.warning(
-                    "Page load wait timed out (continuing anyway): %s", exc
-                )
+                status_code = revalidator.get(check).status_code
+            except IOError as exc:
+                self._logger.debug("Could not revalidate %s: %s", request.url, exc)
+            if status_code != 304:
+                if status_code is not None:
+                    self._logger.debug("%s changed (HTTP %s)", request.url, status_code)
+                # The check was a request of its own; rendering is another
+                if request.throttle is not None:
+                    request.throttle()
+                return None
+            cache.refresh(request.url)
+        self._logger.debug("Serving %s from the render cache", request.url)
+        return RenderCache.to_response(entry, request)
 
-            # Additional wait for dynamic content if specified
-            if self._wait_time:
-                sleep(self._wait_time)
+    def _render(self, driver, request: HttpRequest) -> HttpResponse:
+        """Load and process a page on a checked-out driver."""
+        # Extract parameters from request object
+        url = str(request.url)
+        timeout = request.timeout
 
-            # Get page source and final URL
-            page_source = self.driver.page_source
-            final_url = self.driver.current_url
+        # The log is drained after every page by _get_response_information,
+        # so there is no need to fetch and discard it first
 
-            # Extract network information from performance logs
-            status_code, response_headers, mime_type = self._get_response_information(
-                url, final_url
+        # Set page load timeout
+        driver.set_page_load_timeout(timeout)
+
+        # Send the request headers before navigating so the server sees them
+        applied = self._apply_headers(driver, request.headers, request.url)
+        if applied:
+            self._logger.debug(
+                "Headers requested (%s), sent over CDP", ", ".join(applied)
             )
 
-            # Convert page source to bytes for content
-            content_bytes = page_source.encode("utf-8")
-
-            # Handle XML content if needed
-            if mime_type and ("xml" in mime_type or url.lower().endswith(".xml")):
-                # Process XML content when rendered as HTML
-                content_bytes = self._extract_xml_content(page_source)
-
-            # Create response headers
-            headers = {
-                "URL": final_url,
-                "Content-Type": mime_type or "text/html",
-                **response_headers,
-            }
-
-            # Create the response with text properly decoded from content
-            response = HttpResponse(
-                url=Url(final_url) or request.url,
-                request=request,
-                status_code=status_code or 200,
-                text=content_bytes.decode("utf-8", errors="replace"),
-                headers=Headers(headers),
-                content=content_bytes,
+        # Navigate to URL
+        driver.get(url)
+
+        # Update user agent information
+        self._user_agent = driver.execute_script("return navigator.userAgent;")
+
+        # Wait for page to load
+        try:
+            WebDriverWait(driver, timeout or self._timeout).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+        except Exception as exc:  # pragma: no cover
+            self._logger.warning(
+                "Page load wait timed out (continuing anyway): %s", exc
             )
 
-            return response
+        # Wait for dynamic content, up to wait_time. Strategies that watch
+        # the network consume performance log entries, so keep them
+        log_entries: list[dict[str, Any]] = []
+        if self._wait_time:
+            log_entries = self._readiness.wait(driver, self._wait_time, sleep)
 
-        except Exception as e:  # pragma: no cover
-            raise IOError(f"Error fetching {url} with Chrome: {e}")
+        # Get page source and final URL
+        page_source = driver.page_source
+        final_url = driver.current_url
+
+        # Extract network information from performance logs
+        status_code, response_headers, mime_type = self._get_response_information(
+            url, final_url, driver, log_entries
+        )
+
+        # Convert page source to bytes for content
+        content_bytes = page_source.encode("utf-8")
+
+        # Handle XML content if needed
+        if mime_type and ("xml" in mime_type or url.lower().endswith(".xml")):
+            # Process XML content when rendered as HTML
+            content_bytes = self._extract_xml_content(page_source)
+
+        # Create response headers
+        headers = {
+            "URL": final_url,
+            "Content-Type": mime_type or "text/html",
+            **response_headers,
+        }
+
+        # Create the response with text properly decoded from content
+        response = HttpResponse(
+            url=Url(final_url) or request.url,
+            request=request,
+            status_code=status_code or 200,
+            text=content_bytes.decode("utf-8", errors="replace"),
+            headers=Headers(headers),
+            content=content_bytes,
+        )
+
+        return response
 
     def _extract_xml_content(self, content_str: str) -> bytes:
 
@@ -286,9 +646,12 @@ class ChromeTransport(Transport):
     def _extract_response_info_from_log_entry(
         self, entry: dict[str, Any]
     ) -> tuple[dict[str, Any], dict[str, Any]] | None:
-
+        message = entry.get("message", "")
+        # Most events are not responses; skip them before decoding any JSON
+        if '"Network.responseReceived"' not in message:
+            return None
         try:
-            log_data = loads(entry["message"])["message"]
+            log_data = loads(message)["message"]
             if log_data["method"] != "Network.responseReceived":
                 return None
 
@@ -319,16 +682,29 @@ class ChromeTransport(Transport):
             return None, {}, None  # Return 3-tuple with default values
 
     def _get_response_information(
-        self, requested_url: str, final_url: str
+        self,
+        requested_url: str,
+        final_url: str,
+        driver=None,
+        earlier_entries: list[dict[str, Any]] | None = None,
     ) -> tuple[int | None, dict[str, str], str | None]:
         # Default values if we can't find anything
         default_status = 200  # Most browsers show content even without status
         default_headers: dict[str, str] = {}
         default_mime = "text/html"  # Assume HTML if not specified
         try:
-            logs = self.driver.get_log("performance")
+            logs = (driver or self.driver).get_log("performance")
+            if earlier_entries:
+                logs = earlier_entries + logs
             document_response = None
+            urls = (requested_url, final_url)
             for entry in logs:
+                # Once there is a fallback only an exact URL match can
+                # improve on it, so skip entries that cannot contain one
+                if document_response is not None:
+                    message = entry.get("message", "")
+                    if requested_url not in message and final_url not in message:
+                        continue
                 result = self._extract_response_info_from_log_entry(entry)
                 if not result:
                     # Skip non-response entries
@@ -338,7 +714,7 @@ class ChromeTransport(Transport):
                 url = response.get("url", "")
 
                 # First priority: exact URL match
-                if url in (requested_url, final_url):
+                if url in urls:
                     return self._extract_response_info_from_response(response)
 
                 # Second priority: document response (save for fallback)
@@ -356,15 +732,51 @@ class ChromeTransport(Transport):
             self._logger.warning("Error extracting network info: %s", exc)
             return default_status, default_headers, default_mime
 
+    def close(self) -> None:
+        """Stop using this transport's browsers.
+
+        Idle browsers go to the process-wide registry for reuse (or are
+        quit if reuse_drivers is False); browsers still rendering a page
+        are quit when it finishes. Closing twice does nothing.
+        """
+        self._shutdown(self._reuse)
+        if self._revalidator is not None:
+            self._revalidator.close()
+
+    def _shutdown(self, reuse: bool) -> None:
+        if getattr(self, "_closed", True):
+            return
+        self._closed = True
+        release = self._release if reuse else None
+        if self._tabs > 1:
+            # Closes idle tabs now and checked-out ones when they come back
+            self.pool.close()
+            with self._browsers_lock:
+                browsers, self._browsers = self._browsers, []
+            for browser in browsers:
+                # A browser with a tab still rendering quits after it
+                if not browser.retire():
+                    continue
+                if release is not None:
+                    release(browser.driver)
+                else:
+                    browser.quit()
+        else:
+            self.pool.close(release)
+
+    def _release(self, driver) -> None:
+        registry.release(self._registry_key, driver)
+        self._applied_headers.pop(driver, None)
+
     def __del__(self):
-        """Close browser when transport is garbage collected.
+        """Quit browsers when transport is garbage collected.
 
-        Ensures proper cleanup of Chrome processes when the transport
-        is no longer needed to avoid leaving orphaned browser instances.
+        A fallback for transports that were never closed, so no orphaned
+        browser instances are left behind. Browsers are quit rather than
+        reused, as garbage collection may happen at any time.
         """
         try:
-            if hasattr(self, "driver") and self.driver:
-                self.driver.quit()
+            self._shutdown(reuse=False)
         except Exception as exc:  # pragma: no cover
             # Use the logger if it exists, otherwise we can't log during cleanup
             if hasattr(self, "_logger"):
@@ -1,11 +1,15 @@
+from contextlib import nullcontext
+from copy import copy
 from random import random
+from threading import BoundedSemaphore
 from time import sleep, time
 
 from ethicrawl.client import Client
+from ethicrawl.config import Config, ConfigSnapshot
+from ethicrawl.config.domain_config import resolve_overrides
 from ethicrawl.context import Context
 from ethicrawl.core import Headers, Resource, Url
 
-from .chrome_transport import ChromeTransport
 from .http_request import HttpRequest
 from .http_response import HttpResponse
 from .requests_transport import RequestsTransport
@@ -15,7 +19,8 @@ class HttpClient(Client):
     """HTTP client implementation with configurable transports and rate limiting.
 
     This client provides a flexible HTTP interface with the following features:
-    - Configurable backend transport (Requests or Selenium Chrome)
+    - Configurable backend transport (Requests, Selenium Chrome, or a
+      hybrid that only uses Chrome for pages that need it)
     - Built-in rate limiting with jitter to avoid detection
     - Header management with User-Agent control
     - Automatic retry with exponential backoff
@@ -79,6 +84,9 @@ class HttpClient(Client):
         if transport:
             self.transport = transport
         elif chrome_params:
+            # Imported here so Selenium only loads when Chrome is used
+            from .chrome_transport import ChromeTransport
+
             self.transport = ChromeTransport(context, **chrome_params)
         # elif Gecko TODO: for expansion
         else:
@@ -93,11 +101,89 @@ class HttpClient(Client):
 
         self.headers = Headers(headers or {})
 
+        # Read request defaults from a snapshot rather than Config() per request
+        config = Config()
+        self._config = config.snapshot()
+        self._domain: str | None = None
+        config.subscribe(self.refresh_config)
+
         # Rate limiting parameters
         self.min_interval = 1.0 / rate_limit if rate_limit > 0 else 0
         self.jitter = jitter
         # Initialize last_request_time to None to indicate no previous requests
         self.last_request_time = None
+        # Limits requests in flight at once, when a domain override sets one
+        self._slots: BoundedSemaphore | None = None
+
+    def refresh_config(self, snapshot: ConfigSnapshot | None = None) -> None:
+        """Switch to a new configuration snapshot for subsequent requests.
+
+        Called automatically when Config publishes changes through update()
+        or refresh().
+
+        Args:
+            snapshot: Snapshot to use (default: the current configuration)
+        """
+        snapshot = snapshot if snapshot is not None else Config().snapshot()
+        if self._domain is not None:
+            snapshot = snapshot.for_domain(self._domain)
+        self._config = snapshot
+
+    def for_domain(self, base: str, config: ConfigSnapshot) -> "HttpClient":
+        """Get a client with the overrides for one domain applied.
+
+        Returns this client when no overrides match. Otherwise returns a
+        copy sharing this client's transport and headers, with its own
+        rate limiting state and a config snapshot carrying the domain's
+        timeout and retry settings.
+
+        A concurrency override (``chrome`` for a ChromeTransport,
+        ``requests`` for other transports) limits how many requests the
+        copy has in flight at once. It applies only while concurrency is
+        enabled, and cannot go beyond what the shared transport allows,
+        such as the size of the Chrome pool.
+
+        Args:
+            base: Url.base of the domain being bound
+            config: ConfigSnapshot taken at bind time
+
+        Returns:
+            HttpClient to use for the domain
+        """
+        settings = resolve_overrides(config.domains.overrides, base)
+        if not settings:
+            return self
+        client = copy(self)
+        client._domain = base
+        client._config = config.for_domain(base)
+        client.last_request_time = None
+        if "rate_limit" in settings:
+            client.min_interval = 1.0 / settings["rate_limit"]
+        if "jitter" in settings:
+            client.jitter = settings["jitter"]
+        if "timeout" in settings:
+            client.timeout = settings["timeout"]
+        setting = getattr(self.transport, "concurrency_setting", "requests")
+        if setting in settings and client._config.concurrency.enabled:
+            limit = getattr(client._config.concurrency, setting)
+            client._slots = BoundedSemaphore(max(limit, 1))
+        Config().subscribe(client.refresh_config)
+        self._logger.debug("Applied overrides for %s: %s", base, settings)
+        return client
+
+    def close(self) -> None:
+        """Close the transport, quitting or releasing any browsers.
+
+        Clients returned by for_domain() share this client's transport, so
+        closing any of them closes it for all. HttpClient can also be used
+        as a context manager:
+
+        Example:
+            >>> with HttpClient().with_chrome() as client:
+            ...     response = client.get(Resource("https://example.com"))
+        """
+        Config().unsubscribe(self.refresh_config)
+        self.transport.close()
 
     @property
     def user_agent(self) -> str:
@@ -153,6 +239,52 @@ class HttpClient(Client):
             jitter=jitter,
         )
 
+    def with_hybrid(
+        self,
+        xpath=None,
+        predicate=None,
+        patterns=None,
+        chrome_params=None,
+    ) -> "HttpClient":
+        """Create a new HttpClient that renders pages in Chrome only when needed.
+
+        Pages are fetched with requests first and fetched again with Chrome
+        when they look incomplete; see HybridTransport for the checks.
+
+        Args:
+            xpath (str, optional): XPath expression every complete page matches
+            predicate (callable, optional): Returns True for responses that
+                need rendering
+            patterns (dict, optional): URL or hostname patterns mapped to
+                whether matching pages are always (True) or never (False)
+                rendered
+            chrome_params (dict, optional): Parameters for ChromeTransport
+
+        Returns:
+            HttpClient: A new client instance using a HybridTransport
+
+        Example:
+            >>> client = HttpClient().with_hybrid(xpath="//main")
+            >>> response = client.get(Resource("https://mostly-static.com"))
+        """
+        from .hybrid_transport import HybridTransport
+
+        transport = HybridTransport(
+            self._context,
+            chrome_params=chrome_params,
+            xpath=xpath,
+            predicate=predicate,
+            patterns=patterns,
+        )
+        return HttpClient(
+            context=self._context,
+            transport=transport,
+            timeout=self.timeout,
+            rate_limit=1.0 / self.min_interval if self.min_interval else 0,
+            jitter=self.jitter,
+            headers=self.headers.copy(),
+        )
+
     def _apply_rate_limiting(self):
         # If this is the first request, no need to apply rate limiting
         if self.last_request_time is None:
@@ -175,6 +307,38 @@ class HttpClient(Client):
         # Update the last request time
         self.last_request_time = time()
 
+    def _send(self, request: HttpRequest) -> HttpResponse:
+        """Send a request, retrying if the transport fails.
+
+        Retries are off unless http.max_retries is set in this client's
+        config snapshot (including domain overrides), and wait
+        http.retry_delay, doubling after each failure. Only transport errors
+        (IOError, which includes requests' exceptions) are retried; other
+        exceptions and responses, whatever their status code, are not.
+        """
+        http = self._config.http
+        attempt = 0
+        while True:
+            # Apply rate limiting before making request
+            self._apply_rate_limiting()
+            try:
+                with self._slots if self._slots is not None else nullcontext():
+                    return self.transport.get(request)
+            except IOError as exc:
+                if attempt >= http.max_retries:
+                    raise
+                delay = http.retry_delay * 2**attempt
+                attempt += 1
+                self._logger.warning(
+                    "Request for %s failed (%s), retry %d of %d in %.2fs",
+                    request.url,
+                    exc,
+                    attempt,
+                    http.max_retries,
+                    delay,
+                )
+                sleep(delay)
+
     def get(
         self,
         resource: Resource,
@@ -198,7 +362,7 @@ class HttpClient(Client):
 
         Raises:
             TypeError: If resource is not a Resource instance
-            IOError: If the HTTP request fails for any reason
+            IOError: If the HTTP request still fails after any retries
 
         Example:
             >>> client = HttpClient()
@@ -211,27 +375,20 @@ class HttpClient(Client):
             raise TypeError(f"Expected Resource object, got {type(resource).__name__}")
 
         try:
-            # Apply rate limiting before making request
-            self._apply_rate_limiting()
-
             self._logger.debug("fetching  %s", resource.url)
 
-            request = HttpRequest(resource.url)
+            request = HttpRequest(resource.url, config=self._config)
+            # Transports making more than one request wait their turn too
+            request.throttle = self._apply_rate_limiting
 
             if timeout is not None:
                 request.timeout = timeout
 
-            request_headers = Headers(self.headers)
-
-            # Add request-specific headers, which will override client headers
-            if headers:
-                for header, value in headers.items():
-                    request_headers[header] = value
-
-            # Set the combined headers on the request
-            request.headers = request_headers
+            # Request-specific headers override client headers; without any,
+            # the request shares the client's headers until either changes
+            request.headers = self.headers.merged(headers)
 
-            response = self.transport.get(request)
+            response = self._send(request)
 
             # After getting the response
             if 200 <= response.status_code < 300:
@@ -258,7 +415,7 @@ class HttpClient(Client):
             self.last_request_time = time()
 
             return response
-        except Exception as exc:  # pragma: no cover
+        except Exception as exc:
             # Log error before re-raising
             self._logger.error("Request failed for %s: %s", resource.url, exc)
             # Re-raise with clear error
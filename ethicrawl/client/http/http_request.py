@@ -1,6 +1,7 @@
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
+from typing import Callable, cast
 
-from ethicrawl.config import Config, HttpConfig
+from ethicrawl.config import Config, ConfigSnapshot, HttpConfig
 from ethicrawl.core import Headers
 from ethicrawl.client import Request
 
@@ -11,13 +12,20 @@ class HttpRequest(Request):
 
     This class extends the base Request with HTTP-specific functionality,
     including configurable timeout and header handling. It automatically applies
-    default headers from the global configuration while allowing custom headers
-    to take precedence.
+    the default timeout and headers from the global configuration while allowing
+    custom values to take precedence.
+
+    Defaults are read from a ConfigSnapshot: the one passed as ``config`` (as
+    HttpClient does with the snapshot it took at creation), or otherwise the
+    current Config().snapshot().
 
     Attributes:
         url: The target URL (inherited from Request)
         headers: HTTP headers to send with the request
-        _timeout: Request timeout in seconds
+        _timeout: Request timeout in seconds (default: config http.timeout)
+        throttle: Called by a transport before any further request it makes
+            to the server for this one, so the client's rate limit still
+            holds (HttpClient sets this to its rate limiter)
 
     Example:
         >>> from ethicrawl.client.http import HttpRequest
@@ -27,8 +35,10 @@ class HttpRequest(Request):
         >>> req.timeout = 15.0
     """
 
-    _timeout: float = Config().http.timeout or 30.0
+    _timeout: float | None = None
     headers: Headers = field(default_factory=Headers)
+    throttle: Callable[[], None] | None = field(default=None, repr=False, compare=False)
+    config: InitVar[ConfigSnapshot | None] = None
 
     @property
     def timeout(self) -> float:
@@ -37,7 +47,8 @@ class HttpRequest(Request):
         Returns:
             The timeout value in seconds
         """
-        return self._timeout
+        # Never None after __post_init__, which falls back to the config
+        return cast(float, self._timeout)
 
     @timeout.setter
     def timeout(self, value: float):
@@ -49,25 +60,30 @@ class HttpRequest(Request):
         Raises:
             ValueError: If the timeout is negative or otherwise invalid
         """
-        temp_config = HttpConfig()
         # This will raise the appropriate exceptions if invalid
-        temp_config.timeout = value
-        # If we get here, the value passed validation
-        self._timeout = float(value)
+        self._timeout = HttpConfig._validate_timeout(value)
 
-    def __post_init__(self):
+    def __post_init__(self, config: ConfigSnapshot | None = None):
         """Initialize and validate the request after creation.
 
-        Ensures headers are a proper Headers instance and applies
-        default headers from configuration if not already present.
+        Ensures headers are a proper Headers instance and applies the
+        default timeout and headers from configuration if not already set.
+
+        Args:
+            config: Configuration snapshot to take defaults from
         """
         super().__post_init__()
+        if config is None:
+            config = Config().snapshot()
+
+        if self._timeout is None:
+            self._timeout = config.http.timeout
 
         # Ensure self.headers is a Headers instance
         if not isinstance(self.headers, Headers):
             self.headers = Headers(self.headers)
 
         # Apply Config headers, NOT overriding existing ones
-        for header, value in Config().http.headers.items():
-            if header not in self.headers:
-                self.headers[header] = value
+        defaults = config.http.headers
+        if defaults:
+            self.headers = defaults.merged(self.headers)
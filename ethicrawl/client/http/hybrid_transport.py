@@ -0,0 +1,245 @@
+from fnmatch import fnmatchcase
+from threading import Lock
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, cast
+
+from lxml import etree, html
+
+from ethicrawl.client import Transport
+from ethicrawl.context import Context
+from ethicrawl.core import Url
+
+from .http_request import HttpRequest
+from .http_response import HttpResponse
+from .requests_transport import RequestsTransport
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .chrome_transport import ChromeTransport
+
+# Phrases in <noscript> content that mean the page is built by scripts
+NOSCRIPT_MARKERS: tuple[str, ...] = (
+    "enable javascript",
+    "javascript is required",
+    "javascript is disabled",
+    "requires javascript",
+    "javascript to run this app",
+    "turn on javascript",
+)
+
+# Elements whose text is not visible page content
+_INVISIBLE = ("script", "style", "noscript", "template")
+
+
+class HybridTransport(Transport):
+    """Fetches with requests, escalating to Chrome only when needed.
+
+    Each page is first fetched with a RequestsTransport. If the response
+    looks like it needs a browser to render, it is fetched again with a
+    ChromeTransport, which is only started when first needed. A response
+    needs rendering when any of these hold:
+
+    - It is an HTML page whose body has no visible text
+    - Its <noscript> content asks for JavaScript (see NOSCRIPT_MARKERS)
+    - It has no element matching the xpath, when one is given
+    - The predicate, when given, returns True for it
+
+    Domains found to need rendering are remembered, and later pages from
+    them go straight to Chrome. Patterns can also fix the choice up front.
+
+    Attributes:
+        requests: Transport used for the first attempt
+        patterns: Mapping of pattern to True (always render) or False
+            (never render). Patterns containing "://" are matched against
+            the full URL, others against the hostname; '*' matches any
+            characters and the first matching pattern wins.
+
+    Example:
+        >>> from ethicrawl.client.http import HttpClient
+        >>> from ethicrawl.client.http.hybrid_transport import HybridTransport
+        >>> transport = HybridTransport(
+        ...     context,
+        ...     xpath="//div[@class='results']",
+        ...     patterns={"https://example.com/app/*": True},
+        ... )
+        >>> client = HttpClient(context, transport=transport)
+    """
+
+    def __init__(
+        self,
+        context: Context,
+        chrome_params: dict | None = None,
+        xpath: str | None = None,
+        predicate: Callable[[HttpResponse], bool] | None = None,
+        patterns: Mapping[str, bool] | None = None,
+        markers: Iterable[str] = NOSCRIPT_MARKERS,
+    ):
+        """Initialize the hybrid transport.
+
+        Args:
+            context: The context to use for logging and resource resolution
+            chrome_params: Parameters for the ChromeTransport, if started
+            xpath: XPath expression a fully rendered page always matches
+            predicate: Function returning True for responses that need
+                rendering
+            patterns: Mapping of URL or hostname pattern to whether
+                matching pages are rendered
+            markers: Lowercase phrases in <noscript> content that call for
+                rendering
+
+        Raises:
+            TypeError: If predicate is not callable, or a pattern decision
+                is not a bool
+            ValueError: If xpath is not a valid XPath expression
+        """
+        if predicate is not None and not callable(predicate):
+            raise TypeError(
+                f"predicate must be callable, got {type(predicate).__name__}"
+            )
+        self._context = context
+        self._logger = self._context.logger("client.hybrid")
+        self.requests = RequestsTransport(context)
+        self._chrome: "ChromeTransport | None" = None
+        self._chrome_params = dict(chrome_params or {})
+        self._chrome_lock = Lock()
+        self._user_agent: str | None = None
+        try:
+            self._xpath = etree.XPath(xpath) if xpath is not None else None
+        except etree.XPathSyntaxError as exc:
+            raise ValueError(f"Invalid xpath: {xpath}") from exc
+        self._predicate = predicate
+        self._markers = tuple(marker.lower() for marker in markers)
+        self.patterns: dict[str, bool] = {}
+        for pattern, render in (patterns or {}).items():
+            if not isinstance(render, bool):
+                raise TypeError(
+                    f"Expected bool for pattern {pattern}, got {type(render).__name__}"
+                )
+            self.patterns[pattern] = render
+        # Url.base of each domain found to need rendering
+        self._rendered: set[str] = set()
+
+    @property
+    def chrome(self) -> "ChromeTransport":
+        """The ChromeTransport, started on first use."""
+        with self._chrome_lock:
+            if self._chrome is None:
+                # Imported here so Selenium only loads if a page needs it
+                from .chrome_transport import ChromeTransport
+
+                self._logger.info("Starting Chrome for pages that need rendering")
+                self._chrome = ChromeTransport(self._context, **self._chrome_params)
+                if self._user_agent is not None:
+                    self._chrome.user_agent = self._user_agent
+            return self._chrome
+
+    def close(self) -> None:
+        """Close the requests transport, and Chrome if it was started."""
+        self.requests.close()
+        with self._chrome_lock:
+            chrome, self._chrome = self._chrome, None
+        if chrome is not None:
+            chrome.close()
+
+    @property
+    def user_agent(self) -> str:
+        """Get the user agent of the requests transport."""
+        return self.requests.user_agent
+
+    @user_agent.setter
+    def user_agent(self, agent: str):
+        """Set the user agent on both transports.
+
+        Args:
+            agent: User agent string to use for requests
+        """
+        self.requests.user_agent = agent
+        with self._chrome_lock:
+            self._user_agent = agent
+            if self._chrome is not None:
+                self._chrome.user_agent = agent
+
+    def decision(self, url: Url) -> bool | None:
+        """Get the known rendering choice for a URL.
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            True to render, False to never render, or None when the
+            response has to be checked
+        """
+        hostname = url.hostname.lower()
+        for pattern, render in self.patterns.items():
+            target = str(url) if "://" in pattern else hostname
+            if fnmatchcase(target, pattern):
+                return render
+        return True if url.base in self._rendered else None
+
+    def needs_rendering(self, response: HttpResponse) -> bool:
+        """Check whether a response fetched without a browser is incomplete.
+
+        Args:
+            response: Response from the requests transport
+
+        Returns:
+            True if the page should be fetched again with Chrome
+        """
+        if self._predicate is not None and self._predicate(response):
+            return True
+        if not 200 <= response.status_code < 300:
+            return False  # A browser would get the same error
+        content_type = (response.headers.get("Content-Type") or "").lower()
+        if content_type and "html" not in content_type:
+            return False
+        if not response.text.strip():
+            return True
+        try:
+            document = html.document_fromstring(response.text)
+        except (etree.ParserError, ValueError):
+            return False
+        if self._xpath is not None and not self._xpath(document):
+            return True
+        # The HTML parser only creates HtmlElements, though lxml is typed
+        # as returning plain elements
+        noscript = " ".join(
+            cast(html.HtmlElement, element).text_content()
+            for element in document.iter("noscript")
+        ).lower()
+        if any(marker in noscript for marker in self._markers):
+            return True
+        body = cast("html.HtmlElement | None", document.find("body"))
+        if body is None:
+            return False
+        invisible = cast("list[html.HtmlElement]", list(body.iter(*_INVISIBLE)))
+        for element in invisible:
+            element.drop_tree()
+        return not body.text_content().strip()
+
+    def get(self, request: HttpRequest) -> HttpResponse:
+        """Fetch a page, rendering it in Chrome if it needs a browser.
+
+        A page fetched with requests and then escalated to Chrome is two
+        requests, so request.throttle is called before the second.
+
+        Args:
+            request: The HttpRequest object containing URL, headers, etc.
+
+        Returns:
+            HttpResponse from whichever transport produced the page
+        """
+        url = request.url
+        render = self.decision(url)
+        if render:
+            return self.chrome.get(request)
+
+        response = self.requests.get(request)
+        if render is False or not self.needs_rendering(response):
+            return response
+
+        self._logger.info(
+            "Page needs rendering, using Chrome for %s from now on", url.base
+        )
+        self._rendered.add(url.base)
+        # The client rate limited the requests fetch; Chrome makes another
+        if request.throttle is not None:
+            request.throttle()
+        return self.chrome.get(request)
@@ -0,0 +1,230 @@
+import json
+import os
+from collections import OrderedDict
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import time
+from typing import Any
+
+from ethicrawl.core import Headers, Url
+
+from .http_request import HttpRequest
+from .http_response import HttpResponse
+
+_SUFFIX = ".json"
+
+
+class RenderCache:
+    """Disk cache of pages rendered by ChromeTransport.
+
+    Entries are keyed on the canonical form of the requested URL (see
+    Url.canonical()) and stored one JSON file each in a directory. When
+    the files together exceed max_bytes, the least recently used entries
+    are removed. The directory can be shared between runs, which is what
+    makes repeated crawls cheap.
+
+    An entry younger than max_age seconds is served as it is. Older ones
+    are revalidated with a conditional GET using the ETag and
+    Last-Modified headers of the cached response; the page is rendered
+    again only if the server reports a change.
+
+    Set-Cookie headers are not stored, so a cached page never hands out
+    the session of the crawl that rendered it.
+
+    Attributes:
+        directory: Directory holding the cache files
+        max_bytes: Largest total size of the cache files
+        max_age: Seconds an entry is served without revalidation
+
+    Example:
+        >>> cache = RenderCache("~/.cache/ethicrawl", max_bytes=512 * 2**20)
+        >>> transport = ChromeTransport(context, cache=cache)
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_age: float = 0.0,
+    ) -> None:
+        """Open a cache directory, creating it if needed.
+
+        Args:
+            directory: Directory holding the cache files
+            max_bytes: Largest total size of the cache files
+            max_age: Seconds an entry is served without revalidation
+
+        Raises:
+            TypeError: If an argument has the wrong type
+            ValueError: If max_bytes is less than 1 or max_age is negative
+        """
+        if not isinstance(directory, (str, Path)):
+            raise TypeError(
+                f"directory must be a string or Path, got {type(directory).__name__}"
+            )
+        if isinstance(max_bytes, bool) or not isinstance(max_bytes, int):
+            raise TypeError(
+                f"max_bytes must be an integer, got {type(max_bytes).__name__}"
+            )
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        if isinstance(max_age, bool) or not isinstance(max_age, (int, float)):
+            raise TypeError(f"max_age must be a number, got {type(max_age).__name__}")
+        if max_age < 0:
+            raise ValueError("max_age cannot be negative")
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = float(max_age)
+        self._lock = Lock()
+        # File name -> size, least recently used first
+        self._index: OrderedDict[str, int] = OrderedDict()
+        files = sorted(
+            (path.stat().st_mtime, path.name, path.stat().st_size)
+            for path in self.directory.glob(f"*{_SUFFIX}")
+        )
+        for _, name, size in files:
+            self._index[name] = size
+        self._size = sum(self._index.values())
+
+    @property
+    def size(self) -> int:
+        """Total size of the cache files in bytes."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @staticmethod
+    def _name(url: Url) -> str:
+        return sha256(str(url.canonical()).encode("utf-8")).hexdigest() + _SUFFIX
+
+    def get(self, url: Url) -> dict[str, Any] | None:
+        """Get the cached entry for a URL, marking it recently used.
+
+        Args:
+            url: Requested URL
+
+        Returns:
+            The entry, or None if the URL is not cached
+        """
+        name = self._name(url)
+        path = self.directory / name
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, ValueError):
+            self._forget(name)
+            return None
+        with self._lock:
+            if name in self._index:
+                self._index.move_to_end(name)
+        return entry
+
+    def put(self, url: Url, response: HttpResponse) -> None:
+        """Store a rendered response, evicting old entries to make room.
+
+        Args:
+            url: Requested URL
+            response: Response rendered for it
+        """
+        entry = {
+            "url": str(url.canonical()),
+            "final_url": str(response.url),
+            "status_code": response.status_code,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() != "set-cookie"
+            },
+            "text": response.text,
+            "stored_at": time(),
+        }
+        data = json.dumps(entry).encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        self._write(self._name(url), data)
+
+    def refresh(self, url: Url) -> None:
+        """Mark an entry as just validated, restarting its max_age."""
+        entry = self.get(url)
+        if entry is None:
+            return
+        entry["stored_at"] = time()
+        self._write(self._name(url), json.dumps(entry).encode("utf-8"))
+
+    def _write(self, name: str, data: bytes) -> None:
+        """Write an entry file and account for it, evicting old entries."""
+        # Write then rename, so readers never see a partial file
+        try:
+            with NamedTemporaryFile(
+                dir=self.directory, suffix=".tmp", delete=False
+            ) as f:
+                f.write(data)
+            os.replace(f.name, self.directory / name)
+        except OSError:  # pragma: no cover
+            self._forget(name)
+            return
+        with self._lock:
+            self._size += len(data) - self._index.pop(name, 0)
+            self._index[name] = len(data)
+            evicted = []
+            while self._size > self.max_bytes and self._index:
+                old, size = self._index.popitem(last=False)
+                self._size -= size
+                evicted.append(old)
+        for old in evicted:
+            (self.directory / old).unlink(missing_ok=True)
+
+    def remove(self, url: Url) -> None:
+        """Remove the entry for a URL, if any."""
+        name = self._name(url)
+        (self.directory / name).unlink(missing_ok=True)
+        self._forget(name)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            names, self._index = list(self._index), OrderedDict()
+            self._size = 0
+        for name in names:
+            (self.directory / name).unlink(missing_ok=True)
+
+    def _forget(self, name: str) -> None:
+        with self._lock:
+            self._size -= self._index.pop(name, 0)
+
+    def is_fresh(self, entry: dict[str, Any]) -> bool:
+        """Check whether an entry can be served without revalidation."""
+        return time() - entry.get("stored_at", 0.0) < self.max_age
+
+    @staticmethod
+    def validators(entry: dict[str, Any]) -> Headers:
+        """Get the conditional request headers for revalidating an entry.
+
+        Returns:
+            If-None-Match and/or If-Modified-Since headers (empty if the
+            cached response had neither ETag nor Last-Modified)
+        """
+        cached = Headers(entry.get("headers", {}))
+        validators = Headers()
+        if cached.get("ETag"):
+            validators["If-None-Match"] = cached["ETag"]
+        if cached.get("Last-Modified"):
+            validators["If-Modified-Since"] = cached["Last-Modified"]
+        return validators
+
+    @staticmethod
+    def to_response(entry: dict[str, Any], request: HttpRequest) -> HttpResponse:
+        """Rebuild the cached response for a request."""
+        text = entry["text"]
+        return HttpResponse(
+            url=Url(entry["final_url"]),
+            request=request,
+            status_code=entry["status_code"],
+            text=text,
+            headers=Headers(entry["headers"]),
+            content=text.encode("utf-8"),
+        )
@@ -1,7 +1,7 @@
 import requests
 
 from ethicrawl.client.transport import Transport
-from ethicrawl.config import Config
+from ethicrawl.config import Config, ConfigSnapshot
 from ethicrawl.context import Context
 from ethicrawl.core import Headers, Url
 
@@ -18,7 +18,9 @@ class RequestsTransport(Transport):
     Ethicrawl's HttpResponse objects.
 
     The transport automatically applies configuration settings from the global
-    Config object, including user agent, proxies, and default headers.
+    Config object, including user agent, proxies, and default headers. Settings
+    are read from a snapshot taken when the transport is created and refreshed
+    when Config publishes changes (see Config.refresh()).
 
     Attributes:
         session (requests.Session): The underlying requests Session object
@@ -48,8 +50,31 @@ class RequestsTransport(Transport):
         self._context = context
         self._logger = self._context.logger("client.requests")
         self.session = requests.Session()
-        self._default_user_agent = Config().http.user_agent
+        config = Config()
+        self.refresh_config(config.snapshot())
+        self._default_user_agent = self._config.http.user_agent
         self.session.headers.update({"User-Agent": self._default_user_agent})
+        config.subscribe(self.refresh_config)
+
+    def refresh_config(self, snapshot: ConfigSnapshot | None = None) -> None:
+        """Switch to a new configuration snapshot.
+
+        Args:
+            snapshot: Snapshot to use (default: the current configuration)
+        """
+        self._config = snapshot if snapshot is not None else Config().snapshot()
+        proxies = self._config.http.proxies
+        # Built once per snapshot rather than on every request
+        self._proxies = {
+            scheme: str(proxy)
+            for scheme, proxy in (("http", proxies.http), ("https", proxies.https))
+            if proxy
+        }
+
+    def close(self) -> None:
+        """Close the session's pooled connections."""
+        Config().unsubscribe(self.refresh_config)
+        self.session.close()
 
     @property
     def user_agent(self) -> str:
@@ -98,18 +123,11 @@ class RequestsTransport(Transport):
 
             timeout = request.timeout
 
-            merged_headers = Headers(self.session.headers)
-
-            # Merge in request-specific headers (without modifying session)
-            if request.headers:
-                merged_headers.update(request.headers)
-
-            proxies = {}
-            if Config().http.proxies.http:
-                proxies["http"] = str(Config().http.proxies.http)
-            if Config().http.proxies.https:
-                proxies["https"] = str(Config().http.proxies.https)
+            # requests layers these over the session headers itself, so
+            # there is no need to build a merged copy here
+            merged_headers = request.headers
 
+            proxies = self._proxies
             if proxies:
                 response = self.session.get(
                     url, timeout=timeout, headers=merged_headers, proxies=proxies
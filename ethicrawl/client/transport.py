@@ -47,6 +47,20 @@ class Transport(ABC):
         """
         raise NotImplementedError("This transport does not support HEAD requests")
 
+    def close(self) -> None:
+        """Release the resources held by this transport.
+
+        Base implementation does nothing. Transports holding connections or
+        browsers release them here; closing twice must be harmless.
+        """
+        return None
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     @property
     def user_agent(self) -> str:
         """Get the User-Agent string used by this transport.
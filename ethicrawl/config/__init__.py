@@ -2,7 +2,9 @@
 
 from ethicrawl.config.base_config import BaseConfig
 from ethicrawl.config.config import Config
+from ethicrawl.config.config_snapshot import ConfigSnapshot, FrozenSection
 from ethicrawl.config.concurrency_config import ConcurrencyConfig
+from ethicrawl.config.domain_config import DomainConfig
 from ethicrawl.config.http_config import HttpConfig
 from ethicrawl.config.http_proxy_config import HttpProxyConfig
 from ethicrawl.config.logger_config import LoggerConfig
@@ -11,6 +13,9 @@ from ethicrawl.config.sitemap_config import SitemapConfig
 __all__ = [
     "BaseConfig",
     "Config",
+    "ConfigSnapshot",
+    "DomainConfig",
+    "FrozenSection",
     "HttpConfig",
     "HttpProxyConfig",
     "LoggerConfig",
@@ -1,6 +1,11 @@
 from abc import ABC, abstractmethod
+from itertools import count
 from json import dumps
-from typing import Any
+from typing import Any, ClassVar
+
+# next() on a count is atomic under the GIL, so concurrent setters never
+# publish the same generation
+_changes = count(1)
 
 
 class BaseConfig(ABC):
@@ -33,6 +38,19 @@ class BaseConfig(ABC):
         }
     """
 
+    # Bumped whenever any configuration value is set, so cached snapshots
+    # can tell they are stale without taking a lock
+    _generation: ClassVar[int] = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        BaseConfig._touch()
+
+    @staticmethod
+    def _touch() -> None:
+        """Record that configuration changed, e.g. after in-place mutation."""
+        BaseConfig._generation = next(_changes)
+
     @abstractmethod
     def to_dict(self) -> dict[str, Any]:
         """Convert configuration to a dictionary representation.
@@ -2,12 +2,16 @@ import copy
 import json
 import threading
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable, ClassVar
+from weakref import WeakMethod
 
+from .base_config import BaseConfig
+from .config_snapshot import ConfigSnapshot
 from .http_config import HttpConfig
 from .logger_config import LoggerConfig
 from .sitemap_config import SitemapConfig
 from .concurrency_config import ConcurrencyConfig
+from .domain_config import DomainConfig
 
 
 class SingletonMeta(type):
@@ -48,6 +52,8 @@ class Config(metaclass=SingletonMeta):
         http: HTTP-specific configuration (user agent, headers, timeout)
         logger: Logging configuration (levels, format, output)
         sitemap: Sitemap parsing configuration (limits, defaults)
+        concurrency: Concurrency limits for transports
+        domains: Per-domain overrides of HTTP and concurrency settings
 
     Example:
         >>> from ethicrawl.config import Config
@@ -61,10 +67,10 @@ class Config(metaclass=SingletonMeta):
         ...     "logger": {"component_levels": {"robots": "DEBUG"}}
         ... })
         >>>
-        >>> # Get a snapshot for thread-safe reading
-        >>> snapshot = config.get_snapshot()
+        >>> # Get a cheap read-only snapshot for use in hot paths
+        >>> snapshot = config.snapshot()
         >>> print(snapshot.http.timeout)
-        30
+        30.0
         >>>
         >>> # Export config for integration with external systems
         >>> config_dict = config.to_dict()
@@ -75,19 +81,121 @@ class Config(metaclass=SingletonMeta):
     logger: LoggerConfig = field(default_factory=LoggerConfig)
     sitemap: SitemapConfig = field(default_factory=SitemapConfig)
     concurrency: ConcurrencyConfig = field(default_factory=ConcurrencyConfig)
+    domains: DomainConfig = field(default_factory=DomainConfig)
 
     # Thread safety helpers
     _lock = threading.RLock()
 
+    # Shared read-only snapshot, rebuilt when the configuration changes
+    _cached_snapshot: ClassVar[ConfigSnapshot | None] = None
+    _subscribers: ClassVar[list[Callable[[], Any]]] = []
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        BaseConfig._touch()
+
     def get_snapshot(self) -> "Config":
         """Create a thread-safe deep copy of the current configuration.
 
+        The copy is a full, mutable Config. For reading settings in hot
+        paths, prefer snapshot(), which is far cheaper.
+
         Returns:
             A deep copy of the current Config object
         """
         with self._lock:
             return copy.deepcopy(self)
 
+    def _is_current(self, snapshot: ConfigSnapshot) -> bool:
+        # Headers can be changed in place without going through a setter,
+        # but the snapshot shares their copy-on-write storage, so any such
+        # change replaces the storage of the live headers
+        return (
+            snapshot.generation == BaseConfig._generation
+            and snapshot.http.headers._store is self.http.headers._store
+        )
+
+    def snapshot(self) -> ConfigSnapshot:
+        """Get an immutable snapshot of the current configuration.
+
+        The same snapshot object is returned until a setting changes, so
+        this is cheap enough to call whenever a component is created.
+        Components keep the snapshot and read from it without locking;
+        they see later changes when they take a new snapshot, either
+        explicitly or through subscribe().
+
+        Returns:
+            ConfigSnapshot of the current settings
+        """
+        cached = Config._cached_snapshot
+        if cached is not None and self._is_current(cached):
+            return cached
+        with self._lock:
+            cached = Config._cached_snapshot
+            if cached is not None and self._is_current(cached):
+                return cached
+            # Read the generation first so a concurrent change marks the
+            # new snapshot stale rather than being missed
+            cached = ConfigSnapshot(self, BaseConfig._generation)
+            Config._cached_snapshot = cached
+            return cached
+
+    def subscribe(self, callback: Callable[[ConfigSnapshot], Any]) -> None:
+        """Register a callback to receive a new snapshot after changes.
+
+        Callbacks run after update() and refresh(). Bound methods are held
+        weakly, so subscribing a component does not keep it alive.
+
+        Args:
+            callback: Callable taking the new ConfigSnapshot
+
+        Raises:
+            TypeError: If callback is not callable
+        """
+        if not callable(callback):
+            raise TypeError(
+                f"Expected callable callback, got {type(callback).__name__}"
+            )
+        if hasattr(callback, "__self__") and hasattr(callback, "__func__"):
+            ref: Callable[[], Any] = WeakMethod(callback)
+        else:
+            ref = lambda: callback  # noqa: E731
+        with self._lock:
+            Config._subscribers.append(ref)
+
+    def unsubscribe(self, callback: Callable[[ConfigSnapshot], Any]) -> None:
+        """Remove a callback registered with subscribe().
+
+        Args:
+            callback: The callback to remove; unknown callbacks are ignored
+        """
+        with self._lock:
+            Config._subscribers = [
+                ref
+                for ref in Config._subscribers
+                if ref() is not None and ref() != callback
+            ]
+
+    def refresh(self) -> ConfigSnapshot:
+        """Publish the current configuration to all subscribers.
+
+        Call this after changing settings directly through properties, so
+        that components created earlier pick up the changes.
+
+        Returns:
+            The new ConfigSnapshot
+        """
+        snapshot = self.snapshot()
+        with self._lock:
+            callbacks = [ref() for ref in Config._subscribers]
+            Config._subscribers = [
+                ref for ref, callback in zip(Config._subscribers, callbacks) if callback
+            ]
+        for callback in callbacks:
+            if callback is not None:
+                callback(snapshot)
+        return snapshot
+
     def update(self, config_dict: dict[str, Any]) -> None:
         """Update configuration from a dictionary.
 
@@ -98,6 +206,9 @@ class Config(metaclass=SingletonMeta):
         Args:
             config_dict: Dictionary with configuration settings
 
+        Subscribers registered with subscribe() receive the new snapshot
+        once all settings have been applied.
+
         Raises:
             AttributeError: If trying to set a property that doesn't exist
 
@@ -141,6 +252,7 @@ class Config(metaclass=SingletonMeta):
                             raise AttributeError(
                                 f"Failed to set '{k}' on {section_name} config: {exc}"
                             ) from exc
+        self.refresh()
 
     @classmethod
     def reset(cls):
@@ -156,6 +268,7 @@ class Config(metaclass=SingletonMeta):
         with cls.__class__._lock:
             if cls in cls.__class__._instances:
                 del cls.__class__._instances[cls]
+            cls._cached_snapshot = None
 
     def to_dict(self) -> dict:
         """Convert the configuration to a dictionary.
@@ -0,0 +1,219 @@
+from types import MappingProxyType
+from typing import Any
+
+from ethicrawl.core import Headers
+
+from .base_config import BaseConfig
+from .domain_config import OVERRIDABLE, resolve_overrides
+
+
+class _FrozenHeaders(Headers):
+    """Headers that cannot be changed, as held by a snapshot.
+
+    Copies (copy(), merged(), Headers(frozen)) are ordinary Headers and
+    can be changed; they share storage until they are.
+    """
+
+    __slots__ = ()
+
+    def __setitem__(self, key: str, value: str | None) -> None:
+        raise TypeError("Configuration snapshots are read-only")
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Configuration snapshots are read-only")
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Configuration snapshots are read-only")
+
+
+class FrozenSection:
+    """Read-only copy of one configuration section.
+
+    Holds the value of every property of a BaseConfig section at the time
+    it was taken. Nested sections (such as http.proxies) are frozen too,
+    dictionaries become read-only mappings, and headers become read-only
+    Headers sharing the live config's storage, so the copy costs nothing
+    until the live config changes.
+
+    Example:
+        >>> section = Config().snapshot().http
+        >>> section.timeout
+        30.0
+        >>> section.timeout = 5
+        Traceback (most recent call last):
+        AttributeError: Configuration snapshots are read-only
+    """
+
+    __slots__ = ("_name", "_values")
+
+    def __init__(self, section: BaseConfig, name: str = "") -> None:
+        """Freeze the properties of a configuration section.
+
+        Args:
+            section: Live configuration section to copy
+            name: Section name used in error messages
+        """
+        values: dict[str, Any] = {}
+        for attr in dir(type(section)):
+            if attr.startswith("_") or not isinstance(
+                getattr(type(section), attr), property
+            ):
+                continue
+            values[attr] = self._freeze(getattr(section, attr), attr)
+        object.__setattr__(self, "_name", name or type(section).__name__)
+        object.__setattr__(self, "_values", values)
+
+    @staticmethod
+    def _freeze(value: Any, name: str) -> Any:
+        if isinstance(value, BaseConfig):
+            return FrozenSection(value, name)
+        if isinstance(value, Headers):
+            return _FrozenHeaders(value)
+        if isinstance(value, dict):
+            return MappingProxyType(
+                {key: FrozenSection._freeze(item, key) for key, item in value.items()}
+            )
+        return value
+
+    @staticmethod
+    def _thaw(value: Any) -> Any:
+        if isinstance(value, FrozenSection):
+            return value.to_dict()
+        if isinstance(value, Headers):
+            return dict(value)
+        if isinstance(value, MappingProxyType):
+            return {key: FrozenSection._thaw(item) for key, item in value.items()}
+        return value
+
+    def replace(self, **values: Any) -> "FrozenSection":
+        """Return a copy of this section with some values replaced.
+
+        Args:
+            **values: Property values to replace
+
+        Returns:
+            New FrozenSection
+
+        Raises:
+            AttributeError: If a name is not a property of this section
+        """
+        for name in values:
+            getattr(self, name)
+        section = object.__new__(FrozenSection)
+        object.__setattr__(section, "_name", self._name)
+        object.__setattr__(section, "_values", {**self._values, **values})
+        return section
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(
+                f"No such property: '{name}' on {self._name} config"
+            ) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Configuration snapshots are read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Configuration snapshots are read-only")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the frozen section to a plain dictionary.
+
+        Returns:
+            Dictionary of property values, with nested sections converted
+        """
+        return {key: self._thaw(value) for key, value in self._values.items()}
+
+    def __repr__(self) -> str:
+        return f"FrozenSection({self._name}, {self._values!r})"
+
+
+class ConfigSnapshot:
+    """Immutable point-in-time view of the global Config.
+
+    Snapshots are cheap to take and safe to share between threads, so
+    components take one when they are created and read settings from it
+    instead of calling Config() (and taking its lock) on every request.
+    Config.snapshot() returns the same instance until the configuration
+    changes.
+
+    Attributes:
+        http: Frozen HTTP settings
+        logger: Frozen logger settings
+        sitemap: Frozen sitemap settings
+        concurrency: Frozen concurrency settings
+        domains: Frozen per-domain overrides
+        generation: Change counter value the snapshot was taken at
+
+    Example:
+        >>> from ethicrawl.config import Config
+        >>> snapshot = Config().snapshot()
+        >>> snapshot.http.timeout
+        30.0
+        >>> Config().http.timeout = 60
+        >>> snapshot.http.timeout  # unchanged
+        30.0
+        >>> Config().snapshot().http.timeout
+        60.0
+    """
+
+    __slots__ = ("http", "logger", "sitemap", "concurrency", "domains", "generation")
+    http: FrozenSection
+    logger: FrozenSection
+    sitemap: FrozenSection
+    concurrency: FrozenSection
+    domains: FrozenSection
+    generation: int
+    _sections = ("http", "logger", "sitemap", "concurrency", "domains")
+
+    def __init__(self, config: Any, generation: int) -> None:
+        """Freeze every section of a Config.
+
+        Args:
+            config: The live Config instance (the caller holds its lock)
+            generation: Change counter value read before freezing
+        """
+        for name in self._sections:
+            object.__setattr__(self, name, FrozenSection(getattr(config, name), name))
+        object.__setattr__(self, "generation", generation)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Configuration snapshots are read-only")
+
+    def for_domain(self, base: str) -> "ConfigSnapshot":
+        """Get the snapshot with the overrides for one domain applied.
+
+        Concurrency overrides only apply while concurrency is enabled,
+        matching the global ConcurrencyConfig behaviour.
+
+        Args:
+            base: Url.base of the domain, e.g. "https://cdn.example.com"
+
+        Returns:
+            A new ConfigSnapshot, or this one if no overrides match
+        """
+        settings = resolve_overrides(self.domains.overrides, base)
+        if not settings:
+            return self
+        changes: dict[str, dict[str, Any]] = {"http": {}, "concurrency": {}}
+        for name, value in settings.items():
+            changes[OVERRIDABLE[name]][name] = value
+        if not self.concurrency.enabled:
+            changes["concurrency"].clear()
+        snapshot = object.__new__(ConfigSnapshot)
+        for name in self._sections + ("generation",):
+            value = getattr(self, name)
+            if changes.get(name):
+                value = value.replace(**changes[name])
+            object.__setattr__(snapshot, name, value)
+        return snapshot
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the snapshot to a nested dictionary.
+
+        Returns:
+            Dictionary with one entry per configuration section
+        """
+        return {name: getattr(self, name).to_dict() for name in self._sections}
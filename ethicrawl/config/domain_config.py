@@ -0,0 +1,178 @@
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, Mapping
+
+from ethicrawl.core import Url
+
+from .base_config import BaseConfig
+from .concurrency_config import ConcurrencyConfig
+from .http_config import HttpConfig
+
+# Settings that can be overridden per domain, and the section each belongs to
+OVERRIDABLE: dict[str, str] = {
+    "timeout": "http",
+    "rate_limit": "http",
+    "jitter": "http",
+    "max_retries": "http",
+    "retry_delay": "http",
+    "requests": "concurrency",
+    "chrome": "concurrency",
+}
+
+
+def _normalize_pattern(pattern: str) -> str:
+    """Reduce a pattern to a Url.base or a lowercase hostname glob."""
+    if not isinstance(pattern, str):
+        raise TypeError(f"pattern must be a string, got {type(pattern).__name__}")
+    if not pattern.strip():
+        raise ValueError("pattern cannot be empty")
+    if "://" in pattern:
+        return Url(pattern).base
+    return pattern.strip().lower()
+
+
+def resolve_overrides(
+    overrides: Mapping[str, Mapping[str, Any]], base: str
+) -> dict[str, Any]:
+    """Merge the overrides that apply to a base URL.
+
+    Hostname patterns are applied in the order they were added, then an
+    exact Url.base match, so the most specific entry wins.
+
+    Args:
+        overrides: Mapping of pattern to settings, as held by DomainConfig
+        base: Url.base of the domain, e.g. "https://cdn.example.com"
+
+    Returns:
+        Dictionary of setting name to value (empty if nothing matches)
+    """
+    hostname = Url(base).hostname.lower()
+    settings: dict[str, Any] = {}
+    for pattern, values in overrides.items():
+        if "://" not in pattern and fnmatchcase(hostname, pattern):
+            settings.update(values)
+    settings.update(overrides.get(base, {}))
+    return settings
+
+
+@dataclass
+class DomainConfig(BaseConfig):
+    """Per-domain overrides for HTTP and concurrency settings.
+
+    Overrides are keyed either by a Url.base ("https://cdn.example.com"),
+    which matches that scheme and host exactly, or by a hostname pattern
+    ("*.example.com") that matches any scheme. They are resolved once,
+    when a domain is bound, into a config snapshot for that domain.
+
+    Only the settings in OVERRIDABLE can be overridden; values are checked
+    with the same rules as the global HttpConfig and ConcurrencyConfig.
+
+    Example:
+        >>> from ethicrawl.config import Config
+        >>> config = Config()
+        >>> config.domains.set_override("https://cdn.example.com", rate_limit=10.0)
+        >>> config.domains.set_override("*.partner.com", timeout=120, rate_limit=0.2)
+        >>> config.domains.resolve("https://www.partner.com")
+        {'timeout': 120.0, 'rate_limit': 0.2}
+    """
+
+    _overrides: dict[str, dict[str, Any]] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self.overrides = self._overrides
+
+    @staticmethod
+    def _validate_settings(settings: Mapping[str, Any]) -> dict[str, Any]:
+        """Check settings against the global config rules.
+
+        Returns:
+            The settings with values normalised by the section setters
+        """
+        sections: dict[str, BaseConfig] = {
+            "http": HttpConfig(),
+            "concurrency": ConcurrencyConfig(_enabled=True),
+        }
+        validated: dict[str, Any] = {}
+        for name, value in settings.items():
+            if name not in OVERRIDABLE:
+                raise AttributeError(f"No such property: '{name}' on domains config")
+            section = sections[OVERRIDABLE[name]]
+            setattr(section, name, value)
+            validated[name] = getattr(section, name)
+        return validated
+
+    @property
+    def overrides(self) -> dict[str, dict[str, Any]]:
+        """Overrides by pattern.
+
+        Returns a copy; use set_override() and remove_override() to change
+        individual entries, or assign a whole mapping to replace them all.
+
+        Raises:
+            TypeError: If value is not a dictionary of dictionaries
+            AttributeError: If a setting cannot be overridden per domain
+        """
+        return {pattern: dict(values) for pattern, values in self._overrides.items()}
+
+    @overrides.setter
+    def overrides(self, value: Mapping[str, Mapping[str, Any]]):
+        if not isinstance(value, Mapping):
+            raise TypeError(
+                f"overrides must be a dictionary, got {type(value).__name__}"
+            )
+        overrides: dict[str, dict[str, Any]] = {}
+        for pattern, settings in value.items():
+            if not isinstance(settings, Mapping):
+                raise TypeError(
+                    f"settings for {pattern} must be a dictionary, "
+                    f"got {type(settings).__name__}"
+                )
+            overrides[_normalize_pattern(pattern)] = self._validate_settings(settings)
+        self._overrides = overrides
+
+    def set_override(self, pattern: str, **settings: Any) -> None:
+        """Add or extend the overrides for a base URL or hostname pattern.
+
+        Args:
+            pattern: Url.base ("https://cdn.example.com") or hostname glob
+                ("*.example.com")
+            **settings: Settings to override, e.g. timeout=60
+
+        Raises:
+            TypeError: If pattern is not a string or a value has the wrong type
+            ValueError: If pattern is empty or a value is out of range
+            AttributeError: If a setting cannot be overridden per domain
+        """
+        key = _normalize_pattern(pattern)
+        merged = {**self._overrides.get(key, {}), **self._validate_settings(settings)}
+        self._overrides = {**self._overrides, key: merged}
+
+    def remove_override(self, pattern: str) -> None:
+        """Remove all overrides for a pattern.
+
+        Args:
+            pattern: Pattern as passed to set_override(); unknown patterns
+                are ignored
+        """
+        key = _normalize_pattern(pattern)
+        if key in self._overrides:
+            self._overrides = {k: v for k, v in self._overrides.items() if k != key}
+
+    def resolve(self, base: str) -> dict[str, Any]:
+        """Get the merged overrides for a base URL.
+
+        Args:
+            base: Url.base of the domain
+
+        Returns:
+            Dictionary of setting name to value (empty if nothing matches)
+        """
+        return resolve_overrides(self._overrides, base)
+
+    def to_dict(self) -> dict:
+        """Convert configuration to a dictionary.
+
+        Returns:
+            Dictionary with the overrides by pattern
+        """
+        return {"overrides": self.overrides}
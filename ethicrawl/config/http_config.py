@@ -21,7 +21,7 @@ class HttpConfig(BaseConfig):
 
     Attributes:
         timeout: Request timeout in seconds (default: 30.0)
-        max_retries: Maximum retry attempts for failed requests (default: 3)
+        max_retries: Maximum retry attempts for failed requests (default: 0)
         retry_delay: Base delay between retries in seconds (default: 1.0)
         rate_limit: Maximum requests per second (default: 0.5)
         jitter: Random variation factor for rate limiting (default: 0.2)
@@ -43,7 +43,7 @@ class HttpConfig(BaseConfig):
 
     # Private fields for property implementation
     _timeout: float = field(default=30.0, repr=False)
-    _max_retries: int = field(default=3, repr=False)
+    _max_retries: int = field(default=0, repr=False)
     _retry_delay: float = field(default=1.0, repr=False)
     _rate_limit: float | None = field(default=0.5, repr=False)
     _jitter: float = field(default=0.2, repr=False)
@@ -78,13 +78,22 @@ class HttpConfig(BaseConfig):
 
     @timeout.setter
     def timeout(self, value: float):
+        self._timeout = self._validate_timeout(value)
+
+    @staticmethod
+    def _validate_timeout(value: float) -> float:
+        """Validate a timeout value, returning it as a float.
+
+        Shared with HttpRequest so request timeouts follow the same rules
+        without constructing a throwaway config.
+        """
         if not isinstance(value, (int, float)):
             raise TypeError(f"timeout must be a number, got {type(value).__name__}")
         if value <= 0:
             raise ValueError("timeout must be positive")
         if value > 300:
             raise ValueError("maximum timeout is 300 seconds")
-        self._timeout = float(value)
+        return float(value)
 
     @property
     def max_retries(self) -> int:
@@ -92,9 +101,10 @@ class HttpConfig(BaseConfig):
 
         Controls how many times a failed request should be retried
         before giving up. Uses exponential backoff between attempts.
+        Only transport errors are retried, never responses.
 
         Valid range: 0-10 (0 means no retries)
-        Default: 3
+        Default: 0
 
         Raises:
             TypeError: If value is not an integer
@@ -261,6 +271,6 @@ class HttpConfig(BaseConfig):
             "max_retries": self._max_retries,
             "retry_delay": self._retry_delay,
             "user_agent": self._user_agent,
-            "headers": self._headers,
+            "headers": dict(self._headers),
             "proxies": self._proxies.to_dict(),
         }
@@ -22,6 +22,12 @@ class LoggerConfig(BaseConfig):
         use_colors: Whether to use colored console output (default: True)
         format: Log message format string
         component_levels: Dictionary of component-specific log levels
+        queue_enabled: Whether to write logs from a background thread
+            (default: False)
+        queue_size: Maximum records waiting for the background thread
+            (default: 10000)
+        queue_drop_level: Highest level that may be dropped when the queue
+            is full (default: DEBUG)
 
     Example:
         >>> from ethicrawl.config import Config
@@ -34,6 +40,8 @@ class LoggerConfig(BaseConfig):
         >>> # Set component-specific level
         >>> config.logger.set_component_level("robots", "DEBUG")
         >>> config.logger.set_component_level("http", "WARNING")
+        >>> # Keep slow log output off the crawl thread
+        >>> config.logger.queue_enabled = True
     """
 
     # Private fields for property implementation
@@ -46,6 +54,9 @@ class LoggerConfig(BaseConfig):
     _format: str = field(
         default="%(asctime)s - %(name)s - %(levelname)s - %(message)s", repr=False
     )
+    _queue_enabled: bool = field(default=False, repr=False)
+    _queue_size: int = field(default=10000, repr=False)
+    _queue_drop_level: int = field(default=logging.DEBUG, repr=False)
 
     def __post_init__(self):
         # Validate initial values by calling setters
@@ -55,6 +66,9 @@ class LoggerConfig(BaseConfig):
         self.file_path = self._file_path
         self.use_colors = self._use_colors
         self.format = self._format
+        self.queue_enabled = self._queue_enabled
+        self.queue_size = self._queue_size
+        self.queue_drop_level = self._queue_drop_level
 
         # Component levels don't need validation via setter since
         # they'll be validated when added via set_component_level
@@ -179,6 +193,71 @@ class LoggerConfig(BaseConfig):
             raise ValueError("format string cannot be empty")
         self._format = value
 
+    @property
+    def queue_enabled(self) -> bool:
+        """Whether to hand log records to a background thread.
+
+        When True, loggers put records on a bounded queue and a
+        QueueListener thread writes them to the console and file handlers,
+        so slow terminals or disks do not hold up crawling.
+        Default: False
+
+        Raises:
+            TypeError: If value is not a boolean
+        """
+        return self._queue_enabled
+
+    @queue_enabled.setter
+    def queue_enabled(self, value: bool):
+        if not isinstance(value, bool):
+            raise TypeError(
+                f"queue_enabled must be a boolean, got {type(value).__name__}"
+            )
+        self._queue_enabled = value
+
+    @property
+    def queue_size(self) -> int:
+        """Maximum number of records waiting to be written.
+
+        Only used when queue_enabled is True.
+        Default: 10000
+
+        Raises:
+            TypeError: If value is not an integer
+            ValueError: If value is less than 1
+        """
+        return self._queue_size
+
+    @queue_size.setter
+    def queue_size(self, value: int):
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise TypeError(
+                f"queue_size must be an integer, got {type(value).__name__}"
+            )
+        if value < 1:
+            raise ValueError("queue_size must be at least 1")
+        self._queue_size = value
+
+    @property
+    def queue_drop_level(self) -> int:
+        """Highest log level that is dropped when the queue is full.
+
+        Records at or below this level are discarded rather than waited
+        for when the queue is full; records above it block until there is
+        room, so warnings and errors are never lost. A warning reporting
+        the number of dropped records is logged once there is room again.
+        Default: logging.DEBUG (10)
+
+        Raises:
+            TypeError: If value is not an integer or string
+            ValueError: If value is an invalid level
+        """
+        return self._queue_drop_level
+
+    @queue_drop_level.setter
+    def queue_drop_level(self, value: int | str):
+        self._queue_drop_level = self._validate_log_level(value)
+
     @property
     def component_levels(self) -> dict[str, int]:
         """Special log levels for specific components.
@@ -209,6 +288,7 @@ class LoggerConfig(BaseConfig):
         """
         validated_level = self._validate_log_level(level)
         self._component_levels[component_name] = validated_level
+        self._touch()
 
     def _validate_log_level(self, level: int | str) -> int:
         """
@@ -274,6 +354,9 @@ class LoggerConfig(BaseConfig):
             "file_path": self._file_path,
             "use_colors": self._use_colors,
             "format": self._format,
+            "queue_enabled": self._queue_enabled,
+            "queue_size": self._queue_size,
+            "queue_drop_level": self._queue_drop_level,
             # Return a copy to prevent direct mutation
             "component_levels": self._component_levels.copy(),
         }
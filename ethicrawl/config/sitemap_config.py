@@ -16,6 +16,8 @@ class SitemapConfig(BaseConfig):
         max_depth: Maximum recursion depth for nested sitemaps (default: 5)
         follow_external: Whether to follow sitemap links to external domains (default: False)
         validate_urls: Whether to validate URLs before adding them to results (default: True)
+        spill_threshold: Number of parsed URLs kept in memory before the rest
+            are spilled to disk, or None to keep everything in memory (default: None)
 
     Example:
         >>> from ethicrawl.config import Config
@@ -24,18 +26,22 @@ class SitemapConfig(BaseConfig):
         >>> config.sitemap.max_depth = 10
         >>> # Allow following external domains
         >>> config.sitemap.follow_external = True
+        >>> # Keep at most 100k entries in memory during large traversals
+        >>> config.sitemap.spill_threshold = 100_000
     """
 
     # Private fields for property implementation
     _max_depth: int = field(default=5, repr=False)
     _follow_external: bool = field(default=False, repr=False)
     _validate_urls: bool = field(default=True, repr=False)
+    _spill_threshold: int | None = field(default=None, repr=False)
 
     def __post_init__(self):
         # Validate initial values by calling setters
         self.max_depth = self._max_depth
         self.follow_external = self._follow_external
         self.validate_urls = self._validate_urls
+        self.spill_threshold = self._spill_threshold
 
     @property
     def max_depth(self) -> int:
@@ -107,6 +113,35 @@ class SitemapConfig(BaseConfig):
             )
         self._validate_urls = value
 
+    @property
+    def spill_threshold(self) -> int | None:
+        """Number of parsed URLs kept in memory before spilling to disk.
+
+        When set, the ResourceList returned by SitemapParser.parse() keeps
+        at most this many entries in memory and writes the rest to a
+        temporary file, reading them back lazily. Use this to inventory
+        very large sites within a small memory budget.
+
+        Valid range: >= 1, or None to disable spilling
+        Default: None
+
+        Raises:
+            TypeError: If value is not an integer or None
+            ValueError: If value is less than 1
+        """
+        return self._spill_threshold
+
+    @spill_threshold.setter
+    def spill_threshold(self, value: int | None):
+        if value is not None:
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise TypeError(
+                    f"spill_threshold must be an integer or None, got {type(value).__name__}"
+                )
+            if value < 1:
+                raise ValueError("spill_threshold must be at least 1")
+        self._spill_threshold = value
+
     def to_dict(self) -> dict:
         """Convert configuration to a dictionary.
 
@@ -117,4 +152,5 @@ class SitemapConfig(BaseConfig):
             "max_depth": self._max_depth,
             "follow_external": self._follow_external,
             "validate_urls": self._validate_urls,
+            "spill_threshold": self._spill_threshold,
         }
@@ -29,6 +29,10 @@ class ContextManager:
     ) -> bool:
         """Bind a resource to a client in this context manager.
 
+        Any per-domain overrides in Config().domains that match the
+        resource's Url.base are resolved here, once, and apply to all
+        later requests to the domain.
+
         Args:
             resource: The resource to bind
             client: The client to use for requests to this resource.
@@ -75,6 +79,11 @@ class ContextManager:
             raise ValueError(f"{resource.url.base} is not bound")
         return True
 
+    def close(self) -> None:
+        """Close the client of every bound domain."""
+        for target_context in self._contexts.values():
+            target_context.client.close()
+
     @validate_resource
     def get(
         self,
@@ -19,6 +19,10 @@ class SynchronousClient(Client):
         """
         self._client = client
 
+    def close(self) -> None:
+        """Close the wrapped client."""
+        self._client.close()
+
     def get(self, resource: Resource, headers=None) -> Response:
         """Synchronously fetch a resource.
 
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from ethicrawl.core import Resource
 from ethicrawl.client import Client
+from ethicrawl.config import Config, ConfigSnapshot
 from ethicrawl.functions import validate_resource
 from ethicrawl.robots import Robot, RobotFactory
 from ethicrawl.sitemaps import SitemapParser
@@ -20,16 +21,37 @@ class TargetContext(Context):
     """
 
     @validate_resource
-    def __init__(self, resource: Resource, client: Client) -> None:
+    def __init__(
+        self,
+        resource: Resource,
+        client: Client,
+        config: ConfigSnapshot | None = None,
+    ) -> None:
         """Initialize a target context for a specific domain.
 
         Args:
             resource: The resource representing the target domain
             client: The client to use for HTTP requests
+            config: Configuration snapshot to resolve this domain's
+                overrides from (default: the current configuration)
         """
+        # Overrides are resolved once here rather than on every request
+        base = resource.url.base
+        config = config or Config().snapshot()
+        self._config = config.for_domain(base)
+        client = client.for_domain(base, config)
         super().__init__(resource=resource, client=SynchronousClient(client))
         self._robot = RobotFactory.robot(Context(resource=resource, client=client))
 
+    @property
+    def config(self) -> ConfigSnapshot:
+        """Configuration for this domain, resolved when it was bound.
+
+        Returns:
+            ConfigSnapshot with this domain's overrides applied
+        """
+        return self._config
+
     @property
     def robot(self) -> Robot:
         """Robot instance for accessing robots.txt functionality.
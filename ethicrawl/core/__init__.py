@@ -2,12 +2,20 @@
 
 from .headers import Headers
 from .resource import Resource
-from .resource_list import ResourceList
+from .resource_filter import ResourceFilter
+from .resource_io import ResourceReader, ResourceWriter
+from .resolver import Resolver
+from .resource_list import ResourceList, ResourceListView
 from .url import Url
 
 __all__ = [
     "Headers",
+    "Resolver",
     "Resource",
+    "ResourceFilter",
     "ResourceList",
+    "ResourceListView",
+    "ResourceReader",
+    "ResourceWriter",
     "Url",
 ]
@@ -1,16 +1,36 @@
 from __future__ import annotations
-from typing import Any, Mapping, TypeVar, cast
 
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    TypeVar,
+    cast,
+    overload,
+)
 
-class Headers(dict):
+from requests.structures import CaseInsensitiveDict
+
+T = TypeVar("T")
+
+
+class Headers(MutableMapping[str, str]):
     """HTTP headers container with case-insensitive key access.
 
-    This class extends the standard dictionary to provide case-insensitive
-    access to HTTP header keys, conforming to HTTP specifications. It ensures
-    proper type handling and provides flexible initialization from various
-    header sources.
+    Header names are matched case-insensitively, conforming to HTTP
+    specifications, while the case a name was last set with is preserved
+    for iteration and output. Values are always strings.
 
-    Inherits all dictionary attributes
+    Entries are stored as ``lowercase name -> (original name, value)``.
+    Copies share storage until one of them is modified (copy-on-write), so
+    passing headers down through the client, transport and response layers
+    does not copy them each time.
+
+    Headers is a MutableMapping rather than a dict subclass, so
+    ``isinstance(headers, dict)`` is False; use ``dict(headers)`` where a
+    plain dict is needed.
 
     Examples:
         >>> headers = Headers({"Content-Type": "text/html"})
@@ -21,10 +41,15 @@ class Headers(dict):
         'application/json'
         >>> "content-type" in headers
         True
-        >>> "CONTENT-TYPE" in headers
-        True
+        >>> list(headers)
+        ['Content-Type']
+        >>> merged = headers.merged({"Accept": "text/html"})
+        >>> dict(merged)
+        {'Content-Type': 'application/json', 'Accept': 'text/html'}
     """
 
+    __slots__ = ("_store", "_shared")
+
     def __init__(self, headers: "Headers" | Mapping[str, Any] | None = None, **kwargs):
         """Initialize headers from a dictionary, dict-like object, or keyword arguments.
 
@@ -35,16 +60,27 @@ class Headers(dict):
         Raises:
             TypeError: If headers is not a dict-like object with an items() method
         """
-        super().__init__()  # Start with empty dict
+        self._store: dict[str, tuple[str, str]] = {}
+        self._shared = False
 
-        # Handle dictionary or Headers initialization
-        if headers is not None:
+        if isinstance(headers, Headers):
+            # Share storage; whichever side writes first takes a copy
+            self._store = headers._store
+            self._shared = headers._shared = True
+        elif isinstance(headers, CaseInsensitiveDict):
+            # Sessions and responses hold string names and values, which can
+            # be stored as they are, without a __setitem__ call per entry
+            items = list(headers.items())
+            if all(type(k) is str and type(v) is str for k, v in items):
+                self._store = {k.lower(): (k, v) for k, v in items}
+            else:
+                self.update(headers)
+        elif headers is not None:
             # Check if it has items() method rather than strict type checking
             if not hasattr(headers, "items") or not callable(headers.items):
                 raise TypeError(
                     f"Expected dict-like object, got {type(headers).__name__}"
                 )
-
             for k, v in headers.items():
                 self[k] = v
 
@@ -52,7 +88,14 @@ class Headers(dict):
         for k, v in kwargs.items():
             self[k] = v
 
-    def __getitem__(self, key):
+    def _own(self) -> dict[str, tuple[str, str]]:
+        """Get the storage for writing, copying it first if it is shared."""
+        if self._shared:
+            self._store = self._store.copy()
+            self._shared = False
+        return self._store
+
+    def __getitem__(self, key: str) -> str:
         """Get header value with case-insensitive key access.
 
         Args:
@@ -67,16 +110,20 @@ class Headers(dict):
         """
         if not isinstance(key, str):
             raise TypeError(f"Header keys must be strings, got {type(key).__name__}")
-        return super().__getitem__(key.lower())
+        try:
+            return self._store[key.lower()][1]
+        except KeyError:
+            raise KeyError(key) from None
 
     def __setitem__(self, key: str, value: str | None) -> None:
-        """Set header value with case-insensitive key storage.
+        """Set header value with case-insensitive key matching.
 
         Setting a header to None will remove it from the collection.
-        Non-string values are automatically converted to strings.
+        Non-string values are automatically converted to strings. The name
+        is stored with the case given here.
 
         Args:
-            key: Header name (will be converted to lowercase)
+            key: Header name
             value: Header value, or None to remove the header
 
         Raises:
@@ -84,16 +131,24 @@ class Headers(dict):
         """
         if not isinstance(key, str):
             raise TypeError(f"Header keys must be strings, got {type(key).__name__}")
-        key = key.lower()
         if value is None:
-            self.pop(key, None)  # Remove the key if value is None
-        else:
-            # Convert non-string values to strings (matching requests behavior)
-            if not isinstance(value, str):
-                value = str(value)
-            super().__setitem__(key, value)
+            if key.lower() in self._store:
+                del self._own()[key.lower()]
+            return
+        # Convert non-string values to strings (matching requests behavior)
+        if not isinstance(value, str):
+            value = str(value)
+        self._own()[key.lower()] = (key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if not isinstance(key, str):
+            raise TypeError(f"Header keys must be strings, got {type(key).__name__}")
+        lower = key.lower()
+        if lower not in self._store:
+            raise KeyError(key)
+        del self._own()[lower]
 
-    def __contains__(self, key) -> bool:
+    def __contains__(self, key: object) -> bool:
         """Check if header exists with case-insensitive comparison.
 
         Args:
@@ -104,9 +159,21 @@ class Headers(dict):
         """
         if not isinstance(key, str):
             return False
-        return super().__contains__(key.lower())
+        return key.lower() in self._store
+
+    def __iter__(self) -> Iterator[str]:
+        return (name for name, _ in self._store.values())
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    @overload
+    def get(self, key: str, /) -> str | None: ...
+
+    @overload
+    def get(self, key: str, default: str | T, /) -> str | T: ...
 
-    def get(self, key, default=None) -> str | None:
+    def get(self, key: str, default: Any = None, /) -> Any:
         """Get header value with optional default.
 
         Args:
@@ -117,8 +184,99 @@ class Headers(dict):
             Header value if it exists, otherwise the default value
         """
         if not isinstance(key, str):
-            return default  # need a test here also
-        try:
-            return self[key]  # Use case-insensitive __getitem__
-        except KeyError:
             return default
+        entry = self._store.get(key.lower())
+        return default if entry is None else entry[1]
+
+    def items(self):
+        """Get (name, value) pairs with names in their original case."""
+        return dict(self._store.values()).items()
+
+    def lower_items(self) -> Iterator[tuple[str, str]]:
+        """Get (lowercase name, value) pairs."""
+        return ((lower, entry[1]) for lower, entry in self._store.items())
+
+    def update(  # type: ignore[override]
+        self,
+        other: Mapping[str, Any] | Iterable[tuple[str, Any]] = (),
+        /,
+        **kwargs: Any,
+    ) -> None:
+        """Add or replace headers from a mapping or keyword arguments.
+
+        Args:
+            other: Mapping or (name, value) pairs of headers; a None value
+                removes that header
+            **kwargs: Further headers to set
+        """
+        if isinstance(other, Headers):
+            if other._store:
+                if not self._store:
+                    # Nothing to merge into, so just share the other storage
+                    self._store = other._store
+                    self._shared = other._shared = True
+                else:
+                    self._own().update(other._store)
+        elif isinstance(other, Mapping):
+            for k, v in cast(Mapping[str, Any], other).items():
+                self[k] = v
+        else:
+            for k, v in other:
+                self[k] = v
+        for k, v in kwargs.items():
+            self[k] = v
+
+    def merged(self, other: Mapping[str, Any] | None) -> "Headers":
+        """Return a new Headers with other's entries layered over these.
+
+        Neither input is modified. When other is empty the result shares
+        this object's storage, so nothing is copied until it is modified.
+
+        Args:
+            other: Headers to add or override, or None
+
+        Returns:
+            New Headers instance
+        """
+        result = Headers(self)
+        if other:
+            result.update(other)
+        return result
+
+    def copy(self) -> "Headers":
+        """Return a copy-on-write copy of these headers."""
+        return Headers(self)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare headers case-insensitively with another mapping."""
+        if isinstance(other, Headers):
+            return dict(self.lower_items()) == dict(other.lower_items())
+        if isinstance(other, Mapping):
+            try:
+                return dict(self.lower_items()) == dict(
+                    (str(k).lower(), v) for k, v in other.items()
+                )
+            except AttributeError:  # pragma: no cover
+                return False
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __copy__(self) -> "Headers":
+        return Headers(self)
+
+    def __deepcopy__(self, memo: dict) -> "Headers":
+        # Values are immutable strings, so a storage copy is a deep copy
+        result = Headers()
+        result._store = self._store.copy()
+        return result
+
+    def __getstate__(self) -> dict[str, tuple[str, str]]:
+        return self._store
+
+    def __setstate__(self, state: dict[str, tuple[str, str]]) -> None:
+        self._store = state
+        self._shared = False
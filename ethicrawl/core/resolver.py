@@ -0,0 +1,307 @@
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import wait
+from socket import gethostbyname
+from threading import Lock
+from time import monotonic
+from typing import Callable, ClassVar, Iterable
+
+# Sentinel distinguishing "not cached" from a cached negative result (None)
+_MISS = object()
+
+
+class Resolver:
+    """Caching DNS resolver used for hostname validation.
+
+    Resolver wraps a lookup backend (socket.gethostbyname by default) with a
+    thread-safe TTL cache. Successful lookups are cached for ``ttl`` seconds
+    and failed lookups for ``negative_ttl`` seconds, so repeated validation
+    of the same host does not go back to the network. Many hosts can be
+    resolved concurrently with resolve_many(), which also primes the cache
+    for later Url(..., validate=True) calls.
+
+    The cache holds at most ``max_entries`` hosts; when it is full, expired
+    entries are dropped first, then the oldest. A host is looked up by only
+    one thread at a time, so a slow name server does not tie up more pool
+    threads with repeated lookups of the same host. close() shuts the
+    lookup threads down.
+
+    A process-wide default instance is used by Url. Replace it with
+    set_default() to change cache settings or to inject a stub backend in
+    tests.
+
+    Attributes:
+        ttl: Seconds a successful lookup stays cached
+        negative_ttl: Seconds a failed lookup stays cached
+        timeout: Seconds resolve() waits for a single lookup (None waits
+            for the backend to return)
+        max_entries: Most hosts kept in the cache
+
+    Example:
+        >>> from ethicrawl.core import Resolver, Url
+        >>> resolver = Resolver(backend=lambda host: "127.0.0.1")
+        >>> Resolver.set_default(resolver)
+        >>> Url("https://example.com", validate=True)  # uses the stub
+        >>> resolver.resolve_many(["a.example", "b.example"])
+        {'a.example': '127.0.0.1', 'b.example': '127.0.0.1'}
+    """
+
+    _default: ClassVar["Resolver | None"] = None
+    _default_lock: ClassVar[Lock] = Lock()
+
+    def __init__(
+        self,
+        backend: Callable[[str], str] | None = None,
+        ttl: float = 300.0,
+        negative_ttl: float = 60.0,
+        timeout: float | None = 5.0,
+        max_workers: int = 32,
+        max_entries: int = 10000,
+    ) -> None:
+        """Initialize a resolver.
+
+        Args:
+            backend: Callable mapping a hostname to an address. It must raise
+                OSError (e.g. socket.gaierror) when the name cannot be
+                resolved. Defaults to socket.gethostbyname.
+            ttl: Seconds to cache successful lookups
+            negative_ttl: Seconds to cache failed lookups (0 disables
+                negative caching)
+            timeout: Seconds resolve() waits for a lookup, or None to wait
+                for the backend to return
+            max_workers: Maximum number of concurrent lookups
+            max_entries: Most hosts kept in the cache
+
+        Raises:
+            TypeError: If backend is not callable or a number has the wrong type
+            ValueError: If a TTL or the timeout is negative, or max_workers
+                or max_entries < 1
+        """
+        if backend is not None and not callable(backend):
+            raise TypeError(f"Expected callable backend, got {type(backend).__name__}")
+        for name, value in (("ttl", ttl), ("negative_ttl", negative_ttl)):
+            if not isinstance(value, (int, float)):
+                raise TypeError(f"{name} must be a number, got {type(value).__name__}")
+            if value < 0:
+                raise ValueError(f"{name} cannot be negative")
+        if timeout is not None:
+            if not isinstance(timeout, (int, float)):
+                raise TypeError(
+                    f"timeout must be a number or None, got {type(timeout).__name__}"
+                )
+            if timeout <= 0:
+                raise ValueError("timeout must be positive")
+        if not isinstance(max_workers, int):
+            raise TypeError(
+                f"max_workers must be an integer, got {type(max_workers).__name__}"
+            )
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if not isinstance(max_entries, int):
+            raise TypeError(
+                f"max_entries must be an integer, got {type(max_entries).__name__}"
+            )
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self._backend = backend or gethostbyname
+        self.ttl = float(ttl)
+        self.negative_ttl = float(negative_ttl)
+        self.timeout = float(timeout) if timeout is not None else None
+        self._max_workers = max_workers
+        self.max_entries = max_entries
+        # Hostname -> (expiry, address), oldest first
+        self._cache: dict[str, tuple[float, str | None]] = {}
+        # Lookups still running on the pool, by hostname
+        self._inflight: dict[str, Future] = {}
+        self._lock = Lock()
+        self._pool: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def default(cls) -> "Resolver":
+        """Get the process-wide resolver used by Url validation.
+
+        Returns:
+            The shared Resolver instance, created on first use
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    @classmethod
+    def set_default(cls, resolver: "Resolver | None") -> None:
+        """Replace the process-wide resolver.
+
+        Args:
+            resolver: Resolver to use from now on, or None to go back to a
+                fresh default Resolver on next use
+
+        Raises:
+            TypeError: If resolver is not a Resolver or None
+        """
+        if resolver is not None and not isinstance(resolver, Resolver):
+            raise TypeError(f"Expected Resolver, got {type(resolver).__name__}")
+        with cls._default_lock:
+            previous, cls._default = cls._default, resolver
+        if previous is not None and previous is not resolver:
+            previous.close()
+
+    def _submit(self, hostname: str) -> Future:
+        """Start a lookup on the pool, or join one already running.
+
+        The result is cached when the lookup finishes, even if the caller
+        has stopped waiting for it.
+        """
+        with self._lock:
+            future = self._inflight.get(hostname)
+            if future is not None:
+                return future
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="ethicrawl-dns"
+                )
+            future = self._pool.submit(self._lookup, hostname)
+            self._inflight[hostname] = future
+        # Outside the lock: the callback runs at once if already done
+        future.add_done_callback(lambda done: self._finished(hostname, done))
+        return future
+
+    def _finished(self, hostname: str, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(hostname) is future:
+                del self._inflight[hostname]
+        if not future.cancelled():
+            self._store(hostname, future.result())
+
+    def _cached(self, hostname: str) -> object:
+        with self._lock:
+            entry = self._cache.get(hostname)
+            if entry is None:
+                return _MISS
+            expires, address = entry
+            if expires <= monotonic():
+                del self._cache[hostname]
+                return _MISS
+            return address
+
+    def _store(self, hostname: str, address: str | None) -> None:
+        ttl = self.ttl if address is not None else self.negative_ttl
+        if ttl <= 0:
+            return
+        now = monotonic()
+        with self._lock:
+            self._cache.pop(hostname, None)
+            if len(self._cache) >= self.max_entries:
+                self._evict(now)
+            self._cache[hostname] = (now + ttl, address)
+
+    def _evict(self, now: float) -> None:
+        """Make room for one entry; the caller holds the lock."""
+        for hostname in [
+            h for h, (expires, _) in self._cache.items() if expires <= now
+        ]:
+            del self._cache[hostname]
+        while len(self._cache) >= self.max_entries:
+            del self._cache[next(iter(self._cache))]
+
+    def _lookup(self, hostname: str) -> str | None:
+        """Query the backend directly, mapping lookup failures to None."""
+        try:
+            return self._backend(hostname)
+        except (OSError, UnicodeError):
+            return None
+
+    def resolve(self, hostname: str) -> str | None:
+        """Resolve a hostname to an address, using the cache when possible.
+
+        Lookups that time out return None. The lookup carries on in the
+        background and its result is cached when it finishes; calls made
+        meanwhile wait on that same lookup rather than starting another.
+
+        Args:
+            hostname: The hostname to resolve
+
+        Returns:
+            The resolved address, or None if the hostname cannot be resolved
+
+        Raises:
+            TypeError: If hostname is not a string
+        """
+        if not isinstance(hostname, str):
+            raise TypeError(f"Expected str, got {type(hostname).__name__}")
+        cached = self._cached(hostname)
+        if cached is not _MISS:
+            return cached  # type: ignore[return-value]
+
+        if self.timeout is None:
+            address = self._lookup(hostname)
+            self._store(hostname, address)
+            return address
+        try:
+            return self._submit(hostname).result(timeout=self.timeout)
+        except (FuturesTimeoutError, CancelledError):
+            return None
+
+    def resolve_many(
+        self, hostnames: Iterable[str], timeout: float | None = None
+    ) -> dict[str, str | None]:
+        """Resolve many hostnames concurrently.
+
+        Cached hostnames are answered immediately; the rest are looked up in
+        parallel on up to max_workers threads. Results are cached, so this
+        can be used to warm the cache before validating a batch of URLs.
+
+        Args:
+            hostnames: Hostnames to resolve; duplicates are looked up once
+            timeout: Seconds to wait for the whole batch, or None to wait for
+                every lookup. Hostnames still pending at the deadline map to
+                None; queued lookups are cancelled, and running ones cache
+                their result when they finish.
+
+        Returns:
+            Dictionary mapping each hostname to its address, or None if it
+            could not be resolved
+
+        Raises:
+            TypeError: If any hostname is not a string
+        """
+        results: dict[str, str | None] = {}
+        pending: list[str] = []
+        for hostname in dict.fromkeys(hostnames):
+            if not isinstance(hostname, str):
+                raise TypeError(f"Expected str, got {type(hostname).__name__}")
+            cached = self._cached(hostname)
+            if cached is _MISS:
+                pending.append(hostname)
+            else:
+                results[hostname] = cached  # type: ignore[assignment]
+
+        if not pending:
+            return results
+
+        futures = {self._submit(hostname): hostname for hostname in pending}
+        done, not_done = wait(futures, timeout=timeout)
+        for future in done:
+            hostname = futures[future]
+            results[hostname] = None if future.cancelled() else future.result()
+        for future in not_done:
+            future.cancel()
+            results[futures[future]] = None
+        return results
+
+    def clear(self) -> None:
+        """Remove all cached lookups."""
+        with self._lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Shut down the lookup threads, cancelling queued lookups.
+
+        Lookups already running are left to finish in the background. The
+        resolver can still be used; it starts new threads when needed.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import MISSING, dataclass, fields
+from typing import Any, ClassVar
 
 from .url import Url
 
@@ -33,6 +33,13 @@ class Resource:
 
     url: Url
 
+    # Resource classes by name, used to restore serialised resources
+    _types: ClassVar[dict[str, type["Resource"]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        Resource._types[cls.__name__] = cls
+
     def __post_init__(self):
         """Validate and normalize the url attribute after initialization.
 
@@ -51,7 +58,7 @@ class Resource:
         Returns:
             Integer hash value
         """
-        return hash(str(self.url))
+        return hash(self.url)
 
     def __eq__(self, other: Any) -> bool:
         """Compare resources for equality based on their URLs.
@@ -66,7 +73,80 @@ class Resource:
         """
         if not isinstance(other, self.__class__):
             return False
-        return str(self.url) == str(other.url)
+        return self.url == other.url
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the resource to a JSON-compatible dictionary.
+
+        The dictionary holds the class name under "type" plus every
+        dataclass field that is not None, with the URL as a string.
+
+        Returns:
+            Dictionary suitable for from_dict()
+        """
+        data: dict[str, Any] = {"type": type(self).__name__}
+        for item in fields(self):
+            value = getattr(self, item.name)
+            if value is not None:
+                data[item.name] = str(value) if isinstance(value, Url) else value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], validate: bool = True) -> "Resource":
+        """Restore a resource produced by to_dict().
+
+        Args:
+            data: Dictionary with a "type" key naming the Resource class
+                (defaults to this class) and the field values
+            validate: Run the class's field validation. Pass False only for
+                data written by to_dict(), which was validated when the
+                resource was created.
+
+        Returns:
+            Resource of the recorded type
+
+        Raises:
+            ValueError: If the type is unknown or not a subclass of this
+                class, or a required field is missing
+            TypeError: If data is not a dictionary
+        """
+        if not isinstance(data, dict):
+            raise TypeError(f"Expected dict, got {type(data).__name__}")
+        values = dict(data)
+        name = values.pop("type", cls.__name__)
+        target = cls if name == cls.__name__ else Resource._types.get(name)
+        if target is None or not issubclass(target, cls):
+            raise ValueError(f"Unknown resource type: {name}")
+        if validate:
+            return target(**values)
+        resource = target.__new__(target)
+        for item in fields(target):
+            if item.name in values:
+                value = values[item.name]
+            elif item.default is not MISSING:
+                value = item.default
+            elif item.default_factory is not MISSING:
+                value = item.default_factory()
+            else:
+                raise ValueError(f"Missing field for {name}: {item.name}")
+            setattr(resource, item.name, value)
+        resource.url = Url(resource.url)
+        return resource
+
+    def sort_value(self, field: str) -> Any:
+        """Get the value used to order resources by a named field.
+
+        ResourceList.sort_by() and top_k() call this for string keys.
+        Subclasses override it when a field's stored form does not order
+        correctly, e.g. date strings that need parsing first.
+
+        Args:
+            field: Name of the attribute to order by
+
+        Returns:
+            The comparable value, or None if this resource has no such value
+        """
+        return getattr(self, field, None)
 
     def __str__(self) -> str:
         """Return the URL as a string for better readability."""
@@ -0,0 +1,168 @@
+from re import VERBOSE
+from re import compile as re_compile
+from re import error as re_error
+from typing import Callable, Iterable, Pattern
+
+from ethicrawl.core.resource import Resource
+
+PatternSet = str | Pattern | Iterable[str | Pattern] | None
+
+# Inline global flags such as (?i); Pattern.flags already includes them
+_GLOBAL_FLAGS = re_compile(r"\(\?[aiLmsux]+\)")
+
+# Named groups, backreferences and conditionals rely on group names or
+# numbers, which would clash or shift inside a shared alternation
+_UNMERGEABLE = re_compile(r"\(\?P[<=]|\(\?\(|\\[1-9]")
+
+
+def _alternative(pattern: Pattern) -> str:
+    """Wrap a pattern's source as one branch of an alternation."""
+    source = pattern.pattern
+    while match := _GLOBAL_FLAGS.match(source):
+        source = source[match.end() :]
+    # In verbose mode a trailing comment would swallow the closing ")"
+    end = "\n)" if pattern.flags & VERBOSE else ")"
+    return f"(?:{source}{end}"
+
+
+def _compile_patterns(patterns: PatternSet) -> tuple[Pattern, ...]:
+    """Merge a set of regular expressions into as few compiled patterns as possible.
+
+    Patterns sharing the same flags are joined into a single alternation so
+    that a URL is scanned once per flag group instead of once per pattern.
+    Inline global flags such as (?i) are taken from the compiled pattern.
+    Patterns that cannot share an alternation (named groups,
+    backreferences, conditionals) are kept as they are.
+
+    Args:
+        patterns: A pattern, an iterable of patterns, or None
+
+    Returns:
+        Tuple of compiled alternations (empty if no patterns were given)
+
+    Raises:
+        TypeError: If a pattern is not a string or compiled Pattern
+    """
+    if patterns is None:
+        return ()
+    if isinstance(patterns, (str, Pattern)):
+        patterns = [patterns]
+
+    groups: dict[int, list[Pattern]] = {}
+    for pattern in patterns:
+        if isinstance(pattern, str):
+            pattern = re_compile(pattern)
+        if not isinstance(pattern, Pattern):
+            raise TypeError(f"Expected str or Pattern, got {type(pattern).__name__}")
+        groups.setdefault(pattern.flags, []).append(pattern)
+
+    compiled: list[Pattern] = []
+    for flags, members in groups.items():
+        mergeable: list[Pattern] = []
+        for pattern in members:
+            if _UNMERGEABLE.search(pattern.pattern):
+                compiled.append(pattern)
+            else:
+                mergeable.append(pattern)
+        if len(mergeable) < 2:
+            compiled.extend(mergeable)
+            continue
+        try:
+            compiled.append(
+                re_compile("|".join(_alternative(p) for p in mergeable), flags)
+            )
+        except re_error:
+            # Not safe to merge after all; test the patterns one by one
+            compiled.extend(mergeable)
+    return tuple(compiled)
+
+
+class ResourceFilter:
+    """Compiled selection rule for Resources.
+
+    ResourceFilter combines URL include and exclude pattern sets with
+    arbitrary predicates into a single rule that is evaluated in one pass.
+    Include patterns are merged into one regular expression alternation,
+    as are exclude patterns, so adding patterns does not add passes over
+    the URL.
+
+    A resource matches when its URL matches any include pattern (or no
+    include patterns were given), matches no exclude pattern, and every
+    predicate returns True.
+
+    Example:
+        >>> from ethicrawl.core import Resource, ResourceFilter, ResourceList
+        >>> rule = ResourceFilter(
+        ...     include=[r"/products/", r"/blog/"],
+        ...     exclude=[r"\\?page=", r"/drafts/"],
+        ... )
+        >>> resources = ResourceList([
+        ...     Resource("https://example.com/products/1"),
+        ...     Resource("https://example.com/blog/drafts/2"),
+        ... ])
+        >>> len(resources.filter(rule))
+        1
+    """
+
+    def __init__(
+        self,
+        include: PatternSet = None,
+        exclude: PatternSet = None,
+        predicates: Iterable[Callable[[Resource], bool]] = (),
+    ) -> None:
+        """Compile a filter from pattern sets and predicates.
+
+        Args:
+            include: Pattern or patterns a URL must match (any of them)
+            exclude: Pattern or patterns a URL must not match (any of them)
+            predicates: Callables taking a Resource, all of which must
+                return True for it to match
+
+        Raises:
+            TypeError: If a pattern is not a string or compiled Pattern,
+                or a predicate is not callable
+        """
+        self._include = _compile_patterns(include)
+        self._exclude = _compile_patterns(exclude)
+        self._predicates: list[Callable[[Resource], bool]] = []
+        for predicate in predicates:
+            self.add_predicate(predicate)
+
+    def add_predicate(self, predicate: Callable[[Resource], bool]) -> None:
+        """Add a predicate that resources must satisfy.
+
+        Args:
+            predicate: Callable taking a Resource and returning a bool
+
+        Raises:
+            TypeError: If predicate is not callable
+        """
+        if not callable(predicate):
+            raise TypeError(
+                f"Expected callable predicate, got {type(predicate).__name__}"
+            )
+        self._predicates.append(predicate)
+
+    def matches(self, resource: Resource) -> bool:
+        """Check whether a resource satisfies this filter.
+
+        Args:
+            resource: The resource to test
+
+        Returns:
+            True if the resource matches
+        """
+        if self._include or self._exclude:
+            url = str(resource.url)
+            if self._include and not any(p.search(url) for p in self._include):
+                return False
+            if any(p.search(url) for p in self._exclude):
+                return False
+        for predicate in self._predicates:
+            if not predicate(resource):
+                return False
+        return True
+
+    def __call__(self, resource: Resource) -> bool:
+        """Alias for matches() so a filter can be used as a predicate."""
+        return self.matches(resource)
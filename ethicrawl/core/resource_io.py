@@ -0,0 +1,156 @@
+from json import dumps, loads
+from os import PathLike
+from typing import IO, Iterable, Iterator
+
+from ethicrawl.core.resource import Resource
+
+FORMAT_NAME = "ethicrawl.resources"
+FORMAT_VERSION = 1
+
+
+class ResourceWriter:
+    """Streaming JSON Lines writer for Resources.
+
+    The first line is a header naming the format and version; every
+    following line is one resource as produced by Resource.to_dict().
+    Resources are written as they arrive, so arbitrarily large lists can
+    be checkpointed without building the output in memory.
+
+    Example:
+        >>> from ethicrawl.core import ResourceReader, ResourceWriter
+        >>> with ResourceWriter("inventory.jsonl") as writer:
+        ...     writer.write_all(entries)
+        >>> with ResourceReader("inventory.jsonl", validate=False) as reader:
+        ...     restored = list(reader)
+    """
+
+    def __init__(self, target: str | PathLike | IO[str]) -> None:
+        """Open a writer and emit the header line.
+
+        Args:
+            target: Path to create (overwritten if it exists) or an open
+                text file
+
+        Raises:
+            TypeError: If target is not a path or writable text file
+        """
+        if isinstance(target, (str, PathLike)):
+            self._file: IO[str] = open(target, "w", encoding="utf-8")
+            self._owns_file = True
+        elif hasattr(target, "write"):
+            self._file = target
+            self._owns_file = False
+        else:
+            raise TypeError(
+                f"Expected path or file object, got {type(target).__name__}"
+            )
+        self.count = 0
+        self._file.write(
+            dumps({"format": FORMAT_NAME, "version": FORMAT_VERSION}) + "\n"
+        )
+
+    def write(self, resource: Resource) -> None:
+        """Write a single resource.
+
+        Args:
+            resource: Resource whose fields are JSON-compatible
+
+        Raises:
+            TypeError: If resource is not a Resource or has a field that
+                cannot be represented in JSON
+        """
+        if not isinstance(resource, Resource):
+            raise TypeError(f"Expected Resource, got {type(resource).__name__}")
+        self._file.write(dumps(resource.to_dict(), separators=(",", ":")) + "\n")
+        self.count += 1
+
+    def write_all(self, resources: Iterable[Resource]) -> int:
+        """Write every resource from an iterable.
+
+        Args:
+            resources: Resources to write, consumed lazily
+
+        Returns:
+            Number of resources written by this call
+        """
+        start = self.count
+        for resource in resources:
+            self.write(resource)
+        return self.count - start
+
+    def close(self) -> None:
+        """Flush output and close the file if this writer opened it."""
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "ResourceWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ResourceReader:
+    """Streaming reader for files produced by ResourceWriter.
+
+    Iterating the reader yields one Resource per line, restored to its
+    original class (e.g. UrlsetEntry). With validate=False the class
+    validators are skipped, which is safe for files written by
+    ResourceWriter because every resource was validated when created.
+    """
+
+    def __init__(self, source: str | PathLike | IO[str], validate: bool = True) -> None:
+        """Open a reader and check the header line.
+
+        Args:
+            source: Path to read or an open text file
+            validate: Run field validation on every restored resource
+
+        Raises:
+            TypeError: If source is not a path or readable text file
+            ValueError: If the header is missing or names an unsupported
+                format version
+        """
+        if isinstance(source, (str, PathLike)):
+            self._file: IO[str] = open(source, "r", encoding="utf-8")
+            self._owns_file = True
+        elif hasattr(source, "readline"):
+            self._file = source
+            self._owns_file = False
+        else:
+            raise TypeError(
+                f"Expected path or file object, got {type(source).__name__}"
+            )
+        self._validate = validate
+        try:
+            header = loads(self._file.readline() or "null")
+        except ValueError:
+            header = None
+        if not isinstance(header, dict) or header.get("format") != FORMAT_NAME:
+            self.close()
+            raise ValueError("Not an ethicrawl resource file")
+        if header.get("version") != FORMAT_VERSION:
+            self.close()
+            raise ValueError(
+                f"Unsupported resource file version: {header.get('version')}"
+            )
+
+    def __iter__(self) -> Iterator[Resource]:
+        from_dict = Resource.from_dict
+        validate = self._validate
+        for line in self._file:
+            if line.strip():
+                yield from_dict(loads(line), validate)
+
+    def close(self) -> None:
+        """Close the file if this reader opened it."""
+        if self._owns_file:
+            self._file.close()
+
+    def __enter__(self) -> "ResourceReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
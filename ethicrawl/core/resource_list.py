@@ -1,7 +1,27 @@
+from hashlib import blake2b
+from heapq import nlargest, nsmallest
+from itertools import chain, islice
+from operator import itemgetter
+from os import PathLike
 from re import compile as re_compile
-from typing import Generic, Iterable, Iterator, Pattern, TypeVar
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Container,
+    Generic,
+    Iterable,
+    Iterator,
+    Pattern,
+    TypeVar,
+    cast,
+)
 
 from ethicrawl.core.resource import Resource
+from ethicrawl.core.resource_filter import ResourceFilter
+from ethicrawl.core.resource_io import ResourceReader, ResourceWriter
+from ethicrawl.core.spill_store import SpillStore
+from ethicrawl.core.url import Url
 
 T = TypeVar("T", bound=Resource)
 
@@ -13,6 +33,17 @@ class ResourceList(Generic[T]):
     collections of Resources with additional filtering methods and type safety.
     The class is generic and can contain any subclass of Resource.
 
+    Membership, lookup, deduplication and set operations compare resources
+    by URL. Passing indexed=True maintains a URL to position hash index as
+    items are added, making ``in`` and index_of() constant time instead of
+    a linear scan. Set operations run in linear time either way.
+
+    Passing spill_threshold keeps at most that many resources in memory;
+    beyond it, resources are written to a temporary file and read back
+    lazily when iterated or indexed. Iteration, filtering and len() work
+    the same either way, and filter(), dedupe() and the set operations
+    return lists that spill with the same settings.
+
     Note:
         This class has no public attributes as all storage is private.
 
@@ -26,26 +57,103 @@ class ResourceList(Generic[T]):
         >>> filtered = resources.filter(r"page1")
         >>> len(filtered)
         1
+        >>> indexed = ResourceList(resources.to_list(), indexed=True)
+        >>> "https://example.com/page2" in indexed
+        True
     """
 
-    def __init__(self, items: list[T] | None = None):
+    def __init__(
+        self,
+        items: list[T] | None = None,
+        indexed: bool = False,
+        validate: bool = True,
+        spill_threshold: int | None = None,
+        spill_dir: str | None = None,
+    ):
         """Initialize a resource list with optional initial items.
 
         Args:
             items: Optional list of Resource objects to initialize with
+            indexed: Maintain a URL hash index for constant-time membership
+                tests and index_of() lookups
+            validate: Check that every item is a Resource. Pass False only
+                for lists produced by code that already guarantees this.
+            spill_threshold: Number of resources to keep in memory before
+                spilling the rest to a temporary file (None never spills)
+            spill_dir: Directory for the spill file (default: system temp)
 
         Raises:
-            TypeError: If items is not a list or contains non-Resource objects
+            TypeError: If items is not a list or contains non-Resource
+                objects, or spill_threshold is not an integer
+            ValueError: If spill_threshold is less than 1
         """
-        self._items: list[T] = []
+        self._items: list[T] | SpillStore[T] = (
+            SpillStore(spill_threshold, spill_dir)
+            if spill_threshold is not None
+            else []
+        )
+        # Maps each URL to the position of its first occurrence
+        # Keyed by URL string; Url compares and hashes equal to its string
+        self._index: dict[str, int] | None = {} if indexed else None
         if items and isinstance(items, list):
-            self.extend(items)
+            self.extend(items, validate=validate)
         elif items:
             raise TypeError(f"Expected list got {type(items).__name__}")
 
+    @classmethod
+    def _wrap(cls, items: list[T], indexed: bool = False) -> "ResourceList[T]":
+        """Adopt an already validated list without copying or checking it.
+
+        The caller must not keep using the list afterwards, as the new
+        ResourceList takes ownership of it.
+
+        Args:
+            items: List known to contain only Resource objects
+            indexed: Build a URL index for the new list
+
+        Returns:
+            ResourceList backed directly by items
+        """
+        result = cls.__new__(cls)
+        result._items = items
+        result._index = None
+        if indexed:
+            result._index = {}
+            result._index_from(0)
+        return result
+
+    def _index_from(self, start: int) -> None:
+        """Add items from position start onwards to the URL index."""
+        setdefault = self._index.setdefault  # type: ignore[union-attr]
+        items = self._items
+        # Stream rather than slice, so spilled items are never all in memory
+        tail = (
+            items.iter_from(start)
+            if isinstance(items, SpillStore)
+            else islice(items, start, None)
+        )
+        for position, item in enumerate(tail, start):
+            setdefault(str(item.url), position)
+
     def __iter__(self) -> Iterator[T]:
         return iter(self._items)
 
+    def __contains__(self, item: object) -> bool:
+        """Check whether a resource with the given URL is in the list.
+
+        Args:
+            item: Resource, Url or URL string to look for
+
+        Returns:
+            True if a resource with a matching URL is present
+        """
+        key = self._lookup_key(item)
+        if key is None:
+            return False
+        if self._index is not None:
+            return key in self._index
+        return any(resource.url == key for resource in self._items)
+
     def __getitem__(self, index: int | slice) -> T | "ResourceList[T]":
         """Get items by index or slice.
 
@@ -56,9 +164,8 @@ class ResourceList(Generic[T]):
             Single Resource when indexed with integer, ResourceList when sliced
         """
         if isinstance(index, slice):
-            result: ResourceList = ResourceList()
-            result.extend(self._items[index])
-            return result
+            # Items in a slice are already validated, so skip the checks
+            return ResourceList._wrap(self._items[index], self.indexed)
         return self._items[index]
 
     def __len__(self) -> int:
@@ -84,14 +191,22 @@ class ResourceList(Generic[T]):
         """
         if not isinstance(item, Resource):
             raise TypeError(f"Expected Resource, got {type(item).__name__}")
+        if self._index is not None:
+            self._index.setdefault(str(item.url), len(self._items))
         self._items.append(item)
         return self
 
-    def extend(self, items: Iterable[T]) -> "ResourceList[T]":
+    def extend(self, items: Iterable[T], validate: bool = True) -> "ResourceList[T]":
         """Add multiple resources to the list.
 
+        Items are checked in a single pass before any are added, so a
+        TypeError leaves the list unchanged. Items from another ResourceList
+        are already known to be valid and are added without checks.
+
         Args:
             items: Iterable of Resource objects to add
+            validate: Check that every item is a Resource. Pass False only
+                for items produced by code that already guarantees this.
 
         Returns:
             Self for method chaining
@@ -99,27 +214,485 @@ class ResourceList(Generic[T]):
         Raises:
             TypeError: If any item is not a Resource object
         """
-        for item in items:
-            self.append(item)
+        if isinstance(items, ResourceList):
+            new_items: Iterable[T] = items._items
+        elif validate:
+            new_items = items if isinstance(items, list) else list(items)
+            # Check each distinct type once rather than every item
+            for item_type in set(map(type, new_items)):
+                if not issubclass(item_type, Resource):
+                    raise TypeError(f"Expected Resource, got {item_type.__name__}")
+        else:
+            # Trusted items are streamed, so a spilling list never holds
+            # them all in memory at once
+            new_items = items
+        start = len(self._items)
+        self._items.extend(new_items)
+        if self._index is not None:
+            self._index_from(start)
         return self
 
-    def filter(self, pattern: str | Pattern) -> "ResourceList[T]":
-        """Filter resources by URL pattern.
+    @staticmethod
+    def _matcher(rule: "str | Pattern | ResourceFilter") -> Callable[[T], object]:
+        if isinstance(rule, ResourceFilter):
+            return rule.matches
+        if isinstance(rule, str):
+            rule = re_compile(rule)
+        if not isinstance(rule, Pattern):
+            raise TypeError(
+                f"Expected str, Pattern, or ResourceFilter, got {type(rule).__name__}"
+            )
+        search = rule.search
+        return lambda item: search(str(item.url))
+
+    def filter(self, pattern: "str | Pattern | ResourceFilter") -> "ResourceList[T]":
+        """Filter resources by URL pattern or a compiled ResourceFilter.
+
+        A ResourceFilter evaluates all of its include/exclude patterns and
+        predicates in a single pass, so prefer one combined filter over
+        chaining several filter() calls.
 
         Args:
-            pattern: String pattern or compiled regex Pattern to match against URLs
+            pattern: String pattern or compiled regex Pattern to match against
+                URLs, or a ResourceFilter
 
         Returns:
             New ResourceList containing only matching resources of the same type as original
+
+        Raises:
+            TypeError: If pattern is not a str, Pattern, or ResourceFilter
+        """
+        # T is preserved; items are already validated
+        return self._derive(filter(self._matcher(pattern), self._items))
+
+    def filter_iter(self, pattern: "str | Pattern | ResourceFilter") -> Iterator[T]:
+        """Lazily yield resources matching a URL pattern or ResourceFilter.
+
+        Unlike filter(), no intermediate list is built, so callers can stop
+        early or stream matches into another consumer.
+
+        Args:
+            pattern: String pattern or compiled regex Pattern to match against
+                URLs, or a ResourceFilter
+
+        Returns:
+            Iterator over matching resources in list order
+
+        Raises:
+            TypeError: If pattern is not a str, Pattern, or ResourceFilter
+        """
+        return filter(self._matcher(pattern), self._items)
+
+    @staticmethod
+    def _sort_key(key: str | Callable[[T], Any]) -> Callable[[T], Any]:
+        if isinstance(key, str):
+            return lambda item: item.sort_value(key)
+        if not callable(key):
+            raise TypeError(f"Expected str or callable key, got {type(key).__name__}")
+        return key
+
+    def _keyed(self, key: str | Callable[[T], Any]) -> list[tuple[Any, T]]:
+        """Pair every item with its sort value, computing each value once."""
+        get = self._sort_key(key)
+        return [(get(item), item) for item in self._items]
+
+    def sort_by(
+        self, key: str | Callable[[T], Any], reverse: bool = False
+    ) -> "ResourceList[T]":
+        """Return a copy of the list ordered by a field or key function.
+
+        String keys name a field and are resolved with Resource.sort_value(),
+        so sitemap entries sort by "lastmod" chronologically and by
+        "priority" numerically. Resources with no value for the key are
+        placed at the end in their original order, whatever the direction.
+        The sort is stable.
+
+        Args:
+            key: Field name or callable mapping a resource to a comparable value
+            reverse: Sort in descending order
+
+        Returns:
+            New ResourceList in sorted order
+
+        Raises:
+            TypeError: If key is neither a string nor callable
+        """
+        keyed = self._keyed(key)
+        present = [pair for pair in keyed if pair[0] is not None]
+        present.sort(key=itemgetter(0), reverse=reverse)
+        items = [item for _, item in present]
+        items.extend(item for value, item in keyed if value is None)
+        return ResourceList._wrap(items, self.indexed)
+
+    def top_k(
+        self, k: int, key: str | Callable[[T], Any], largest: bool = True
+    ) -> "ResourceList[T]":
+        """Select the k resources with the largest (or smallest) key values.
+
+        Uses a bounded heap, so selecting k items from n costs O(n log k)
+        rather than a full sort. Resources with no value for the key are
+        never selected. Ties keep their original order.
+
+        Args:
+            k: Maximum number of resources to return
+            key: Field name or callable, as for sort_by()
+            largest: Select the largest values (e.g. freshest lastmod) when
+                True, the smallest when False
+
+        Returns:
+            New ResourceList of at most k resources, best first
+
+        Raises:
+            TypeError: If k is not an integer or key is invalid
+            ValueError: If k is negative
+
+        Example:
+            >>> freshest = entries.top_k(10_000, "lastmod")
+            >>> important = entries.top_k(100, "priority")
+        """
+        if isinstance(k, bool) or not isinstance(k, int):
+            raise TypeError(f"k must be an integer, got {type(k).__name__}")
+        if k < 0:
+            raise ValueError("k cannot be negative")
+        get = self._sort_key(key)
+        pairs = (
+            (value, item) for item in self._items if (value := get(item)) is not None
+        )
+        select = nlargest if largest else nsmallest
+        return ResourceList._wrap(
+            [item for _, item in select(k, pairs, key=itemgetter(0))], self.indexed
+        )
+
+    def _derive(self, items: Iterable[T]) -> "ResourceList[T]":
+        """Build a result list with this list's indexing and spill settings.
+
+        Args:
+            items: Already validated resources; consumed lazily when this
+                list spills
+
+        Returns:
+            New ResourceList holding items
+        """
+        if isinstance(self._items, SpillStore):
+            return self._empty_like().extend(items, validate=False)
+        return ResourceList._wrap(list(items), self.indexed)
+
+    @property
+    def spilled(self) -> bool:
+        """Whether any resources are currently stored on disk."""
+        return isinstance(self._items, SpillStore) and self._items.spilled > 0
+
+    def close(self) -> None:
+        """Release the spill file, if any, and empty the list.
+
+        Lists that never spill hold no external resources, so calling this
+        is only needed to free disk space early; the spill file is also
+        removed when the list is garbage collected.
         """
-        if isinstance(pattern, str):
-            pattern = re_compile(pattern)
+        if isinstance(self._items, SpillStore):
+            self._items.close()
+        else:
+            self._items.clear()
+        if self._index is not None:
+            self._index.clear()
+
+    @property
+    def indexed(self) -> bool:
+        """Whether this list maintains a URL hash index."""
+        return self._index is not None
+
+    @staticmethod
+    def _lookup_key(item: object) -> str | None:
+        # The index is keyed by URL string, which Url also compares equal to
+        if isinstance(item, Resource):
+            return str(item.url)
+        if isinstance(item, (Url, str)):
+            return str(item)
+        return None
+
+    @staticmethod
+    def _key(item: T, canonical: bool) -> Url:
+        return item.url.canonical() if canonical else item.url
+
+    def index_of(self, item: Resource | Url | str) -> int:
+        """Find the position of the first resource with the given URL.
+
+        Args:
+            item: Resource, Url or URL string to look for
+
+        Returns:
+            Index of the first resource with a matching URL
+
+        Raises:
+            TypeError: If item is not a Resource, Url or string
+            ValueError: If no resource with that URL is in the list
+        """
+        key = self._lookup_key(item)
+        if key is None:
+            raise TypeError(
+                f"Expected Resource, Url, or str, got {type(item).__name__}"
+            )
+        if self._index is not None:
+            if key in self._index:
+                return self._index[key]
+        else:
+            for position, resource in enumerate(self._items):
+                if resource.url == key:
+                    return position
+        raise ValueError(f"{key} is not in ResourceList")
+
+    def _unique(
+        self,
+        items: Iterable[T],
+        canonical: bool,
+        include: Callable[[Url], bool] | None = None,
+    ) -> "ResourceList[T]":
+        """Build a list with one resource per URL key, in iteration order.
 
-        result = ResourceList[T]()  # More explicit generic parameter
+        Args:
+            items: Resources to consider
+            canonical: Key on canonical URLs instead of URLs as given
+            include: Optional predicate on the key deciding whether to keep
+                a resource
+
+        Returns:
+            New ResourceList with the same indexing mode as this one
+        """
+        seen: set[Url] = set()
+
+        def keep(item: T) -> bool:
+            key = self._key(item, canonical)
+            if key in seen or (include is not None and not include(key)):
+                return False
+            seen.add(key)
+            return True
+
+        return self._derive(filter(keep, items))
+
+    def _other_keys(
+        self, other: "ResourceList[T]", canonical: bool
+    ) -> Container[Url | str]:
+        if not isinstance(other, ResourceList):
+            raise TypeError(f"Expected ResourceList, got {type(other).__name__}")
+        if not canonical and other._index is not None:
+            return other._index  # reuse the existing index
+        return {self._key(item, canonical) for item in other}
+
+    def dedupe(self, canonical: bool = False) -> "ResourceList[T]":
+        """Remove resources with duplicate URLs, keeping the first occurrence.
+
+        Args:
+            canonical: Compare URLs in canonical form (see Url.canonical()),
+                so that variants such as a default port or tracking
+                parameters count as duplicates
+
+        Returns:
+            New ResourceList with one resource per URL, in original order
+        """
+        return self._unique(self._items, canonical)
+
+    def union(
+        self, other: "ResourceList[T]", canonical: bool = False
+    ) -> "ResourceList[T]":
+        """Combine two lists, keeping one resource per URL.
+
+        Args:
+            other: ResourceList to combine with
+            canonical: Compare URLs in canonical form
+
+        Returns:
+            New deduplicated ResourceList with this list's resources followed
+            by resources from other whose URLs were not already present
+
+        Raises:
+            TypeError: If other is not a ResourceList
+        """
+        if not isinstance(other, ResourceList):
+            raise TypeError(f"Expected ResourceList, got {type(other).__name__}")
+        return self._unique(chain(self._items, other._items), canonical)
+
+    def difference(
+        self, other: "ResourceList[T]", canonical: bool = False
+    ) -> "ResourceList[T]":
+        """Find resources whose URLs are not in another list.
+
+        Args:
+            other: ResourceList of URLs to exclude
+            canonical: Compare URLs in canonical form
+
+        Returns:
+            New deduplicated ResourceList of resources from this list whose
+            URLs do not appear in other
+
+        Raises:
+            TypeError: If other is not a ResourceList
+        """
+        exclude = self._other_keys(other, canonical)
+        return self._unique(self._items, canonical, lambda key: key not in exclude)
+
+    def intersection(
+        self, other: "ResourceList[T]", canonical: bool = False
+    ) -> "ResourceList[T]":
+        """Find resources whose URLs are also in another list.
+
+        Args:
+            other: ResourceList of URLs to keep
+            canonical: Compare URLs in canonical form
+
+        Returns:
+            New deduplicated ResourceList of resources from this list whose
+            URLs also appear in other
+
+        Raises:
+            TypeError: If other is not a ResourceList
+        """
+        keep = self._other_keys(other, canonical)
+        return self._unique(self._items, canonical, lambda key: key in keep)
+
+    def _empty_like(self) -> "ResourceList[T]":
+        """Create an empty list with this list's indexing and spill settings."""
+        if isinstance(self._items, SpillStore):
+            return ResourceList(
+                indexed=self.indexed,
+                spill_threshold=self._items.threshold,
+                spill_dir=self._items.directory,
+            )
+        return ResourceList(indexed=self.indexed)
+
+    def group_by_base(self) -> dict[str, "ResourceList[T]"]:
+        """Group resources by base URL (scheme and netloc).
+
+        Groups use the same key as ContextManager, so each group can be
+        handed to the context bound for that site.
+
+        Returns:
+            Dictionary mapping each base URL to a ResourceList of its
+            resources, in order of first appearance
+        """
+        groups: dict[str, list[T]] = {}
         for item in self._items:
-            if pattern.search(str(item.url)):
-                result.append(item)  # T is preserved
-        return result
+            base = item.url.base
+            group = groups.get(base)
+            if group is None:
+                groups[base] = group = []
+            group.append(item)
+        return {
+            base: ResourceList._wrap(items, self.indexed)
+            for base, items in groups.items()
+        }
+
+    @staticmethod
+    def _host_key(item: T) -> str:
+        url = item.url
+        return url.base if url.scheme == "file" else url.hostname
+
+    @staticmethod
+    def shard_for(key: str, n: int) -> int:
+        """Map a key to one of n shards with a jump consistent hash.
+
+        The result depends only on the key and n, so separate processes or
+        machines agree on it without coordination. When n grows, only about
+        1/n of keys move to a different shard.
+
+        Args:
+            key: Key to place, typically a hostname
+            n: Number of shards
+
+        Returns:
+            Shard number in range(n)
+
+        Raises:
+            TypeError: If n is not an integer
+            ValueError: If n is less than 1
+        """
+        if isinstance(n, bool) or not isinstance(n, int):
+            raise TypeError(f"n must be an integer, got {type(n).__name__}")
+        if n < 1:
+            raise ValueError("n must be at least 1")
+        # Python's hash() is salted per process, so use a stable digest
+        seed = int.from_bytes(blake2b(key.encode(), digest_size=8).digest(), "big")
+        # Jump consistent hash (Lamping and Veach, 2014)
+        bucket, candidate = -1, 0
+        while candidate < n:
+            bucket = candidate
+            seed = (seed * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+            candidate = int((bucket + 1) * ((1 << 31) / ((seed >> 33) + 1)))
+        return bucket
+
+    def partition(
+        self, n: int, key: Callable[[T], str] | None = None
+    ) -> list["ResourceList[T]"]:
+        """Split the list into n disjoint parts by a consistent hash.
+
+        By default resources are placed by hostname, so every resource for
+        a host ends up in the same part. Workers that each own one part
+        never share a domain, and therefore never share politeness state
+        such as rate limits or robots.txt.
+
+        Args:
+            n: Number of parts
+            key: Callable mapping a resource to the string to hash
+                (default: the URL hostname)
+
+        Returns:
+            List of n ResourceLists, some possibly empty, each keeping the
+            original relative order
+
+        Raises:
+            TypeError: If n is not an integer or key is not callable
+            ValueError: If n is less than 1
+
+        Example:
+            >>> parts = resources.partition(4)
+            >>> mine = parts[worker_id]
+            >>> # Or, without materialising other workers' parts:
+            >>> mine = resources.filter(ResourceFilter(predicates=[
+            ...     lambda r: ResourceList.shard_for(r.url.hostname, 4) == worker_id
+            ... ]))
+        """
+        if key is None:
+            key = self._host_key
+        elif not callable(key):
+            raise TypeError(f"Expected callable key, got {type(key).__name__}")
+        shard_for = self.shard_for
+        shard_for("", n)  # validate n even when the list is empty
+        parts = [self._empty_like() for _ in range(n)]
+        # Many resources share a host, so hash each key only once
+        shards: dict[str, int] = {}
+        for item in self._items:
+            value = key(item)
+            shard = shards.get(value)
+            if shard is None:
+                shards[value] = shard = shard_for(value, n)
+            parts[shard].append(item)
+        return parts
+
+    def view(
+        self,
+        start: int | None = None,
+        stop: int | None = None,
+        step: int | None = None,
+    ) -> "ResourceListView[T]":
+        """Get a read-only window onto part of the list without copying it.
+
+        Arguments follow slice semantics and are resolved against the
+        current length, so items appended later are not part of the view.
+
+        Args:
+            start: First position (default: beginning)
+            stop: Position to stop before (default: end)
+            step: Step between positions (default: 1)
+
+        Returns:
+            ResourceListView over the selected positions
+
+        Example:
+            >>> first_page = resources.view(0, 1000)
+            >>> for resource in first_page:
+            ...     print(resource.url)
+        """
+        positions = range(len(self._items))[slice(start, stop, step)]
+        return ResourceListView(self._items, positions)
 
     def to_list(self) -> list[T]:
         """Convert to a standard Python list.
@@ -128,3 +701,118 @@ class ResourceList(Generic[T]):
             A copy of the internal list of resources
         """
         return self._items.copy()
+
+    def save(self, target: "str | PathLike | IO[str]") -> int:
+        """Write the resources to a JSON Lines file.
+
+        Resources are streamed to the file one at a time, so spilled lists
+        are not read back into memory.
+
+        Args:
+            target: Path or open text file (see ResourceWriter)
+
+        Returns:
+            Number of resources written
+        """
+        with ResourceWriter(target) as writer:
+            return writer.write_all(self._items)
+
+    @classmethod
+    def load(
+        cls,
+        source: "str | PathLike | IO[str]",
+        validate: bool = True,
+        indexed: bool = False,
+        spill_threshold: int | None = None,
+        spill_dir: str | None = None,
+    ) -> "ResourceList":
+        """Read a list written by save() or ResourceWriter.
+
+        Args:
+            source: Path or open text file (see ResourceReader)
+            validate: Run field validation on every resource. Pass False for
+                trusted checkpoints to skip the validators entirely.
+            indexed: Maintain a URL index in the loaded list
+            spill_threshold: Spill the loaded list past this many resources
+            spill_dir: Directory for the spill file
+
+        Returns:
+            New ResourceList with resources restored to their original types
+
+        Raises:
+            ValueError: If the file is not a valid resource file
+        """
+        result = cls(
+            indexed=indexed, spill_threshold=spill_threshold, spill_dir=spill_dir
+        )
+        with ResourceReader(source, validate=validate) as reader:
+            # The reader only produces Resources, which is what T is bound to
+            result.extend(cast(Iterable[T], reader), validate=False)
+        return result
+
+
+class ResourceListView(Generic[T]):
+    """Read-only, non-copying window onto the items of a ResourceList.
+
+    Views are created with ResourceList.view(). They share storage with the
+    list they were taken from, so creating one is constant time regardless
+    of size. Slicing a view returns another view.
+
+    Example:
+        >>> view = resources.view(10, 20)
+        >>> len(view)
+        10
+        >>> view[::2].to_resource_list()
+        ResourceList([...])
+    """
+
+    def __init__(self, items: "list[T] | SpillStore[T]", positions: range):
+        """Initialize a view over selected positions of a list.
+
+        Args:
+            items: The backing list of a ResourceList
+            positions: Positions within items that the view exposes
+        """
+        self._items = items
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[T]:
+        positions = self._positions
+        if positions.step == 1:
+            return islice(self._items, positions.start, positions.stop)
+        return map(self._items.__getitem__, positions)
+
+    def __getitem__(self, index: int | slice) -> T | "ResourceListView[T]":
+        """Get items by index or slice.
+
+        Args:
+            index: Integer index or slice object, relative to the view
+
+        Returns:
+            Single Resource when indexed with integer, ResourceListView when sliced
+        """
+        if isinstance(index, slice):
+            return ResourceListView(self._items, self._positions[index])
+        return self._items[self._positions[index]]
+
+    def __repr__(self) -> str:
+        return f"ResourceListView({repr(self.to_list())})"
+
+    def to_list(self) -> list[T]:
+        """Copy the viewed items into a standard Python list.
+
+        Returns:
+            A new list of the resources in the view
+        """
+        return list(self)
+
+    def to_resource_list(self) -> ResourceList[T]:
+        """Copy the viewed items into a new ResourceList.
+
+        Returns:
+            A new ResourceList of the resources in the view
+        """
+        return ResourceList._wrap(self.to_list())
@@ -0,0 +1,210 @@
+from array import array
+from json import dumps, loads
+from tempfile import TemporaryFile
+from threading import RLock
+from typing import IO, Generic, Iterable, Iterator, TypeVar, cast, overload
+
+from ethicrawl.core.resource import Resource
+
+T = TypeVar("T", bound=Resource)
+
+# Records read from disk per lock acquisition while iterating
+READ_BATCH = 1024
+
+
+class SpillStore(Generic[T]):
+    """Append-only sequence that moves items to a temporary file.
+
+    Items are kept in an in-memory tail until it holds ``threshold`` of
+    them, at which point the tail is written to an anonymous temporary
+    file, one JSON record per item (see Resource.to_dict()), and cleared.
+    Only the byte offset of each spilled record stays in memory (8 bytes
+    per item), so memory use is bounded by the threshold rather than the
+    number of items.
+
+    Items must be JSON serialisable through to_dict(). An append whose
+    spill fails raises and leaves the store as it was before the append.
+
+    Spilled items are read back lazily: iteration streams records from the
+    file in batches, and indexing reads a single record. Objects read back
+    are new copies, so mutating them does not change the stored item.
+
+    The file is private to the process and removed when the store is
+    closed or garbage collected.
+
+    Attributes:
+        threshold: Number of items held in memory before spilling
+        directory: Directory for the temporary file (None uses the system
+            default)
+    """
+
+    def __init__(self, threshold: int, directory: str | None = None) -> None:
+        """Initialize an empty store.
+
+        Args:
+            threshold: Number of items to hold in memory before spilling
+            directory: Directory for the temporary file
+
+        Raises:
+            TypeError: If threshold is not an integer
+            ValueError: If threshold is less than 1
+        """
+        if isinstance(threshold, bool) or not isinstance(threshold, int):
+            raise TypeError(
+                f"spill_threshold must be an integer, got {type(threshold).__name__}"
+            )
+        if threshold < 1:
+            raise ValueError("spill_threshold must be at least 1")
+        self.threshold = threshold
+        self.directory = directory
+        self._tail: list[T] = []
+        # offsets[i] is where record i starts; the last entry is the file end
+        self._offsets = array("q", [0])
+        self._file: IO[bytes] | None = None
+        self._lock = RLock()
+
+    @property
+    def spilled(self) -> int:
+        """Number of items currently stored on disk."""
+        return len(self._offsets) - 1
+
+    def __len__(self) -> int:
+        return self.spilled + len(self._tail)
+
+    def append(self, item: T) -> None:
+        with self._lock:
+            self._tail.append(item)
+            if len(self._tail) >= self.threshold:
+                try:
+                    self._flush()
+                except BaseException:
+                    self._tail.pop()
+                    raise
+
+    def extend(self, items: Iterable[T]) -> None:
+        if items is self:
+            items = self._iter_range(0, len(self))
+        for item in items:
+            self.append(item)
+
+    def _flush(self) -> None:
+        """Write the in-memory tail to the spill file.
+
+        Nothing changes unless the whole tail is serialised and written.
+        """
+        # Serialise everything first, so a bad item leaves no trace
+        chunks = [dumps(item.to_dict()).encode("utf-8") for item in self._tail]
+        if self._file is None:
+            self._file = TemporaryFile(dir=self.directory)
+        start = self._offsets[-1]
+        # Write at the end of the last complete record, over anything a
+        # failed write may have left behind
+        self._file.seek(start)
+        self._file.write(b"".join(chunks))
+        position = start
+        for chunk in chunks:
+            position += len(chunk)
+            self._offsets.append(position)
+        self._tail.clear()
+
+    def _read(self, start: int, stop: int) -> list[T]:
+        """Read spilled records start..stop-1; the caller holds the lock."""
+        if self._file is None:
+            return []
+        offsets = self._offsets
+        base = offsets[start]
+        self._file.seek(base)
+        data = self._file.read(offsets[stop] - base)
+        # Records were written by to_dict() from validated resources
+        return [
+            cast(
+                T,
+                Resource.from_dict(
+                    loads(data[offsets[i] - base : offsets[i + 1] - base]),
+                    validate=False,
+                ),
+            )
+            for i in range(start, stop)
+        ]
+
+    def _iter_range(self, start: int, stop: int | None = None) -> Iterator[T]:
+        """Yield items from start up to stop, or to the current end if None.
+
+        The lock is only held while a batch is fetched, so other threads
+        can append while an iteration is in progress.
+        """
+        position = start
+        while stop is None or position < stop:
+            with self._lock:
+                spilled = self.spilled
+                end = len(self) if stop is None else min(stop, len(self))
+                if position >= end:
+                    return
+                if position < spilled:
+                    batch_end = min(end, spilled, position + READ_BATCH)
+                    batch = self._read(position, batch_end)
+                else:
+                    batch = self._tail[position - spilled : end - spilled]
+            yield from batch
+            position += len(batch)
+
+    def __iter__(self) -> Iterator[T]:
+        return self._iter_range(0)
+
+    def iter_from(self, start: int) -> Iterator[T]:
+        """Stream items from position start to the end, reading in batches.
+
+        Args:
+            start: First position to yield
+
+        Returns:
+            Iterator over the items
+        """
+        return self._iter_range(start)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        """Get an item by position, or a list of items for a slice.
+
+        Args:
+            index: Integer position or slice
+
+        Returns:
+            The item, or a list of items when sliced
+        """
+        with self._lock:
+            length = len(self)
+            if isinstance(index, slice):
+                start, stop, step = index.indices(length)
+                if step == 1:
+                    return list(self._iter_range(start, max(start, stop)))
+                return [self[i] for i in range(start, stop, step)]
+            if index < 0:
+                index += length
+            if not 0 <= index < length:
+                raise IndexError("SpillStore index out of range")
+            spilled = self.spilled
+            if index < spilled:
+                return self._read(index, index + 1)[0]
+            return self._tail[index - spilled]
+
+    def copy(self) -> list[T]:
+        """Read every item into a regular list."""
+        return list(self._iter_range(0, len(self)))
+
+    def close(self) -> None:
+        """Delete the spill file and drop all items."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._offsets = array("q", [0])
+            self._tail.clear()
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
@@ -1,10 +1,129 @@
-from functools import wraps
-from socket import gaierror, gethostbyname
+from fnmatch import fnmatchcase
+from functools import lru_cache, wraps
 from typing import Any, Union
 from urllib import parse
 
 from ethicrawl.error import DomainResolutionError
 
+from .resolver import Resolver
+
+# Number of distinct URL strings whose parse results are kept for reuse
+URL_PARSE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=URL_PARSE_CACHE_SIZE)
+def _parse(url: str) -> parse.ParseResult:
+    """Parse a URL string, reusing the result for repeated strings.
+
+    ParseResult is an immutable named tuple, so a single instance can be
+    shared by every Url built from the same string.
+
+    Args:
+        url: URL string to parse
+
+    Returns:
+        The parsed URL components
+    """
+    return parse.urlparse(url)
+
+
+# Ports implied by the scheme, dropped during canonicalisation
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Query parameters that identify a campaign or click rather than a resource
+TRACKING_PARAMS = (
+    "utm_*",
+    "gclid",
+    "dclid",
+    "fbclid",
+    "msclkid",
+    "mc_cid",
+    "mc_eid",
+    "_ga",
+)
+
+
+def _remove_dot_segments(path: str) -> str:
+    """Resolve "." and ".." path segments as described in RFC 3986 section 5.2.4.
+
+    Args:
+        path: URL path, possibly containing dot segments
+
+    Returns:
+        The path with all dot segments resolved
+    """
+    segments = path.split("/")
+    output: list[str] = []
+    for segment in segments:
+        if segment == "..":
+            # Never pop the empty segment that represents the leading slash
+            if len(output) > 1:
+                output.pop()
+        elif segment != ".":
+            output.append(segment)
+    # A trailing dot segment refers to a directory, so keep the trailing slash
+    if segments[-1] in (".", ".."):
+        output.append("")
+    return "/".join(output)
+
+
+@lru_cache(maxsize=URL_PARSE_CACHE_SIZE)
+def _canonicalise(
+    url: str,
+    lowercase: bool,
+    drop_default_port: bool,
+    resolve_dots: bool,
+    sort_query: bool,
+    drop_fragment: bool,
+    strip_params: tuple[str, ...],
+) -> str:
+    """Build the canonical string form of a URL; see Url.canonical()."""
+    parsed = _parse(url)
+    scheme = parsed.scheme.lower() if lowercase else parsed.scheme
+    path = parsed.path
+
+    if scheme not in DEFAULT_PORTS:
+        # file:// URLs only have a path worth normalising
+        if resolve_dots:
+            path = _remove_dot_segments(path)
+        return parse.urlunparse(parsed._replace(scheme=scheme, path=path))
+
+    # Rebuild the network location from its parts
+    userinfo, _, hostport = parsed.netloc.rpartition("@")
+    port = parsed.port  # raises ValueError for invalid ports
+    if lowercase:
+        host = parsed.hostname or ""
+        if ":" in host:  # IPv6 literal
+            host = f"[{host}]"
+    else:
+        host = hostport.rsplit(":", 1)[0] if port is not None else hostport
+    if port is not None and not (drop_default_port and port == DEFAULT_PORTS[scheme]):
+        host = f"{host}:{port}"
+    netloc = f"{userinfo}@{host}" if userinfo else host
+
+    if resolve_dots:
+        path = _remove_dot_segments(path) or "/"
+
+    query = parsed.query
+    if query and (sort_query or strip_params):
+        pairs = parse.parse_qsl(query, keep_blank_values=True)
+        if strip_params:
+            pairs = [
+                (name, value)
+                for name, value in pairs
+                if not any(
+                    fnmatchcase(name.lower(), pattern.lower())
+                    for pattern in strip_params
+                )
+            ]
+        if sort_query:
+            pairs.sort()
+        query = parse.urlencode(pairs)
+
+    fragment = "" if drop_fragment else parsed.fragment
+
+    return parse.urlunparse((scheme, netloc, path, parsed.params, query, fragment))
+
 
 def http_only(func):
 
@@ -28,6 +147,10 @@ class Url:
     Supports HTTP, HTTPS, and file URL schemes with validation and component access.
     Path extension and query parameter manipulation are provided through the extend() method.
 
+    Parse results are cached per URL string, and the string form and hash are
+    computed once at construction. Constructing a Url from another Url reuses
+    the already parsed components.
+
     Attributes:
         scheme: URL scheme (http, https, file)
         netloc: Network location/domain (HTTP/HTTPS only)
@@ -43,46 +166,54 @@ class Url:
         ValueError: When provided with invalid URLs or when performing invalid operations
     """
 
+    _parsed: parse.ParseResult
+    _str: str
+    _hash: int
+
     def __init__(self, url: Union[str, "Url"], validate: bool = False):
         """Initialize a URL object with parsing and optional validation.
 
         Args:
             url: String or Url object to parse
-            validate: If True, performs additional validation including DNS resolution
+            validate: If True, performs additional validation including DNS
+                resolution through the default Resolver (results are cached)
 
         Raises:
             ValueError: When the URL has an invalid scheme or missing required components
             ValueError: When validate=True and the hostname cannot be resolved
         """
         if isinstance(url, Url):
-            url = str(url)
+            # Already parsed and checked; share the components instead of re-parsing
+            self._parsed = url._parsed
+            self._str = url._str
+            self._hash = url._hash
+        else:
+            self._parsed = _parse(url)
 
-        self._parsed = parse.urlparse(url)
+            # Basic validation
+            if self._parsed.scheme not in ["file", "http", "https"]:
+                raise ValueError(f"Only File and HTTP(S) URLs supported: {url}")
 
-        # Basic validation
-        if self._parsed.scheme not in ["file", "http", "https"]:
-            raise ValueError(f"Only File and HTTP(S) URLs supported: {url}")
+            # For HTTP/HTTPS URLs, ensure netloc exists
+            if self._parsed.scheme in ["http", "https"] and not self._parsed.netloc:
+                raise ValueError(f"Invalid HTTP URL (missing domain): {url}")
 
-        # For HTTP/HTTPS URLs, ensure netloc exists
-        if self._parsed.scheme in ["http", "https"] and not self._parsed.netloc:
-            raise ValueError(f"Invalid HTTP URL (missing domain): {url}")
+            # For file URLs, ensure path exists
+            if self._parsed.scheme == "file" and not self._parsed.path:
+                raise ValueError(f"Invalid file URL (missing path): {url}")
 
-        # For file URLs, ensure path exists
-        if self._parsed.scheme == "file" and not self._parsed.path:
-            raise ValueError(f"Invalid file URL (missing path): {url}")
+            # String form and hash are used constantly for comparisons; compute once
+            self._str = self._parsed.geturl()
+            self._hash = hash(self._str)
 
         # Domain resolution validation (for HTTP/HTTPS only)
         if validate and self._parsed.scheme in ["http", "https"]:
-            try:
-                gethostbyname(str(self._parsed.hostname))
-            except gaierror as exc:
-                # Raise a DomainResolutionError instead of ValueError
+            hostname = str(self._parsed.hostname)
+            if Resolver.default().resolve(hostname) is None:
                 raise DomainResolutionError(
                     str(self),  # Pass the full URL string
-                    str(
-                        self._parsed.hostname
-                    ),  # Pass the hostname that failed resolution
-                ) from exc
+                    hostname,  # Pass the hostname that failed resolution
+                )
 
     @property
     def base(self) -> str:
@@ -164,7 +295,7 @@ class Url:
         Returns:
             Complete URL string
         """
-        return self._parsed.geturl()
+        return self._str
 
     def __eq__(self, other: Any) -> bool:
         """Compare URLs for equality.
@@ -176,9 +307,9 @@ class Url:
             True if URLs are equal, False otherwise
         """
         if isinstance(other, Url):
-            return str(self) == str(other)
+            return self._hash == other._hash and self._str == other._str
         elif isinstance(other, str):
-            return str(self) == other
+            return self._str == other
         return False
 
     def __hash__(self) -> int:
@@ -190,7 +321,55 @@ class Url:
         Returns:
             Integer hash value
         """
-        return hash(str(self))
+        return self._hash
+
+    def canonical(
+        self,
+        lowercase: bool = True,
+        drop_default_port: bool = True,
+        resolve_dots: bool = True,
+        sort_query: bool = True,
+        drop_fragment: bool = True,
+        strip_params: tuple[str, ...] = TRACKING_PARAMS,
+    ) -> "Url":
+        """Return a normalised form of this URL for deduplication and cache keys.
+
+        URLs that differ only in ways that do not change the resource they
+        identify produce the same canonical Url. Each rule can be disabled
+        individually. Results are cached, so repeated calls are cheap.
+
+        Args:
+            lowercase: Lowercase the scheme and host
+            drop_default_port: Remove :80 from http and :443 from https URLs
+            resolve_dots: Resolve "." and ".." path segments; an empty
+                HTTP(S) path becomes "/"
+            sort_query: Sort query parameters by name and value
+            drop_fragment: Remove the #fragment
+            strip_params: fnmatch-style patterns of query parameter names to
+                remove, matched case-insensitively. Defaults to common
+                tracking parameters such as utm_*. Pass () to keep all.
+
+        Returns:
+            A new Url in canonical form
+
+        Raises:
+            ValueError: If the URL contains an invalid port
+
+        Example:
+            >>> Url("HTTP://Example.com:80/a/../b?y=2&x=1#frag").canonical()
+            Url("http://example.com/b?x=1&y=2")
+        """
+        return Url(
+            _canonicalise(
+                self._str,
+                lowercase,
+                drop_default_port,
+                resolve_dots,
+                sort_query,
+                drop_fragment,
+                tuple(strip_params),
+            )
+        )
 
     @http_only
     def _extend_with_params(self, params: dict[str, Any]) -> "Url":
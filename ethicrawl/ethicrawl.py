@@ -56,6 +56,12 @@ class Ethicrawl:
         >>> # Find URLs in sitemap
         >>> urls = ethicrawl.sitemaps.parse()
         >>> ethicrawl.unbind()  # Clean up when done
+
+        Or, to unbind automatically:
+
+        >>> with Ethicrawl() as ethicrawl:
+        ...     ethicrawl.bind("https://example.com")
+        ...     response = ethicrawl.get("https://example.com/about")
     """
 
     def bind(self, url: str | Url | Resource, client: Client | None = None) -> bool:
@@ -77,7 +83,7 @@ class Ethicrawl:
         """
         if isinstance(url, Resource):
             url = url.url
-        url = Url(str(url), validate=True)
+        url = Url(url, validate=True)
         resource = Resource(url)
 
         if not self.bound:
@@ -94,7 +100,9 @@ class Ethicrawl:
         """Unbind the ethicrawl from its current site.
 
         This releases resources and allows the ethicrawl to be bound to a different site.
-        It removes all domain contexts, cached resources, and resets the ethicrawl state.
+        It closes the clients of all bound domains, quitting (or releasing for
+        reuse) any Chrome browsers, removes all domain contexts and cached
+        resources, and resets the ethicrawl state.
 
         Returns:
             bool: True if unbinding was successful
@@ -103,6 +111,8 @@ class Ethicrawl:
         if self.bound:
             domain = self._context.resource.url.netloc
             self.logger.info("Unbinding from %s", domain)
+            self._context_manager.close()
+            self._default_client.close()
 
         private_attrs = [attr for attr in vars(self) if attr.startswith("_")]
 
@@ -113,6 +123,12 @@ class Ethicrawl:
         # Verify unbinding was successful
         return not hasattr(self, "_root_domain")
 
+    def __enter__(self) -> "Ethicrawl":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.unbind()
+
     @ensure_bound
     def whitelist(self, url: str | Url, client: HttpClient | None = None) -> bool:
         """Add a domain to the whitelist.
@@ -219,7 +235,7 @@ class Ethicrawl:
         if isinstance(url, Resource):
             resource = url
         elif isinstance(url, (str, Url)):
-            resource = Resource(Url(str(url)))
+            resource = Resource(Url(url))
         else:
             raise TypeError(
                 f"Expected string, Url, or Resource, got {type(url).__name__}"
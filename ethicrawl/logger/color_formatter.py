@@ -2,8 +2,19 @@ import logging
 from typing import Literal
 from colorama import Fore, Style, init
 
-# Initialize colorama (this handles Windows terminals properly)
-init(autoreset=True)
+_colorama_initialized = False
+
+
+def _init_colorama() -> None:
+    """Initialize colorama once, when colors are first used.
+
+    Done lazily rather than at import time, as init() wraps sys.stdout and
+    sys.stderr (this handles Windows terminals properly).
+    """
+    global _colorama_initialized
+    if not _colorama_initialized:
+        init(autoreset=True)
+        _colorama_initialized = True
 
 
 class ColorFormatter(logging.Formatter):
@@ -66,6 +77,8 @@ class ColorFormatter(logging.Formatter):
         """
         super().__init__(fmt, datefmt, style)
         self.use_colors = use_colors
+        if use_colors:
+            _init_colorama()
 
     def format(self, record):
         """Format the log record with colored level name if enabled.
@@ -1,16 +1,24 @@
 # import logging
 
-from logging import WARNING, FileHandler, Formatter
+from atexit import register
+from logging import WARNING, FileHandler, Formatter, Handler
 from logging import Logger as LoggingLogger
 from logging import StreamHandler, getLogger
 from os import makedirs, path
-from re import sub
+from queue import Queue
+from re import compile as re_compile
 from sys import stdout
 
-from ethicrawl.config import Config
+from ethicrawl.config import BaseConfig, Config
 from ethicrawl.core import Resource
 
 from .color_formatter import ColorFormatter
+from .queue_handler import BoundedQueueHandler, DrainingQueueListener
+
+_INVALID_CHARS = re_compile(r"[^a-zA-Z0-9_\-\.]")
+_REPEATED_DOTS = re_compile(r"\.{2,}")
+_REPEATED_UNDERSCORES = re_compile(r"\_{2,}")
+_EDGE_DOTS = re_compile(r"^\.|\.$")
 
 
 class Logger:
@@ -23,6 +31,7 @@ class Logger:
     - Component-specific log levels
     - Console output with optional color formatting
     - File output with configurable paths
+    - Optional background thread for writing output (queue_enabled)
     - Initialization management to prevent duplicate configuration
 
     The Logger class is designed as a static utility class rather than being instantiated.
@@ -45,6 +54,12 @@ class Logger:
     # Cache for handlers to avoid duplicate creation
     _console_handler = None
     _file_handler = None
+    _queue_handler: BoundedQueueHandler | None = None
+    _queue_listener: DrainingQueueListener | None = None
+
+    # Resolved loggers by (base URL, component), valid for one config generation
+    _cache: dict[tuple[str, str | None], LoggingLogger] = {}
+    _cache_generation = -1
 
     @staticmethod
     def setup_logging() -> None:
@@ -60,6 +75,7 @@ class Logger:
         - Main application logger with configured level
         - Console output (if enabled)
         - File output (if enabled)
+        - Queue handler and listener thread (if queue_enabled)
         - Component-specific log levels
 
         This method is idempotent - calling it multiple times has no effect
@@ -76,6 +92,7 @@ class Logger:
         root_logger.setLevel(WARNING)  # Default level for non-app loggers
 
         # Remove existing handlers to avoid duplicates on re-initialization
+        Logger._stop_listener()
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
 
@@ -87,12 +104,13 @@ class Logger:
             console_formatter = Formatter(log_config.format)
 
         file_formatter = Formatter(log_config.format)
+        handlers: list[Handler] = []
 
         # Set up console logging if enabled
         if log_config.console_enabled:
             console = StreamHandler(stdout)
             console.setFormatter(console_formatter)
-            root_logger.addHandler(console)
+            handlers.append(console)
             Logger._console_handler = console
 
         # Set up file logging if enabled
@@ -104,9 +122,27 @@ class Logger:
 
             file_handler = FileHandler(log_config.file_path)
             file_handler.setFormatter(file_formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
             Logger._file_handler = file_handler
 
+        if log_config.queue_enabled and handlers:
+            # Output handlers run on the listener thread; loggers only
+            # pay for putting the record on the queue
+            queue: Queue = Queue(log_config.queue_size)
+            listener = DrainingQueueListener(
+                queue, *handlers, respect_handler_level=True
+            )
+            queue_handler = BoundedQueueHandler(
+                queue, log_config.queue_drop_level, listener
+            )
+            listener.start()
+            root_logger.addHandler(queue_handler)
+            Logger._queue_handler = queue_handler
+            Logger._queue_listener = listener
+        else:
+            for handler in handlers:
+                root_logger.addHandler(handler)
+
         # Configure the main application logger
         app_logger = getLogger(__name__.split(".")[0])  # 'ethicrawl'
         app_logger.setLevel(log_config.level)
@@ -133,13 +169,13 @@ class Logger:
             A cleaned string suitable for use as a logger name
         """
         # Replace invalid characters with underscores
-        name = sub(r"[^a-zA-Z0-9_\-\.]", "_", name)
+        name = _INVALID_CHARS.sub("_", name)
         # Replace consecutive dots with a single dot
-        name = sub(r"\.{2,}", ".", name)
+        name = _REPEATED_DOTS.sub(".", name)
         # Replace consecutive underscores with a single underscore
-        name = sub(r"\_{2,}", "_", name)
+        name = _REPEATED_UNDERSCORES.sub("_", name)
         # Remove leading and trailing dots
-        name = sub(r"^\.|\.$", "", name)
+        name = _EDGE_DOTS.sub("", name)
         return name or "unnamed"
 
     @staticmethod
@@ -149,6 +185,10 @@ class Logger:
         Creates or retrieves a logger with a hierarchical name based on the resource URL
         and optional component. Automatically initializes logging if not already done.
 
+        Loggers are cached by base URL and component, so repeated calls only
+        cost a dictionary lookup. The cache is dropped whenever the
+        configuration changes, so new component levels still apply.
+
         Args:
             resource: The resource to create a logger for
             component: Optional component name (e.g., "robots", "sitemaps")
@@ -165,9 +205,19 @@ class Logger:
         if not Logger._initialized:
             Logger.setup_logging()
 
+        key = (resource.url.base, component)
+        generation = BaseConfig._generation
+        if Logger._cache_generation == generation:
+            cached = Logger._cache.get(key)
+            if cached is not None:
+                return cached
+        else:
+            Logger._cache = {}
+            Logger._cache_generation = generation
+
         prefix = __name__.split(".")[0]
 
-        base = resource.url.base.replace(".", "_")
+        base = key[0].replace(".", "_")
 
         # Build the logger name
         if component:
@@ -182,12 +232,36 @@ class Logger:
         logger = getLogger(logger_name)
 
         # Apply component-specific log level if applicable
-        config = Config()
-        if component and component in config.logger.component_levels:
-            logger.setLevel(config.logger.component_levels[component])
+        if component:
+            level = Config().logger.component_levels.get(component)
+            if level is not None:
+                logger.setLevel(level)
 
+        Logger._cache[key] = logger
         return logger
 
+    @staticmethod
+    def flush() -> None:
+        """Wait until queued log records have been written.
+
+        Does nothing when queue_enabled is False, since records are then
+        written as they are logged.
+        """
+        listener = Logger._queue_listener
+        if listener is not None:
+            # stop() returns once the listener has handled every record
+            # queued before it; then carry on with a fresh thread
+            listener.stop()
+            listener.start()
+
+    @staticmethod
+    def _stop_listener() -> None:
+        """Stop the background listener after writing queued records."""
+        listener = Logger._queue_listener
+        if listener is not None:
+            Logger._queue_listener = None
+            listener.stop()
+
     @staticmethod
     def reset() -> None:
         """Reset logging configuration to initial state.
@@ -200,11 +274,19 @@ class Logger:
             >>> def setUp(self):
             >>>     Logger.reset()  # Ensure clean logging state
         """
+        Logger._stop_listener()
         Logger._initialized = False
         Logger._console_handler = None
         Logger._file_handler = None
+        Logger._queue_handler = None
+        Logger._cache = {}
+        Logger._cache_generation = -1
 
         # Reset the root logger
         root = getLogger()
         for handler in root.handlers[:]:
             root.removeHandler(handler)
+
+
+# Write out anything still queued when the interpreter exits
+register(Logger._stop_listener)
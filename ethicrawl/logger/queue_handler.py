@@ -0,0 +1,122 @@
+from logging import DEBUG, WARNING, LogRecord, makeLogRecord
+from logging.handlers import QueueHandler, QueueListener
+from queue import Empty, Full, Queue
+from threading import Lock
+from typing import cast
+
+
+class DrainingQueueListener(QueueListener):
+    """QueueListener that can be stopped while its queue is full.
+
+    QueueListener.stop() queues its stop marker with put_nowait(), which
+    raises queue.Full when a bounded queue has no room. This listener
+    waits for room instead, and once stopped handles any records queued
+    after the marker, so none are left behind.
+
+    Attributes:
+        running: Whether the listener thread is handling records
+    """
+
+    def __init__(self, queue: Queue, *handlers, respect_handler_level=False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.running = False
+
+    def start(self) -> None:
+        super().start()
+        self.running = True
+
+    def stop(self) -> None:
+        # Handlers see records directly from now on; see BoundedQueueHandler
+        self.running = False
+        super().stop()
+        queue = cast(Queue, self.queue)
+        while True:
+            try:
+                record = queue.get_nowait()
+            except Empty:
+                break
+            if record is not None:  # None is QueueListener's stop marker
+                self.handle(record)
+
+    def enqueue_sentinel(self) -> None:
+        # The listener thread is still running, so room will come
+        cast(Queue, self.queue).put(None)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler for a bounded queue that sheds low-priority records.
+
+    Records at or below drop_level are discarded if the queue is full,
+    so a slow console or disk cannot stall the threads that log them.
+    More important records wait for room instead. The number of dropped
+    records is reported with a warning once the queue has space again.
+
+    While the listener is stopped (during Logger.flush(), or for good
+    once the interpreter starts exiting) nothing reads the queue, so
+    records are handed to the listener's handlers directly instead.
+
+    Attributes:
+        drop_level: Highest level that may be dropped
+        dropped: Total number of records dropped so far
+    """
+
+    def __init__(
+        self,
+        queue: Queue,
+        drop_level: int = DEBUG,
+        listener: DrainingQueueListener | None = None,
+    ) -> None:
+        """Initialize the handler.
+
+        Args:
+            queue: Bounded queue read by a QueueListener
+            drop_level: Highest level that may be dropped when full
+            listener: Listener reading the queue, whose handlers are used
+                directly while it is stopped
+        """
+        super().__init__(queue)
+        self.drop_level = drop_level
+        self.dropped = 0
+        self._listener = listener
+        self._unreported = 0
+        self._count_lock = Lock()
+
+    def enqueue(self, record: LogRecord) -> None:
+        listener = self._listener
+        if listener is not None and not listener.running:
+            listener.handle(record)
+            return
+        queue = cast(Queue, self.queue)
+        if record.levelno <= self.drop_level:
+            try:
+                queue.put_nowait(record)
+            except Full:
+                with self._count_lock:
+                    self.dropped += 1
+                    self._unreported += 1
+                return
+        else:
+            queue.put(record)
+        if self._unreported:
+            self._report_dropped(record)
+
+    def _report_dropped(self, record: LogRecord) -> None:
+        """Queue a warning about records dropped since the last report."""
+        with self._count_lock:
+            count, self._unreported = self._unreported, 0
+        if not count:
+            return
+        notice = makeLogRecord(
+            {
+                "name": record.name,
+                "levelno": WARNING,
+                "levelname": "WARNING",
+                "msg": "Dropped %d log records while the log queue was full",
+                "args": (count,),
+            }
+        )
+        try:
+            self.queue.put_nowait(self.prepare(notice))
+        except Full:
+            with self._count_lock:
+                self._unreported += count
@@ -4,6 +4,7 @@ from .index_entry import IndexEntry
 from .index_document import IndexDocument
 from .sitemap_entry import SitemapEntry
 from .sitemap_document import SitemapDocument
+from .sitemap_filter import SitemapFilter
 from .sitemap_parser import SitemapParser
 from .urlset_entry import UrlsetEntry
 from .urlset_document import UrlsetDocument
@@ -17,6 +18,7 @@ __all__ = [
     "IndexDocument",
     "SitemapEntry",
     "SitemapDocument",
+    "SitemapFilter",
     "SitemapParser",
     "UrlsetEntry",
     "UrlsetDocument",
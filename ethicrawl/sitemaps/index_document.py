@@ -76,7 +76,7 @@ class IndexDocument(SitemapDocument):
         Returns:
             ResourceList containing IndexEntry objects for each sitemap reference
         """
-        sitemaps: ResourceList = ResourceList()
+        sitemaps: list[IndexEntry] = []
 
         nsmap = {"": self.SITEMAP_NS}
         _root = etree.fromstring(document.encode("utf-8"), parser=self._parser)
@@ -106,7 +106,8 @@ class IndexDocument(SitemapDocument):
                 sitemaps.append(index)
             except ValueError as exc:  # pragma: no cover
                 self._logger.warning("Error parsing sitemap reference: %s", exc)
-        return sitemaps
+        # Every entry was constructed above, so skip per-item validation
+        return ResourceList(sitemaps, validate=False)
 
     @property
     def entries(self) -> ResourceList:
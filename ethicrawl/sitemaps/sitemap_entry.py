@@ -1,8 +1,50 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
 
 from ethicrawl.core.resource import Resource
 
+# W3C datetime formats accepted for lastmod
+LASTMOD_FORMATS = (
+    "%Y-%m-%d",  # YYYY-MM-DD
+    "%Y-%m-%dT%H:%M:%S",  # YYYY-MM-DDThh:mm:ss
+    "%Y-%m-%dT%H:%M:%SZ",  # YYYY-MM-DDThh:mm:ssZ
+    "%Y-%m-%dT%H:%M:%S%z",  # YYYY-MM-DDThh:mm:ss+hh:mm (no colon)
+    "%Y-%m-%dT%H:%M:%S%:z",  # YYYY-MM-DDThh:mm:ss+hh:mm (with colon)
+    "%Y-%m-%dT%H:%M:%S.%fZ",  # YYYY-MM-DDThh:mm:ss.ssssssZ (with microseconds)
+    "%Y-%m-%dT%H:%M:%S.%f",  # YYYY-MM-DDThh:mm:ss.ssssss (with microseconds, no Z)
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_lastmod(value: str) -> datetime:
+    """Parse a W3C lastmod string into a timezone-aware datetime.
+
+    Sitemaps often repeat the same lastmod value across thousands of
+    entries, so results are cached by string. Values without an offset
+    are taken to be UTC so that all results are comparable.
+
+    Args:
+        value: Date string in one of the W3C formats
+
+    Returns:
+        Timezone-aware datetime
+
+    Raises:
+        ValueError: If the date format is invalid
+    """
+    stripped = value.strip()
+    for fmt in LASTMOD_FORMATS:
+        try:
+            parsed = datetime.strptime(stripped, fmt)
+        except ValueError:
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+    raise ValueError(f"Invalid lastmod date format: {value}")
+
 
 @dataclass
 class SitemapEntry(Resource):
@@ -55,27 +97,9 @@ class SitemapEntry(Resource):
         # Strip whitespace
         value = value.strip()
 
-        # Try standard formats for W3C datetime
-        formats = [
-            "%Y-%m-%d",  # YYYY-MM-DD
-            "%Y-%m-%dT%H:%M:%S",  # YYYY-MM-DDThh:mm:ss
-            "%Y-%m-%dT%H:%M:%SZ",  # YYYY-MM-DDThh:mm:ssZ
-            "%Y-%m-%dT%H:%M:%S%z",  # YYYY-MM-DDThh:mm:ss+hh:mm (no colon)
-            "%Y-%m-%dT%H:%M:%S%:z",  # YYYY-MM-DDThh:mm:ss+hh:mm (with colon)
-            "%Y-%m-%dT%H:%M:%S.%fZ",  # YYYY-MM-DDThh:mm:ss.ssssssZ (with microseconds)
-            "%Y-%m-%dT%H:%M:%S.%f",  # YYYY-MM-DDThh:mm:ss.ssssss (with microseconds, no Z)
-        ]
-
-        # Try each format
-        for fmt in formats:
-            try:
-                # If parse succeeds, the date is valid
-                datetime.strptime(value, fmt)
-                return value
-            except ValueError:
-                continue
-
-        raise ValueError(f"Invalid lastmod date format: {value}")
+        # If parse succeeds, the date is valid
+        parse_lastmod(value)
+        return value
 
     def __post_init__(self):
         """Validate fields after initialization.
@@ -90,6 +114,49 @@ class SitemapEntry(Resource):
         super().__post_init__()  # Call Resource.__post_init__ first
         self.lastmod = self._validate_lastmod(self.lastmod)
 
+    @property
+    def lastmod_datetime(self) -> datetime | None:
+        """Last modification date as a timezone-aware datetime.
+
+        The parsed value is cached on the entry, so repeated sorting or
+        filtering by date does not parse the string again.
+
+        Returns:
+            Parsed lastmod (naive values are taken as UTC), or None if unset
+        """
+        lastmod = self.lastmod
+        if not lastmod:
+            return None
+        cached = self.__dict__.get("_lastmod_parsed")
+        if cached is not None and cached[0] is lastmod:
+            return cached[1]
+        try:
+            # lastmod is validated on construction, so the C parser only
+            # needs to cover the common formats; anything else falls back
+            parsed = datetime.fromisoformat(lastmod)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+        except ValueError:
+            parsed = parse_lastmod(lastmod)
+        self.__dict__["_lastmod_parsed"] = (lastmod, parsed)
+        return parsed
+
+    def sort_value(self, field: str) -> Any:
+        """Get the value used to order entries by a named field.
+
+        lastmod is ordered chronologically using lastmod_datetime rather
+        than by its string form.
+
+        Args:
+            field: Name of the attribute to order by
+
+        Returns:
+            The comparable value, or None if the entry has no such value
+        """
+        if field == "lastmod":
+            return self.lastmod_datetime
+        return super().sort_value(field)
+
     def __str__(self) -> str:
         """Human-readable string representation of the sitemap entry.
 
@@ -0,0 +1,129 @@
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+from ethicrawl.core.resource import Resource
+from ethicrawl.core.resource_filter import PatternSet, ResourceFilter
+
+from .sitemap_entry import parse_lastmod
+from .urlset_entry import UrlsetEntry
+
+
+def _as_datetime(value: datetime | str, name: str) -> datetime:
+    if isinstance(value, str):
+        try:
+            return parse_lastmod(value)
+        except ValueError as exc:
+            raise ValueError(f"Invalid {name} date format: {value}") from exc
+    if not isinstance(value, datetime):
+        raise TypeError(f"{name} must be a datetime or str, got {type(value).__name__}")
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class SitemapFilter(ResourceFilter):
+    """ResourceFilter with predicates on sitemap entry metadata.
+
+    SitemapFilter adds lastmod, priority and changefreq conditions to the
+    URL include/exclude patterns of ResourceFilter. All conditions are
+    checked in a single pass over the entries. An entry that lacks the
+    metadata a condition needs (for example an entry with no lastmod when
+    lastmod_after is set) does not match.
+
+    Naive datetimes, both in entries and in the bounds given here, are
+    taken to be UTC.
+
+    Example:
+        >>> from ethicrawl.sitemaps import SitemapFilter
+        >>> rule = SitemapFilter(
+        ...     include=r"/products/",
+        ...     lastmod_after="2024-01-01",
+        ...     min_priority=0.5,
+        ...     changefreq=["daily", "weekly"],
+        ... )
+        >>> recent = entries.filter(rule)
+    """
+
+    def __init__(
+        self,
+        include: PatternSet = None,
+        exclude: PatternSet = None,
+        predicates: Iterable[Callable[[Resource], bool]] = (),
+        lastmod_after: datetime | str | None = None,
+        lastmod_before: datetime | str | None = None,
+        min_priority: float | None = None,
+        max_priority: float | None = None,
+        changefreq: str | Iterable[str] | None = None,
+    ) -> None:
+        """Compile a sitemap filter.
+
+        Args:
+            include: Pattern or patterns a URL must match (any of them)
+            exclude: Pattern or patterns a URL must not match (any of them)
+            predicates: Additional callables that must all return True
+            lastmod_after: Only match entries modified at or after this time
+            lastmod_before: Only match entries modified before this time
+            min_priority: Only match entries with priority >= this value
+            max_priority: Only match entries with priority <= this value
+            changefreq: Change frequency or frequencies to accept
+
+        Raises:
+            TypeError: If an argument has the wrong type
+            ValueError: If a date or changefreq is invalid, or a priority
+                bound is outside 0.0-1.0
+        """
+        super().__init__(include, exclude, predicates)
+
+        after = (
+            _as_datetime(lastmod_after, "lastmod_after")
+            if lastmod_after is not None
+            else None
+        )
+        before = (
+            _as_datetime(lastmod_before, "lastmod_before")
+            if lastmod_before is not None
+            else None
+        )
+        if after is not None or before is not None:
+
+            def lastmod_in_range(resource: Resource) -> bool:
+                lastmod = getattr(resource, "lastmod_datetime", None)
+                if lastmod is None:
+                    return False
+                if after is not None and lastmod < after:
+                    return False
+                return before is None or lastmod < before
+
+            self.add_predicate(lastmod_in_range)
+
+        low = self._priority_bound(min_priority, "min_priority", 0.0)
+        high = self._priority_bound(max_priority, "max_priority", 1.0)
+        if min_priority is not None or max_priority is not None:
+
+            def priority_in_range(resource: Resource) -> bool:
+                priority = getattr(resource, "priority", None)
+                return priority is not None and low <= priority <= high
+
+            self.add_predicate(priority_in_range)
+
+        if changefreq is not None:
+            if isinstance(changefreq, str):
+                changefreq = [changefreq]
+            accepted = frozenset(
+                UrlsetEntry._validate_changefreq(freq) for freq in changefreq
+            )
+
+            def changefreq_accepted(resource: Resource) -> bool:
+                return getattr(resource, "changefreq", None) in accepted
+
+            self.add_predicate(changefreq_accepted)
+
+    @staticmethod
+    def _priority_bound(value: float | None, name: str, default: float) -> float:
+        if value is None:
+            return default
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise TypeError(f"{name} must be a number, got {type(value).__name__}")
+        if not 0.0 <= value <= 1.0:
+            raise ValueError(f"{name} must be between 0.0 and 1.0, got {value}")
+        return float(value)
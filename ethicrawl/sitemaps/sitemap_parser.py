@@ -155,8 +155,11 @@ class SitemapParser:
         if not isinstance(document, IndexDocument):  # pragma: no cover
             # we shouldn't be here
             return ResourceList()
-        max_depth = Config().sitemap.max_depth
-        all_urls: ResourceList = ResourceList([])
+        sitemap_config = Config().sitemap
+        max_depth = sitemap_config.max_depth
+        all_urls: ResourceList = ResourceList(
+            spill_threshold=sitemap_config.spill_threshold
+        )
 
         # Initialize visited set if this is the first call
         if visited is None:
@@ -191,12 +194,19 @@ class SitemapParser:
         Args:
             item: Sitemap entry to process
             depth: Current recursion depth
-            visited: Set of already processed sitemap URLs
+            visited: Set of already processed sitemap URLs (canonical form)
 
         Returns:
             ResourceList of URLs found in this entry (and any nested entries)
         """
-        url_str = str(item.url)
+        # Key on the canonical form so variants like a default port or
+        # tracking parameters don't defeat cycle detection
+        try:
+            url_str = str(item.url.canonical())
+        except ValueError as exc:
+            # e.g. an invalid port; skip this entry, not the whole sitemap
+            self._logger.warning("Skipping invalid sitemap URL %s: %s", item.url, exc)
+            return ResourceList()
 
         # Check for cycles - skip if we've seen this URL before
         if url_str in visited:
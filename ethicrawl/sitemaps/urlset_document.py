@@ -79,7 +79,7 @@ class UrlsetDocument(SitemapDocument):
         Returns:
             ResourceList containing UrlsetEntry objects for each URL
         """
-        urlset: ResourceList = ResourceList()
+        urlset: list[UrlsetEntry] = []
 
         nsmap = {"": self.SITEMAP_NS}
         _root = etree.fromstring(document.encode("utf-8"), parser=self._parser)
@@ -113,7 +113,8 @@ class UrlsetDocument(SitemapDocument):
                 urlset.append(url)
             except ValueError as e:  # pragma: no cover
                 self._logger.warning("Error parsing sitemap reference: %s", e)
-        return urlset
+        # Every entry was constructed above, so skip per-item validation
+        return ResourceList(urlset, validate=False)
 
     @property
     def entries(self) -> ResourceList:
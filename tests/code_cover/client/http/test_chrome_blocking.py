@@ -0,0 +1,74 @@
+import re
+
+import pytest
+
+from ethicrawl.client.http.chrome_blocking import (
+    RESOURCE_PATTERNS,
+    TRACKER_PATTERNS,
+    blocked_url_patterns,
+)
+
+
+def is_blocked(url, patterns):
+    """Match a URL the way Network.setBlockedURLs does: '*' only, whole URL."""
+    return any(
+        re.fullmatch(".*".join(map(re.escape, pattern.split("*"))), url)
+        for pattern in patterns
+    )
+
+
+class TestChromeBlocking:
+    def test_default_patterns(self):
+        patterns = blocked_url_patterns()
+        assert "*.png" in patterns
+        assert "*.png?*" in patterns
+        assert "*.woff2" in patterns
+        assert "*.mp4" in patterns
+        assert "*.css" not in patterns
+        assert set(TRACKER_PATTERNS) <= set(patterns)
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://cdn.example.com/logo.png",
+            "https://cdn.example.com/photo.jpg?w=200",
+            "https://www.example.com/favicon.ico",
+            "https://cdn.example.com/clip.mov?t=1&s=2",
+            "https://www.google-analytics.com/analytics.js",
+            "https://static.hotjar.com/c/hotjar.js?sv=6",
+        ],
+    )
+    def test_blocks_resources(self, url):
+        assert is_blocked(url, blocked_url_patterns())
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://www.movies.com/",
+            "https://giftcards.com/shop",
+            "https://www.iconfinder.com/search?q=arrow",
+            "https://www.wavestone.com/en/",
+            "https://www.example.com/svg.html",
+            "https://www.example.com/docs/file.mov/notes",
+            "https://www.example.com/gif?style=.gifted",
+            "https://www.example.com/?ref=hotjar.com",
+            "https://nothotjar.com/",
+        ],
+    )
+    def test_keeps_pages_with_extension_like_names(self, url):
+        assert not is_blocked(url, blocked_url_patterns())
+
+    def test_custom_patterns(self):
+        patterns = blocked_url_patterns(
+            ["stylesheet", "stylesheet"], ["*/ads/*"], trackers=False
+        )
+        assert patterns == list(RESOURCE_PATTERNS["stylesheet"]) + ["*/ads/*"]
+        assert blocked_url_patterns((), (), trackers=False) == []
+
+    def test_validation(self):
+        with pytest.raises(ValueError, match="Unknown resource type: video"):
+            blocked_url_patterns(["video"])
+        with pytest.raises(TypeError, match="Expected str resource type, got int"):
+            blocked_url_patterns([1])
+        with pytest.raises(TypeError, match="Expected str URL pattern, got NoneType"):
+            blocked_url_patterns((), [None])
@@ -0,0 +1,105 @@
+import threading
+
+import pytest
+
+from ethicrawl.client.http.chrome_pool import ChromePool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.crashed = False
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if self.crashed:
+            raise RuntimeError("browser crashed")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestChromePool:
+    def test_validation(self):
+        with pytest.raises(TypeError, match="size must be an integer, got str"):
+            ChromePool(FakeDriver, "2")
+        with pytest.raises(ValueError, match="size must be at least 1"):
+            ChromePool(FakeDriver, 0)
+        with pytest.raises(
+            TypeError, match="max_pages must be an integer or None, got float"
+        ):
+            ChromePool(FakeDriver, 1, 1.5)
+        with pytest.raises(ValueError, match="max_pages must be at least 1"):
+            ChromePool(FakeDriver, 1, 0)
+
+    def test_checkout_reuses_and_grows_to_size(self):
+        pool = ChromePool(FakeDriver, size=2)
+        first = pool.checkout()
+        second = pool.checkout()
+        assert first is not second
+        assert pool.alive == 2
+        with pytest.raises(TimeoutError, match="No Chrome driver available"):
+            pool.checkout(timeout=0.01)
+        pool.checkin(first)
+        assert pool.checkout() is first
+
+        with pytest.raises(RuntimeError, match="ChromePool is full"):
+            pool.add(FakeDriver())
+
+    def test_waiting_thread_gets_returned_driver(self):
+        pool = ChromePool(FakeDriver, size=1)
+        driver = pool.checkout()
+        got = []
+        waiter = threading.Thread(target=lambda: got.append(pool.checkout(5)))
+        waiter.start()
+        pool.checkin(driver)
+        waiter.join(5)
+        assert got == [driver]
+
+    def test_recycling(self):
+        pool = ChromePool(FakeDriver, size=1, max_pages=2)
+        driver = pool.checkout()
+        pool.checkin(driver)
+        assert pool.checkout() is driver
+        pool.checkin(driver)
+        assert driver.quit_called
+        assert pool.alive == 0
+        assert pool.checkout() is not driver
+
+    def test_crashed_driver_is_replaced(self):
+        pool = ChromePool(FakeDriver, size=1)
+        with pytest.raises(ValueError):
+            with pool.driver() as driver:
+                driver.crashed = True
+                raise ValueError("page failed")
+        assert driver.quit_called
+        with pool.driver() as replacement:
+            assert replacement is not driver
+
+    def test_factory_failure_frees_slot(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            if len(calls) == 1:
+                raise OSError("chromedriver not found")
+            return FakeDriver()
+
+        pool = ChromePool(factory, size=1)
+        with pytest.raises(OSError):
+            pool.checkout()
+        assert pool.alive == 0
+        assert isinstance(pool.checkout(), FakeDriver)
+
+    def test_close(self):
+        pool = ChromePool(FakeDriver, size=2)
+        idle = pool.checkout()
+        busy = pool.checkout()
+        pool.checkin(idle)
+        pool.close()
+        assert idle.quit_called
+        assert not busy.quit_called
+        pool.checkin(busy)
+        assert busy.quit_called
+        with pytest.raises(RuntimeError, match="ChromePool is closed"):
+            pool.checkout()
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from ethicrawl.client.http.chrome_readiness import (
+    AllOf,
+    DomQuiescence,
+    FixedDelay,
+    NetworkIdle,
+    SelectorPresent,
+)
+
+
+def event(method, request_id="1"):
+    return {
+        "message": json.dumps(
+            {"message": {"method": method, "params": {"requestId": request_id}}}
+        )
+    }
+
+
+class FakeDriver:
+    def __init__(self, logs=(), mutations=(), elements=()):
+        self.logs = list(logs)
+        self.mutations = list(mutations)
+        self.elements = list(elements)
+
+    def get_log(self, kind):
+        assert kind == "performance"
+        return [self.logs.pop(0)] if self.logs else []
+
+    def execute_script(self, script):
+        return self.mutations.pop(0) if self.mutations else 10_000
+
+    def find_elements(self, by, selector):
+        return self.elements.pop(0) if self.elements else []
+
+
+class FakeSleep:
+    def __init__(self):
+        self.total = 0.0
+
+    def __call__(self, seconds):
+        self.total += seconds
+
+
+class TestReadiness:
+    def test_fixed_delay_waits_full_time(self):
+        sleep = FakeSleep()
+        FixedDelay().wait(FakeDriver(), 3, sleep)
+        assert sleep.total == pytest.approx(3, abs=0.01)
+
+    def test_network_idle(self):
+        sleep = FakeSleep()
+        driver = FakeDriver(
+            logs=[
+                event("Network.requestWillBeSent", "a"),
+                event("Network.responseReceived", "a"),
+                event("Network.loadingFinished", "a"),
+            ]
+        )
+        entries = NetworkIdle(idle_time=0.5).wait(driver, 3, sleep)
+        # Every entry read while waiting is handed back to the caller
+        assert len(entries) == 3
+        assert 0.5 <= sleep.total < 3
+
+    def test_network_idle_is_bounded_by_timeout(self):
+        sleep = FakeSleep()
+        driver = FakeDriver(logs=[event("Network.requestWillBeSent", "stuck")])
+        NetworkIdle().wait(driver, 2, sleep)
+        assert sleep.total == pytest.approx(2, abs=0.01)
+
+    def test_dom_quiescence(self):
+        sleep = FakeSleep()
+        driver = FakeDriver(mutations=[0, 100, 200, 600])
+        DomQuiescence(quiet_time=0.5).wait(driver, 3, sleep)
+        assert sleep.total == pytest.approx(0.15, abs=0.01)
+
+    def test_selector_present(self):
+        sleep = FakeSleep()
+        driver = FakeDriver(elements=[[], [], ["element"]])
+        SelectorPresent("#results").wait(driver, 3, sleep)
+        assert sleep.total == pytest.approx(0.1, abs=0.01)
+        with pytest.raises(TypeError, match="selector must be a string, got int"):
+            SelectorPresent(1)
+        with pytest.raises(ValueError, match="selector cannot be empty"):
+            SelectorPresent("")
+
+    def test_all_of(self):
+        sleep = FakeSleep()
+        driver = FakeDriver(mutations=[0, 600], elements=[[], ["element"]])
+        AllOf(DomQuiescence(), SelectorPresent("#results")).wait(driver, 3, sleep)
+        assert sleep.total == pytest.approx(0.1, abs=0.01)
+        with pytest.raises(TypeError, match="Expected ReadinessStrategy, got str"):
+            AllOf("#results")
@@ -0,0 +1,59 @@
+from unittest.mock import Mock
+
+from ethicrawl.client.http.chrome_registry import DriverRegistry
+
+
+def healthy_driver():
+    driver = Mock()
+    driver.execute_script.return_value = 1
+    return driver
+
+
+class TestDriverRegistry:
+    def test_acquire_launches_when_empty(self):
+        registry = DriverRegistry()
+        driver = healthy_driver()
+        assert registry.acquire("a", lambda: driver) is driver
+
+    def test_release_and_reuse_by_key(self):
+        registry = DriverRegistry()
+        driver = healthy_driver()
+        registry.release("a", driver)
+        driver.execute_cdp_cmd.assert_called_once_with(
+            "Network.clearBrowserCookies", {}
+        )
+        driver.get.assert_called_once_with("about:blank")
+        assert len(registry) == 1
+
+        launch = Mock()
+        other = registry.acquire("b", launch)
+        assert other is launch.return_value
+        assert registry.acquire("a", launch) is driver
+        assert len(registry) == 0
+
+    def test_unhealthy_drivers_are_quit(self):
+        registry = DriverRegistry()
+        dead = healthy_driver()
+        registry.release("a", dead)
+        dead.execute_script.side_effect = RuntimeError("browser crashed")
+        fresh = healthy_driver()
+        assert registry.acquire("a", lambda: fresh) is fresh
+        dead.quit.assert_called_once()
+
+        broken = Mock()
+        broken.get.side_effect = RuntimeError("browser crashed")
+        registry.release("a", broken)
+        broken.quit.assert_called_once()
+        assert len(registry) == 0
+
+    def test_max_idle_and_clear(self):
+        registry = DriverRegistry(max_idle=1)
+        first, second = healthy_driver(), healthy_driver()
+        registry.release("a", first)
+        registry.release("a", second)
+        second.quit.assert_called_once()
+        assert len(registry) == 1
+
+        registry.clear()
+        first.quit.assert_called_once()
+        assert len(registry) == 0
@@ -0,0 +1,302 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from ethicrawl.client.http import HttpRequest
+from ethicrawl.client.http.chrome_readiness import FixedDelay
+from ethicrawl.client.http.chrome_tabs import ChromeTabs, TabDriver
+from ethicrawl.client.http.chrome_transport import ChromeTransport
+from ethicrawl.context import Context
+from ethicrawl.core import Resource, Url
+
+
+def log_entry(webview, method="Network.responseReceived", url="https://example.com"):
+    event = {
+        "message": {
+            "method": method,
+            "params": {
+                "type": "Document",
+                "response": {
+                    "url": url,
+                    "status": 200,
+                    "headers": {},
+                    "mimeType": "text/html",
+                },
+            },
+        },
+        "webview": webview,
+    }
+    return {"message": json.dumps(event)}
+
+
+class FakeSwitchTo:
+    def __init__(self, browser):
+        self._browser = browser
+
+    def window(self, handle):
+        self._browser.switches.append(handle)
+        self._browser.window = handle
+
+
+class FakeBrowser:
+    """Records CDP commands and which window each command ran in."""
+
+    def __init__(self):
+        self.cdp = []
+        self.switches = []
+        self.window = None
+        self.log = []
+        self.urls = {}
+        self.ready_after = 0
+        self.commit_after = 0
+        self.pending = {}
+        self.marked = set()
+        self.quit_called = False
+        self.switch_to = FakeSwitchTo(self)
+        self._targets = 0
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((cmd, params))
+        if cmd == "Target.createBrowserContext":
+            return {"browserContextId": f"ctx{len(self.cdp)}"}
+        if cmd == "Target.createTarget":
+            self._targets += 1
+            return {"targetId": f"T{self._targets}"}
+        return {}
+
+    def get(self, url):
+        self.pending[self.window] = url
+        if not self.commit_after:
+            self._commit()
+
+    def _commit(self):
+        self.urls[self.window] = self.pending.pop(self.window)
+        self.marked.discard(self.window)
+
+    def execute_script(self, script, *args):
+        if "__ethicrawlPrevious = true" in script:
+            self.marked.add(self.window)
+            return self.current_url
+        if "delete document.__ethicrawlPrevious" in script:
+            self.marked.discard(self.window)
+            return None
+        if "readyState" in script:
+            if self.window in self.pending:
+                # Navigation not committed yet: the previous document is
+                # still current, and it finished loading long ago
+                self.commit_after -= 1
+                if not self.commit_after:
+                    self._commit()
+                if "__ethicrawlPrevious" in script and self.window in self.marked:
+                    return "previous"
+                return "complete"
+            if self.ready_after:
+                self.ready_after -= 1
+                return "loading"
+            return "complete"
+        return "Mozilla/5.0 (Test) Chrome/Test"
+
+    def find_element(self, by, value):
+        return object()
+
+    def get_log(self, log_type):
+        entries, self.log = self.log, []
+        return entries
+
+    @property
+    def page_source(self):
+        return "<html><body>Tab content</body></html>"
+
+    @property
+    def current_url(self):
+        return self.urls.get(self.window, "about:blank")
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestChromeTabs:
+    def test_open_tab_isolates_contexts(self):
+        browser = FakeBrowser()
+        tabs = ChromeTabs(browser)
+
+        first = tabs.open_tab()
+        second = tabs.open_tab()
+        assert isinstance(first, TabDriver)
+        assert tabs.open == 2
+        assert first.handle != second.handle
+        assert first.context_id != second.context_id
+        created = [p for c, p in browser.cdp if c == "Target.createTarget"]
+        assert created[0]["browserContextId"] == first.context_id
+
+        shared = ChromeTabs(FakeBrowser(), isolate=False)
+        tab = shared.open_tab()
+        assert tab.context_id is None
+        assert "browserContextId" not in shared.driver.cdp[0][1]
+
+    def test_commands_switch_to_their_tab(self):
+        browser = FakeBrowser()
+        tabs = ChromeTabs(browser)
+        first, second = tabs.open_tab(), tabs.open_tab()
+
+        first.get("https://example.com/a")
+        second.get("https://example.com/b")
+        assert first.current_url == "https://example.com/a"
+        assert second.current_url == "https://example.com/b"
+        # Only switched when the current window changed
+        assert browser.switches == ["T1", "T2", "T1", "T2"]
+        assert first.page_source.startswith("<html>")
+
+    def test_get_waits_for_document(self):
+        browser = FakeBrowser()
+        tab = ChromeTabs(browser).open_tab()
+        browser.ready_after = 2
+        with patch("ethicrawl.client.http.chrome_tabs.sleep") as mock_sleep:
+            tab.get("https://example.com")
+        assert mock_sleep.call_count == 2
+
+        browser.ready_after = 1000
+        tab.set_page_load_timeout(0)
+        with pytest.raises(TimeoutError, match="Timed out loading"):
+            tab.get("https://example.com")
+
+    def test_get_waits_for_navigation_to_commit(self):
+        browser = FakeBrowser()
+        tab = ChromeTabs(browser).open_tab()
+        tab.get("https://example.com/a")
+
+        browser.commit_after = 3
+        with patch("ethicrawl.client.http.chrome_tabs.sleep") as mock_sleep:
+            tab.get("https://example.com/b")
+        # The previous document was "complete" but did not count
+        assert mock_sleep.call_count == 2
+        assert tab.current_url == "https://example.com/b"
+
+        # A fragment change keeps the document, so there is nothing to wait for
+        browser.commit_after = 1000
+        with patch("ethicrawl.client.http.chrome_tabs.sleep") as mock_sleep:
+            tab.get("https://example.com/b#part")
+        assert mock_sleep.call_count == 0
+
+        browser.commit_after = 1000
+        tab.set_page_load_timeout(0)
+        with pytest.raises(TimeoutError, match="Timed out loading"):
+            tab.get("https://example.com")
+
+    def test_performance_log_is_split_per_tab(self):
+        browser = FakeBrowser()
+        tabs = ChromeTabs(browser)
+        first, second = tabs.open_tab(), tabs.open_tab()
+        browser.log = [
+            log_entry("T1"),
+            log_entry("T2"),
+            log_entry("T9"),  # unknown tab
+            {"message": "{}"},  # no webview
+            log_entry("T1"),
+        ]
+
+        assert len(first.get_log("performance")) == 2
+        assert len(second.get_log("performance")) == 1
+        assert second.get_log("performance") == []
+
+    def test_close_tab_and_quit(self):
+        browser = FakeBrowser()
+        tabs = ChromeTabs(browser)
+        tab = tabs.open_tab()
+
+        tab.quit()
+        assert tabs.open == 0
+        assert ("Target.closeTarget", {"targetId": "T1"}) in browser.cdp
+        assert (
+            "Target.disposeBrowserContext",
+            {"browserContextId": tab.context_id},
+        ) in browser.cdp
+        calls = len(browser.cdp)
+        tab.quit()  # closing twice is a no-op
+        assert len(browser.cdp) == calls
+
+        tabs.quit()
+        assert browser.quit_called
+
+
+class TestChromeTransportTabs:
+    def test_validation(self):
+        context = Context(Resource(Url("https://www.example.com")))
+        with pytest.raises(TypeError, match="tabs must be an integer, got str"):
+            ChromeTransport(context, tabs="2")
+        with pytest.raises(ValueError, match="tabs must be at least 1"):
+            ChromeTransport(context, tabs=0)
+
+    def test_requests_run_in_tabs(self):
+        url = "https://www.example.com"
+        context = Context(Resource(Url(url)))
+        browsers = []
+
+        def start(options):
+            browsers.append(FakeBrowser())
+            browsers[-1].options = options
+            return browsers[-1]
+
+        with patch("selenium.webdriver.Chrome", side_effect=start):
+            transport = ChromeTransport(
+                context,
+                pool_size=1,
+                tabs=2,
+                readiness=FixedDelay(),
+                wait_time=0,
+                block_trackers=False,
+            )
+            assert len(browsers) == 1
+            assert browsers[0].options.page_load_strategy == "none"
+            assert transport.pool.size == 2
+
+            first = transport.pool.checkout()
+            second = transport.pool.checkout()
+            # Both tabs share the one browser
+            assert len(browsers) == 1
+            assert {first.handle, second.handle} == {"T1", "T2"}
+            # Blocking is applied to each tab
+            assert browsers[0].cdp.count(("Network.enable", {})) == 2
+            transport.pool.checkin(first)
+            transport.pool.checkin(second)
+
+            browsers[0].log = [log_entry("T1", url=url), log_entry("T2", url=url)]
+            response = transport.get(HttpRequest(url=Url(url)))
+            assert response.status_code == 200
+            assert "Tab content" in response.text
+
+            transport.__del__()
+            assert browsers[0].quit_called
+
+    def test_close_waits_for_tabs_in_use(self):
+        from ethicrawl.client.http.chrome_registry import registry
+
+        context = Context(Resource(Url("https://www.example.com")))
+        browsers = []
+
+        def start(options):
+            browsers.append(FakeBrowser())
+            return browsers[-1]
+
+        with patch("selenium.webdriver.Chrome", side_effect=start):
+            transport = ChromeTransport(
+                context, pool_size=2, tabs=2, block_trackers=False
+            )
+            first, second = transport.pool.checkout(), transport.pool.checkout()
+            busy = transport.pool.checkout()  # in a second browser
+            assert len(browsers) == 2
+            transport.pool.checkin(first)
+            transport.pool.checkin(second)
+
+            transport.close()
+            # The idle browser is reused; the other is still rendering
+            assert len(registry) == 1
+            assert not any(browser.quit_called for browser in browsers)
+            cleared = ("Network.clearBrowserCookies", {})
+            assert cleared in browsers[0].cdp
+            assert cleared not in browsers[1].cdp
+
+            transport.pool.checkin(busy)
+            assert browsers[1].quit_called
+            assert len(registry) == 1
@@ -190,9 +190,9 @@ class TestChromeTransport:
                         if "Headers requested" in str(call)
                     ]
                     assert len(headers_call) == 1
-                    assert "User-Agent".lower() in str(headers_call[0])
-                    assert "Accept".lower() in str(headers_call[0])
-                    assert "X-Custom-Header".lower() in str(headers_call[0])
+                    assert "User-Agent" in str(headers_call[0])
+                    assert "Accept" in str(headers_call[0])
+                    assert "X-Custom-Header" in str(headers_call[0])
 
                     # Verify request was still made successfully
                     mock_webdriver.get.assert_called_once_with(url)
@@ -365,6 +365,8 @@ class TestChromeTransport:
             # Set up the full object chain
             mock_config = Mock()
             mock_config_class.return_value = mock_config
+            mock_config.snapshot.return_value = mock_config
+            mock_config.concurrency.chrome = -1
 
             mock_http = Mock()
             mock_config.http = mock_http
@@ -514,3 +516,187 @@ class TestChromeTransport:
             assert headers == {}
             assert mime is None
             mock_debug.assert_called_once()
+
+    def test_requests_use_pool(self, mock_webdriver):
+        """Requests run on a driver checked out of the pool"""
+        url = "https://www.example.com"
+        context = Context(Resource(Url(url)))
+        mock_webdriver.current_url = url
+
+        with (
+            patch("selenium.webdriver.Chrome", return_value=mock_webdriver),
+            patch("ethicrawl.client.http.chrome_transport.sleep"),
+        ):
+            transport = ChromeTransport(context, pool_size=2, max_pages=1)
+            assert transport.pool.size == 2
+            assert transport.pool.idle == 1
+
+            response = transport.get(HttpRequest(url=Url(url)))
+            assert response.status_code == 200
+            # Recycled after max_pages
+            mock_webdriver.quit.assert_called_once()
+            assert transport.pool.alive == 0
+
+    @patch("selenium.webdriver.Chrome")
+    def test_request_blocking(self, mock_chrome_class):
+        """Blocked URL patterns are sent to each new browser over CDP"""
+        mock_driver = Mock()
+        mock_chrome_class.return_value = mock_driver
+        context = Context(Resource(Url("https://www.example.com")))
+
+        ChromeTransport(context, block_urls=["*/ads/*"])
+        mock_driver.execute_cdp_cmd.assert_any_call("Network.enable", {})
+        name, params = mock_driver.execute_cdp_cmd.call_args[0]
+        assert name == "Network.setBlockedURLs"
+        assert "*.png" in params["urls"]
+        assert "*/ads/*" in params["urls"]
+
+        mock_driver.reset_mock()
+        ChromeTransport(context, block_resources=(), block_trackers=False)
+        mock_driver.execute_cdp_cmd.assert_not_called()
+
+    def test_performance_log_read_once_and_prefiltered(self, mock_webdriver):
+        """The log is read once per page and only responses are decoded"""
+        from ethicrawl.client.http.chrome_readiness import FixedDelay
+
+        url = "https://www.example.com"
+        context = Context(Resource(Url(url)))
+        mock_webdriver.current_url = url
+        noise = {"message": json.dumps({"message": {"method": "Page.loadEventFired"}})}
+        late_image = {
+            "message": json.dumps(
+                {
+                    "message": {
+                        "method": "Network.responseReceived",
+                        "params": {
+                            "type": "Image",
+                            "response": {"url": "https://example.com/a.png"},
+                        },
+                    }
+                }
+            )
+        }
+        document = mock_webdriver.get_log.return_value[0]
+        mock_webdriver.get_log.return_value = [noise, document, late_image, noise]
+
+        with (
+            patch("selenium.webdriver.Chrome", return_value=mock_webdriver),
+            patch("ethicrawl.client.http.chrome_transport.sleep"),
+            patch(
+                "ethicrawl.client.http.chrome_transport.loads", side_effect=json.loads
+            ) as mock_loads,
+        ):
+            transport = ChromeTransport(context, readiness=FixedDelay())
+            response = transport.get(HttpRequest(url=Url(url)))
+
+            assert response.status_code == 200
+            mock_webdriver.get_log.assert_called_once_with("performance")
+            # Only the document response was decoded
+            assert mock_loads.call_count == 1
+
+    def test_headers_and_user_agent_sent_over_cdp(self, mock_webdriver):
+        """Request headers and the user agent reach Chrome before navigation"""
+        url = "https://www.example.com"
+        context = Context(Resource(Url(url)))
+        mock_webdriver.current_url = url
+
+        with (
+            patch("selenium.webdriver.Chrome", return_value=mock_webdriver),
+            patch("ethicrawl.client.http.chrome_transport.sleep"),
+        ):
+            transport = ChromeTransport(
+                context, block_resources=(), block_trackers=False
+            )
+            transport.user_agent = "Custom/1.0"
+            assert transport.user_agent == "Custom/1.0"
+
+            headers = {
+                "If-None-Match": '"abc"',
+                "Authorization": "Bearer secret",
+                "Cookie": "session=1; theme=dark",
+                "Accept-Encoding": "gzip",
+            }
+            transport.get(HttpRequest(url=Url(url), headers=headers))
+            commands = [c[0] for c in mock_webdriver.method_calls]
+            assert commands.index("execute_cdp_cmd") < commands.index("get")
+            # Conditional and credential headers stay off subresources
+            mock_webdriver.execute_cdp_cmd.assert_any_call(
+                "Network.setExtraHTTPHeaders", {"headers": {"Accept-Encoding": "gzip"}}
+            )
+            # Cookies are scoped to the requested site by the browser
+            mock_webdriver.execute_cdp_cmd.assert_any_call(
+                "Network.setCookie",
+                {"name": "theme", "value": "dark", "url": url, "path": "/"},
+            )
+            cookies = [
+                c
+                for c in mock_webdriver.execute_cdp_cmd.call_args_list
+                if c[0][0] == "Network.setCookie"
+            ]
+            assert len(cookies) == 2
+            mock_webdriver.execute_cdp_cmd.assert_any_call(
+                "Network.setUserAgentOverride", {"userAgent": "Custom/1.0"}
+            )
+
+            # Same headers again: nothing new to send
+            mock_webdriver.execute_cdp_cmd.reset_mock()
+            transport.get(HttpRequest(url=Url(url), headers=headers))
+            mock_webdriver.execute_cdp_cmd.assert_not_called()
+
+            # A request's own User-Agent wins for that request
+            transport.get(
+                HttpRequest(url=Url(url), headers={"User-Agent": "Other/2.0"})
+            )
+            mock_webdriver.execute_cdp_cmd.assert_any_call(
+                "Network.setExtraHTTPHeaders", {"headers": {}}
+            )
+            mock_webdriver.execute_cdp_cmd.assert_any_call(
+                "Network.setUserAgentOverride", {"userAgent": "Other/2.0"}
+            )
+            # The last request's cookies do not outlive it
+            for name in ("session", "theme"):
+                mock_webdriver.execute_cdp_cmd.assert_any_call(
+                    "Network.deleteCookies", {"name": name, "url": url}
+                )
+
+            # Only headers that were sent are logged as sent
+            with patch.object(transport._logger, "debug") as mock_debug:
+                transport.get(HttpRequest(url=Url(url), headers=headers))
+            sent = [
+                call
+                for call in mock_debug.call_args_list
+                if "Headers requested" in str(call)
+            ]
+            assert len(sent) == 1
+            assert "Cookie" in str(sent[0])
+            assert "Accept-Encoding" in str(sent[0])
+            assert "Authorization" not in str(sent[0])
+            assert "If-None-Match" not in str(sent[0])
+
+    def test_close_releases_drivers_for_reuse(self, mock_webdriver):
+        """Closed transports hand browsers to the next one with the same options"""
+        from ethicrawl.client.http.chrome_registry import registry
+
+        context = Context(Resource(Url("https://www.example.com")))
+        with patch(
+            "selenium.webdriver.Chrome", return_value=mock_webdriver
+        ) as mock_chrome:
+            with ChromeTransport(context) as transport:
+                pass
+            mock_webdriver.quit.assert_not_called()
+            assert len(registry) == 1
+            transport.close()  # closing twice does nothing
+            assert len(registry) == 1
+
+            second = ChromeTransport(context)
+            assert second.driver is mock_webdriver
+            mock_chrome.assert_called_once()
+
+            # Different options need a different browser
+            ChromeTransport(context, headless=False, reuse_drivers=False)
+            assert mock_chrome.call_count == 2
+
+            # Garbage collection quits rather than reuses
+            second.__del__()
+            mock_webdriver.quit.assert_called()
+            assert len(registry) == 0
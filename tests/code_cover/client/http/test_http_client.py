@@ -132,3 +132,9 @@ class TestHttpClient:
         request_arg = mock_transport.get.call_args[0][0]
         assert isinstance(request_arg, HttpRequest)
         assert str(request_arg.url) == "https://example.com/api/data"
+
+    def test_close(self):
+        transport = MagicMock()
+        with HttpClient(transport=transport) as client:
+            assert isinstance(client, HttpClient)
+        transport.close.assert_called_once()
@@ -0,0 +1,149 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ethicrawl.client.http import HttpClient, HttpRequest, HttpResponse
+from ethicrawl.client.http.hybrid_transport import HybridTransport
+from ethicrawl.context import Context
+from ethicrawl.core import Headers, Resource, Url
+
+STATIC = "<html><body><main><h1>Products</h1><p>Widget</p></main></body></html>"
+SHELL = (
+    "<html><head><script src='/app.js'></script></head>"
+    "<body><div id='root'></div></body></html>"
+)
+NOSCRIPT = (
+    "<html><body><p>Loading</p>"
+    "<noscript>You need to enable JavaScript to run this app.</noscript>"
+    "</body></html>"
+)
+
+
+def make_response(url, text, status_code=200, content_type="text/html"):
+    return HttpResponse(
+        url=Url(url),
+        status_code=status_code,
+        request=HttpRequest(Url(url)),
+        text=text,
+        headers=Headers({"Content-Type": content_type}),
+    )
+
+
+@pytest.fixture
+def context():
+    return Context(Resource(Url("https://example.com")))
+
+
+@pytest.fixture
+def transports(context):
+    """Hybrid transport with both backends replaced by mocks."""
+    chrome = Mock()
+    chrome.get.side_effect = lambda request: make_response(
+        str(request.url), "<html><body>rendered</body></html>"
+    )
+    with patch(
+        "ethicrawl.client.http.chrome_transport.ChromeTransport", return_value=chrome
+    ) as chrome_class:
+        hybrid = HybridTransport(context, chrome_params={"headless": True})
+        hybrid.requests = Mock()
+        yield hybrid, chrome, chrome_class
+
+
+class TestHybridTransport:
+    def test_validation(self, context):
+        with pytest.raises(TypeError, match="predicate must be callable, got str"):
+            HybridTransport(context, predicate="yes")
+        with pytest.raises(ValueError, match="Invalid xpath"):
+            HybridTransport(context, xpath="//[")
+        with pytest.raises(TypeError, match="Expected bool for pattern"):
+            HybridTransport(context, patterns={"*.example.com": "yes"})
+
+    def test_needs_rendering(self, context):
+        hybrid = HybridTransport(context)
+        url = "https://example.com/"
+        assert not hybrid.needs_rendering(make_response(url, STATIC))
+        assert hybrid.needs_rendering(make_response(url, ""))
+        assert hybrid.needs_rendering(make_response(url, SHELL))
+        assert hybrid.needs_rendering(make_response(url, NOSCRIPT))
+        # Errors and non-HTML content are never escalated
+        assert not hybrid.needs_rendering(make_response(url, "", status_code=404))
+        assert not hybrid.needs_rendering(
+            make_response(url, "", content_type="application/json")
+        )
+
+        strict = HybridTransport(context, xpath="//div[@class='results']")
+        assert strict.needs_rendering(make_response(url, STATIC))
+
+        custom = HybridTransport(context, predicate=lambda r: "Widget" in r.text)
+        assert custom.needs_rendering(make_response(url, STATIC))
+
+    def test_static_pages_never_start_chrome(self, transports):
+        hybrid, chrome, chrome_class = transports
+        url = "https://example.com/page"
+        hybrid.requests.get.return_value = make_response(url, STATIC)
+
+        response = hybrid.get(HttpRequest(Url(url)))
+        assert "Widget" in response.text
+        chrome_class.assert_not_called()
+
+    def test_escalation_is_remembered_per_domain(self, transports):
+        hybrid, chrome, chrome_class = transports
+        url = "https://example.com/app"
+        hybrid.requests.get.return_value = make_response(url, SHELL)
+
+        request = HttpRequest(Url(url))
+        request.throttle = Mock()
+        response = hybrid.get(request)
+        assert "rendered" in response.text
+        # Rendering is a second request, so it waits for its own slot
+        request.throttle.assert_called_once_with()
+        chrome_class.assert_called_once()
+        assert chrome_class.call_args[1] == {"headless": True}
+        assert hybrid.decision(Url("https://example.com/other")) is True
+        assert hybrid.decision(Url("https://other.com/")) is None
+
+        # Later pages of the domain skip the requests attempt
+        hybrid.requests.get.reset_mock()
+        request = HttpRequest(Url("https://example.com/other"))
+        request.throttle = Mock()
+        hybrid.get(request)
+        hybrid.requests.get.assert_not_called()
+        request.throttle.assert_not_called()
+        assert chrome.get.call_count == 2
+        chrome_class.assert_called_once()
+
+    def test_patterns(self, context, transports):
+        hybrid, chrome, chrome_class = transports
+        hybrid.patterns = {
+            "https://example.com/app/*": True,
+            "*.example.com": False,
+        }
+        assert hybrid.decision(Url("https://example.com/app/x")) is True
+        assert hybrid.decision(Url("https://WWW.example.com/")) is False
+        assert hybrid.decision(Url("https://example.com/")) is None
+
+        # Never rendered, even though the page is an empty shell
+        url = "https://www.example.com/"
+        hybrid.requests.get.return_value = make_response(url, SHELL)
+        hybrid.get(HttpRequest(Url(url)))
+        chrome_class.assert_not_called()
+
+        hybrid.get(HttpRequest(Url("https://example.com/app/x")))
+        chrome.get.assert_called_once()
+
+    def test_user_agent(self, transports):
+        hybrid, chrome, chrome_class = transports
+        hybrid.user_agent = "Bot/1.0"
+        hybrid.requests.user_agent = "Bot/1.0"
+        assert hybrid.user_agent == "Bot/1.0"
+        # Applied to Chrome once it starts
+        assert hybrid.chrome.user_agent == "Bot/1.0"
+        hybrid.user_agent = "Bot/2.0"
+        assert chrome.user_agent == "Bot/2.0"
+
+    def test_http_client_with_hybrid(self, context):
+        client = HttpClient(context, rate_limit=2.0, headers={"X-Test": "1"})
+        hybrid = client.with_hybrid(xpath="//main")
+        assert isinstance(hybrid.transport, HybridTransport)
+        assert hybrid.min_interval == client.min_interval
+        assert hybrid.headers["X-Test"] == "1"
@@ -0,0 +1,214 @@
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ethicrawl.client.http import HttpClient, HttpRequest, HttpResponse
+from ethicrawl.client.http.chrome_transport import ChromeTransport
+from ethicrawl.client.http.render_cache import RenderCache
+from ethicrawl.context import Context
+from ethicrawl.core import Headers, Resource, Url
+
+
+def rendered(url, text="<html><body>Rendered</body></html>", headers=None):
+    return HttpResponse(
+        url=Url(url),
+        request=HttpRequest(Url(url)),
+        status_code=200,
+        text=text,
+        headers=Headers(headers or {"Content-Type": "text/html"}),
+    )
+
+
+class TestRenderCache:
+    def test_validation(self, tmp_path):
+        with pytest.raises(TypeError, match="directory must be a string or Path"):
+            RenderCache(1)
+        with pytest.raises(TypeError, match="max_bytes must be an integer, got str"):
+            RenderCache(tmp_path, max_bytes="1")
+        with pytest.raises(ValueError, match="max_bytes must be at least 1"):
+            RenderCache(tmp_path, max_bytes=0)
+        with pytest.raises(TypeError, match="max_age must be a number, got str"):
+            RenderCache(tmp_path, max_age="1")
+        with pytest.raises(ValueError, match="max_age cannot be negative"):
+            RenderCache(tmp_path, max_age=-1)
+
+    def test_put_get_keyed_on_canonical_url(self, tmp_path):
+        cache = RenderCache(tmp_path)
+        url = Url("https://example.com/a?b=2&a=1")
+        cache.put(url, rendered(str(url)))
+
+        entry = cache.get(Url("HTTPS://Example.com:443/a?a=1&b=2#top"))
+        assert entry is not None
+        response = RenderCache.to_response(entry, HttpRequest(url))
+        assert response.text == "<html><body>Rendered</body></html>"
+        assert response.content == response.text.encode("utf-8")
+        assert cache.get(Url("https://example.com/other")) is None
+
+        # A new cache on the same directory sees earlier entries
+        reopened = RenderCache(tmp_path)
+        assert len(reopened) == 1
+        assert reopened.size == cache.size > 0
+
+        cache.remove(url)
+        assert cache.get(url) is None
+        assert cache.size == 0
+
+    def test_set_cookie_not_stored(self, tmp_path):
+        cache = RenderCache(tmp_path)
+        url = Url("https://example.com/")
+        headers = {"Content-Type": "text/html", "set-cookie": "session=1"}
+        cache.put(url, rendered(str(url), headers=headers))
+        entry = cache.get(url)
+        assert entry is not None
+        assert entry["headers"] == {"Content-Type": "text/html"}
+
+    def test_least_recently_used_evicted(self, tmp_path):
+        page = "x" * 1000
+        probe = RenderCache(tmp_path / "probe")
+        probe.put(Url("https://example.com/0"), rendered("https://example.com/0", page))
+        cache = RenderCache(tmp_path / "cache", max_bytes=probe.size * 2 + 10)
+
+        urls = [Url(f"https://example.com/{i}") for i in range(3)]
+        cache.put(urls[0], rendered(str(urls[0]), page))
+        cache.put(urls[1], rendered(str(urls[1]), page))
+        cache.get(urls[0])  # now the most recently used
+        cache.put(urls[2], rendered(str(urls[2]), page))
+
+        assert cache.get(urls[1]) is None
+        assert cache.get(urls[0]) is not None
+        assert len(cache) == 2
+        assert len(os.listdir(tmp_path / "cache")) == 2
+        assert cache.size <= cache.max_bytes
+
+        # Too large to ever fit
+        cache.put(Url("https://example.com/big"), rendered(str(urls[0]), page * 10))
+        assert cache.get(Url("https://example.com/big")) is None
+
+        cache.clear()
+        assert len(cache) == 0
+        assert os.listdir(tmp_path / "cache") == []
+
+    def test_freshness_and_validators(self, tmp_path):
+        url = Url("https://example.com")
+        cache = RenderCache(tmp_path, max_age=60)
+        cache.put(url, rendered(str(url), headers={"etag": '"v1"'}))
+        entry = cache.get(url)
+        assert cache.is_fresh(entry)
+        assert RenderCache(tmp_path).is_fresh(entry) is False
+        validators = RenderCache.validators(entry)
+        assert validators["If-None-Match"] == '"v1"'
+        assert "If-Modified-Since" not in validators
+
+        entry["stored_at"] = 0
+        assert not cache.is_fresh(entry)
+        cache.refresh(url)
+        assert cache.is_fresh(cache.get(url))
+
+    def test_refresh_keeps_size_accounting(self, tmp_path):
+        url = Url("https://example.com")
+        cache = RenderCache(tmp_path)
+        cache.put(url, rendered(str(url), headers={"etag": '"v1"'}))
+        # A stored_at with fewer digits makes the refreshed file shorter
+        with patch("ethicrawl.client.http.render_cache.time", return_value=1.5):
+            cache.refresh(url)
+        path = next(tmp_path.glob("*.json"))
+        assert cache.size == path.stat().st_size
+        assert RenderCache(tmp_path).size == cache.size
+
+
+class TestChromeTransportCache:
+    @pytest.fixture
+    def driver(self):
+        driver = Mock()
+        driver.page_source = "<html><body>Rendered</body></html>"
+        driver.current_url = "https://www.example.com/"
+        driver.get_log.return_value = []
+        return driver
+
+    def make_transport(self, driver, cache):
+        context = Context(Resource(Url("https://www.example.com")))
+        with patch("selenium.webdriver.Chrome", return_value=driver):
+            transport = ChromeTransport(context, wait_time=0, cache=cache)
+        transport._get_response_information = Mock(
+            return_value=(200, {"ETag": '"v1"'}, "text/html")
+        )
+        transport._revalidator = Mock()
+        return transport
+
+    def test_validation(self):
+        context = Context(Resource(Url("https://www.example.com")))
+        with pytest.raises(TypeError, match="Expected RenderCache, got dict"):
+            ChromeTransport(context, cache={})
+
+    def test_fresh_entries_skip_rendering(self, driver, tmp_path):
+        transport = self.make_transport(driver, RenderCache(tmp_path, max_age=60))
+        request = HttpRequest(Url("https://www.example.com/"))
+
+        first = transport.get(request)
+        second = transport.get(request)
+        assert second.text == first.text
+        driver.get.assert_called_once_with("https://www.example.com/")
+        transport._revalidator.get.assert_not_called()
+
+    def test_revalidation(self, driver, tmp_path):
+        transport = self.make_transport(driver, RenderCache(tmp_path))
+        request = HttpRequest(Url("https://www.example.com/"))
+        transport.get(request)
+
+        # Unchanged: served from the cache after a conditional GET
+        transport._revalidator.get.return_value = Mock(status_code=304)
+        transport.get(request)
+        check = transport._revalidator.get.call_args[0][0]
+        assert check.headers["If-None-Match"] == '"v1"'
+        assert driver.get.call_count == 1
+
+        # Changed: rendered again
+        transport._revalidator.get.return_value = Mock(status_code=200)
+        transport.get(request)
+        assert driver.get.call_count == 2
+
+        # Revalidation failure falls back to rendering
+        transport._revalidator.get.side_effect = IOError("offline")
+        transport.get(request)
+        assert driver.get.call_count == 3
+
+    def test_revalidation_is_rate_limited(self, driver, tmp_path):
+        transport = self.make_transport(driver, RenderCache(tmp_path))
+        request = HttpRequest(Url("https://www.example.com/"))
+        request.throttle = Mock()
+        transport.get(request)
+        request.throttle.assert_not_called()
+
+        # Unchanged: the conditional GET is the only request
+        transport._revalidator.get.return_value = Mock(status_code=304)
+        transport.get(request)
+        request.throttle.assert_not_called()
+
+        # Changed: rendering is a second request and waits its turn
+        transport._revalidator.get.return_value = Mock(status_code=200)
+        transport.get(request)
+        request.throttle.assert_called_once_with()
+
+    def test_credentialed_requests_bypass_cache(self, driver, tmp_path):
+        cache = RenderCache(tmp_path, max_age=60)
+        transport = self.make_transport(driver, cache)
+        url = Url("https://www.example.com/")
+        transport.get(HttpRequest(url))
+
+        for name in ("Cookie", "authorization", "Proxy-Authorization"):
+            transport.get(HttpRequest(url, headers={name: "secret"}))
+        assert driver.get.call_count == 4
+        transport._revalidator.get.assert_not_called()
+
+        cache.clear()
+        transport.get(HttpRequest(url, headers={"Cookie": "session=1"}))
+        assert len(cache) == 0
+
+    def test_client_passes_its_rate_limiter(self):
+        client = HttpClient(rate_limit=0)
+        client.transport = Mock()
+        client.transport.get.return_value = rendered("https://www.example.com/")
+        client.get(Resource(Url("https://www.example.com/")))
+        request = client.transport.get.call_args[0][0]
+        assert request.throttle == client._apply_rate_limiting
@@ -0,0 +1,114 @@
+import gc
+
+import pytest
+
+from ethicrawl.client.http import HttpRequest
+from ethicrawl.config import Config, ConfigSnapshot
+
+
+class TestConfigSnapshot:
+    def test_snapshot_is_cached_until_change(self):
+        config = Config()
+        snapshot = config.snapshot()
+        assert isinstance(snapshot, ConfigSnapshot)
+        assert config.snapshot() is snapshot
+        config.http.timeout = 12
+        fresh = config.snapshot()
+        assert fresh is not snapshot
+        assert fresh.http.timeout == 12.0
+        assert snapshot.http.timeout == 30.0
+
+    def test_in_place_changes_are_detected(self):
+        config = Config()
+        snapshot = config.snapshot()
+        config.http.headers["X-Test"] = "1"
+        assert config.snapshot() is not snapshot
+        assert config.snapshot().http.headers["x-test"] == "1"
+        assert "x-test" not in snapshot.http.headers
+
+        snapshot = config.snapshot()
+        config.logger.set_component_level("robots", "DEBUG")
+        assert config.snapshot().logger.component_levels["robots"] == 10
+
+    def test_snapshot_is_read_only(self):
+        snapshot = Config().snapshot()
+        with pytest.raises(AttributeError, match="snapshots are read-only"):
+            snapshot.http.timeout = 5
+        with pytest.raises(AttributeError, match="snapshots are read-only"):
+            snapshot.http = None
+        with pytest.raises(AttributeError, match="snapshots are read-only"):
+            del snapshot.http.proxies.http
+        with pytest.raises(TypeError):
+            snapshot.logger.component_levels["robots"] = 10
+        with pytest.raises(TypeError, match="snapshots are read-only"):
+            snapshot.http.headers["X-Test"] = "1"
+        with pytest.raises(TypeError, match="snapshots are read-only"):
+            snapshot.http.headers.update({"X-Test": "1"})
+        assert "x-test" not in Config().http.headers
+        # Copies of the frozen headers can be changed
+        headers = snapshot.http.headers.merged({"X-Test": "1"})
+        headers["X-Other"] = "2"
+        assert headers["x-test"] == "1"
+        with pytest.raises(
+            AttributeError, match="No such property: 'nope' on http config"
+        ):
+            snapshot.http.nope
+
+    def test_to_dict_matches_config(self):
+        config = Config()
+        config.http.headers["X-Test"] = "1"
+        data = config.snapshot().to_dict()
+        assert data["http"]["timeout"] == 30.0
+        assert data["http"]["headers"] == {"X-Test": "1"}
+        assert data["http"]["proxies"] == config.http.proxies.to_dict()
+        assert data["sitemap"] == config.sitemap.to_dict()
+
+    def test_subscribe_update_and_refresh(self):
+        received = []
+
+        class Component:
+            def apply(self, snapshot):
+                received.append(snapshot.http.timeout)
+
+        component = Component()
+        config = Config()
+        config.subscribe(component.apply)
+        config.update({"http": {"timeout": 20}})
+        assert received == [20.0]
+        config.http.timeout = 25
+        assert received == [20.0]  # direct sets wait for refresh()
+        config.refresh()
+        assert received == [20.0, 25.0]
+
+        config.unsubscribe(component.apply)
+        config.refresh()
+        assert received == [20.0, 25.0]
+
+    def test_subscribers_are_weak(self):
+        received = []
+
+        class Component:
+            def apply(self, snapshot):
+                received.append(snapshot)
+
+        component = Component()
+        Config().subscribe(component.apply)
+        del component
+        gc.collect()
+        Config().refresh()
+        assert received == []
+
+        Config().subscribe(received.append)
+        Config().refresh()
+        assert len(received) == 1
+        Config().unsubscribe(received.append)
+        with pytest.raises(TypeError, match="Expected callable callback, got int"):
+            Config().subscribe(1)
+
+    def test_request_timeout_follows_config(self):
+        Config().http.timeout = 42
+        assert HttpRequest("https://example.com").timeout == 42.0
+        snapshot = Config().snapshot()
+        Config().http.timeout = 7
+        assert HttpRequest("https://example.com", config=snapshot).timeout == 42.0
+        assert HttpRequest("https://example.com").timeout == 7.0
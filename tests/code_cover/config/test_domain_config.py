@@ -0,0 +1,175 @@
+from threading import Lock, Thread
+from time import sleep
+from unittest.mock import MagicMock
+
+import pytest
+
+from ethicrawl.client.http import HttpClient, HttpResponse
+from ethicrawl.client.http.requests_transport import RequestsTransport
+from ethicrawl.core import Resource
+from ethicrawl.config import Config, DomainConfig
+
+
+class TestDomainConfig:
+    def test_set_and_resolve(self):
+        dc = DomainConfig()
+        assert dc.resolve("https://www.example.com") == {}
+        dc.set_override("*.example.com", timeout=60, rate_limit=2)
+        dc.set_override("https://cdn.example.com/assets", rate_limit=20)
+        assert "https://cdn.example.com" in dc.overrides
+        assert dc.resolve("https://cdn.example.com") == {
+            "timeout": 60.0,
+            "rate_limit": 20.0,
+        }
+        assert dc.resolve("http://cdn.example.com") == {
+            "timeout": 60.0,
+            "rate_limit": 2.0,
+        }
+        assert dc.resolve("https://example.org") == {}
+
+        dc.set_override("https://cdn.example.com", jitter=0.1)
+        assert dc.resolve("https://cdn.example.com")["jitter"] == 0.1
+        dc.remove_override("https://cdn.example.com")
+        dc.remove_override("*.unknown.com")
+        assert dc.resolve("https://cdn.example.com")["rate_limit"] == 2.0
+        assert dc.to_dict() == {
+            "overrides": {"*.example.com": {"timeout": 60.0, "rate_limit": 2.0}}
+        }
+
+    def test_validation(self):
+        dc = DomainConfig()
+        with pytest.raises(ValueError, match="maximum timeout is 300 seconds"):
+            dc.set_override("*.example.com", timeout=301)
+        with pytest.raises(TypeError, match="requests must be an integer"):
+            dc.set_override("*.example.com", requests="4")
+        with pytest.raises(
+            AttributeError, match="No such property: 'user_agent' on domains config"
+        ):
+            dc.set_override("*.example.com", user_agent="Bot")
+        with pytest.raises(TypeError, match="pattern must be a string, got int"):
+            dc.set_override(1, timeout=5)
+        with pytest.raises(ValueError, match="pattern cannot be empty"):
+            dc.set_override(" ", timeout=5)
+        with pytest.raises(TypeError, match="overrides must be a dictionary, got list"):
+            dc.overrides = []
+        with pytest.raises(
+            TypeError, match="settings for a.com must be a dictionary, got int"
+        ):
+            dc.overrides = {"a.com": 1}
+        assert dc.overrides == {}
+
+    def test_config_update_and_snapshot(self):
+        config = Config()
+        config.concurrency.enabled = True
+        config.update(
+            {"domains": {"overrides": {"*.partner.com": {"timeout": 120, "chrome": 2}}}}
+        )
+        snapshot = config.snapshot()
+        assert snapshot.for_domain("https://www.example.com") is snapshot
+        domain = snapshot.for_domain("https://www.partner.com")
+        assert domain.http.timeout == 120.0
+        assert domain.concurrency.chrome == 2
+        assert domain.http.rate_limit == snapshot.http.rate_limit
+        assert snapshot.http.timeout == 30.0
+        assert domain.to_dict()["domains"] == config.domains.to_dict()
+
+        config.concurrency.enabled = False
+        domain = config.snapshot().for_domain("https://www.partner.com")
+        assert domain.concurrency.chrome == -1
+
+    def test_http_client_for_domain(self):
+        Config().domains.set_override(
+            "https://slow.example.com", timeout=90, rate_limit=0.25, jitter=0.0
+        )
+        client = HttpClient(rate_limit=1.0)
+        snapshot = Config().snapshot()
+        assert client.for_domain("https://www.example.com", snapshot) is client
+
+        domain_client = client.for_domain("https://slow.example.com", snapshot)
+        assert domain_client is not client
+        assert domain_client.transport is client.transport
+        assert domain_client.min_interval == 4.0
+        assert domain_client.jitter == 0.0
+        assert client.min_interval == 1.0
+        assert domain_client._config.http.timeout == 90.0
+
+        Config().update({"http": {"max_retries": 5}})
+        assert domain_client._config.http.max_retries == 5
+        assert domain_client._config.http.timeout == 90.0
+        assert client._config.http.timeout == 30.0
+
+    def test_retry_overrides_change_behaviour(self):
+        config = Config()
+        config.update({"http": {"max_retries": 2, "retry_delay": 0}})
+        config.domains.set_override("https://flaky.example.com", max_retries=0)
+        response = MagicMock(spec=HttpResponse, status_code=200, content=b"ok")
+        client = HttpClient(rate_limit=0)
+        client.transport = MagicMock(spec=RequestsTransport)
+        client.transport.get.side_effect = [IOError("reset"), response]
+        assert client.get(Resource("https://www.example.com")) is response
+        assert client.transport.get.call_count == 2
+
+        domain_client = client.for_domain(
+            "https://flaky.example.com", config.snapshot()
+        )
+        client.transport.get.side_effect = [IOError("reset"), response]
+        with pytest.raises(IOError, match="HTTP request failed: reset"):
+            domain_client.get(Resource("https://flaky.example.com"))
+        assert client.transport.get.call_count == 3
+
+    def test_retries_are_opt_in_and_limited_to_transport_errors(self):
+        response = MagicMock(spec=HttpResponse, status_code=200, content=b"ok")
+        client = HttpClient(rate_limit=0)
+        client.transport = MagicMock(spec=RequestsTransport)
+        client.transport.get.side_effect = [IOError("reset"), response]
+        with pytest.raises(IOError, match="HTTP request failed: reset"):
+            client.get(Resource("https://www.example.com"))
+        assert client.transport.get.call_count == 1
+
+        Config().update({"http": {"max_retries": 2, "retry_delay": 0}})
+        client = HttpClient(rate_limit=0)
+        client.transport = MagicMock(spec=RequestsTransport)
+        client.transport.get.side_effect = [TypeError("bug"), response]
+        with pytest.raises(IOError, match="HTTP request failed: bug"):
+            client.get(Resource("https://www.example.com"))
+        assert client.transport.get.call_count == 1
+
+    def test_concurrency_override_limits_requests_in_flight(self):
+        config = Config()
+        config.concurrency.enabled = True
+        config.domains.set_override("https://small.example.com", requests=1)
+        client = HttpClient(rate_limit=0)
+        in_flight, peak = [0], [0]
+        lock = Lock()
+        response = MagicMock(spec=HttpResponse, status_code=200, content=b"ok")
+
+        def get(request):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+            return response
+
+        client.transport = MagicMock(spec=RequestsTransport)
+        client.transport.get.side_effect = get
+
+        def crawl(target):
+            threads = [
+                Thread(target=target.get, args=(Resource(f"{url}/{i}"),))
+                for i in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        url = "https://small.example.com"
+        crawl(client.for_domain(url, config.snapshot()))
+        assert peak[0] == 1
+
+        peak[0] = 0
+        url = "https://www.example.com"
+        crawl(client)
+        assert peak[0] == 3
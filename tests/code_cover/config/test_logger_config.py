@@ -65,3 +65,19 @@ class TestLoggerConfig:
     def test_component_levels(self):
         lc = LoggerConfig()
         lc.set_component_level("foo", 10)
+
+    def test_queue_settings(self):
+        lc = LoggerConfig()
+        assert lc.queue_enabled is False
+        lc.queue_enabled = True
+        lc.queue_size = 100
+        lc.queue_drop_level = "INFO"
+        assert lc.to_dict()["queue_drop_level"] == 20
+        with pytest.raises(TypeError, match="queue_enabled must be a boolean"):
+            lc.queue_enabled = "yes"
+        with pytest.raises(TypeError, match="queue_size must be an integer, got str"):
+            lc.queue_size = "100"
+        with pytest.raises(ValueError, match="queue_size must be at least 1"):
+            lc.queue_size = 0
+        with pytest.raises(ValueError, match="Invalid log level name"):
+            lc.queue_drop_level = "NOISE"
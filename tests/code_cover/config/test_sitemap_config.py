@@ -22,3 +22,16 @@ class TestSitemapConfig:
             sc.follow_external = "foo"
         with pytest.raises(TypeError, match="validate_urls must be a boolean"):
             sc.validate_urls = "foo"
+
+    def test_spill_threshold(self):
+        sc = SitemapConfig()
+        assert sc.spill_threshold is None
+        sc.spill_threshold = 1000
+        assert sc.to_dict()["spill_threshold"] == 1000
+        sc.spill_threshold = None
+        with pytest.raises(ValueError, match="spill_threshold must be at least 1"):
+            sc.spill_threshold = 0
+        with pytest.raises(
+            TypeError, match="spill_threshold must be an integer or None, got str"
+        ):
+            sc.spill_threshold = "10"
@@ -132,3 +132,79 @@ class TestHeaders:
         assert (
             headers.get("nonexistent", "custom-default") == "custom-default"
         )  # Missing with default
+
+    def test_preserves_original_case(self):
+        headers = Headers({"Content-Type": "text/html", "X-Custom": 1})
+        assert list(headers) == ["Content-Type", "X-Custom"]
+        assert dict(headers) == {"Content-Type": "text/html", "X-Custom": "1"}
+        headers["x-custom"] = "2"
+        assert dict(headers.items()) == {"Content-Type": "text/html", "x-custom": "2"}
+        assert list(headers.lower_items()) == [
+            ("content-type", "text/html"),
+            ("x-custom", "2"),
+        ]
+        del headers["CONTENT-TYPE"]
+        assert len(headers) == 1
+        with pytest.raises(KeyError):
+            del headers["content-type"]
+        with pytest.raises(KeyError):
+            headers["content-type"]
+        with pytest.raises(TypeError, match="Header keys must be strings, got int"):
+            del headers[1]
+
+    def test_copy_on_write(self):
+        import copy
+        import pickle
+
+        original = Headers({"Accept": "text/html"})
+        shared = Headers(original)
+        assert shared._store is original._store
+        shared["Accept"] = "application/json"
+        assert original["accept"] == "text/html"
+        original["X-Other"] = "1"
+        assert "x-other" not in shared
+
+        for clone in (
+            original.copy(),
+            copy.copy(original),
+            copy.deepcopy(original),
+            pickle.loads(pickle.dumps(original)),
+        ):
+            clone["Accept"] = None
+            assert clone == {"x-other": "1"}
+            assert original["Accept"] == "text/html"
+
+    def test_merged(self):
+        base = Headers({"User-Agent": "a", "Accept": "text/html"})
+        merged = base.merged({"user-agent": "b", "Accept": None, "X-New": "c"})
+        assert dict(merged) == {"user-agent": "b", "X-New": "c"}
+        assert dict(base) == {"User-Agent": "a", "Accept": "text/html"}
+        unchanged = base.merged(None)
+        assert unchanged._store is base._store
+        assert Headers().merged(base)._store is base._store
+        layered = Headers({"A": "1"})
+        layered.update(Headers({"B": "2"}), C=3)
+        assert dict(layered) == {"A": "1", "B": "2", "C": "3"}
+        layered.update([("a", "4"), ("B", None)])
+        assert dict(layered) == {"a": "4", "C": "3"}
+        assert layered.get("X-Missing", "none") == "none"
+        assert not isinstance(layered, dict)
+
+    def test_from_case_insensitive_dict(self):
+        from requests.structures import CaseInsensitiveDict
+
+        source = CaseInsensitiveDict({"Content-Type": "text/html"})
+        headers = Headers(source)
+        assert dict(headers) == {"Content-Type": "text/html"}
+        source["Content-Type"] = "text/plain"
+        assert headers["content-type"] == "text/html"
+        # Non-string values still go through conversion
+        assert Headers(CaseInsensitiveDict({"X-Count": 5}))["x-count"] == "5"
+
+    def test_equality(self):
+        headers = Headers({"Content-Type": "text/html"})
+        assert headers == Headers({"content-type": "text/html"})
+        assert headers == {"CONTENT-TYPE": "text/html"}
+        assert headers != {"Content-Type": "text/plain"}
+        assert headers != "Content-Type"
+        assert repr(headers) == "{'Content-Type': 'text/html'}"
@@ -0,0 +1,177 @@
+import pytest
+import re
+from socket import gaierror
+from threading import Event
+from unittest.mock import patch
+
+from ethicrawl.core import Resolver, Url
+from ethicrawl.error import DomainResolutionError
+
+
+class StubBackend:
+    def __init__(self, addresses):
+        self.addresses = addresses
+        self.calls = []
+
+    def __call__(self, hostname):
+        self.calls.append(hostname)
+        if hostname not in self.addresses:
+            raise gaierror(-2, "Name or service not known")
+        return self.addresses[hostname]
+
+
+class TestResolver:
+    def test_resolve_is_cached(self):
+        backend = StubBackend({"example.com": "93.184.216.34"})
+        resolver = Resolver(backend=backend)
+        assert resolver.resolve("example.com") == "93.184.216.34"
+        assert resolver.resolve("example.com") == "93.184.216.34"
+        assert backend.calls == ["example.com"]
+        resolver.clear()
+        resolver.resolve("example.com")
+        assert backend.calls == ["example.com", "example.com"]
+
+    def test_negative_caching(self):
+        backend = StubBackend({})
+        resolver = Resolver(backend=backend)
+        assert resolver.resolve("missing.example") is None
+        assert resolver.resolve("missing.example") is None
+        assert backend.calls == ["missing.example"]
+
+        resolver = Resolver(backend=backend, negative_ttl=0)
+        resolver.resolve("missing.example")
+        resolver.resolve("missing.example")
+        assert len(backend.calls) == 3
+
+    def test_ttl_expiry(self):
+        backend = StubBackend({"example.com": "127.0.0.1"})
+        resolver = Resolver(backend=backend, ttl=10)
+        with patch("ethicrawl.core.resolver.monotonic", return_value=100.0):
+            resolver.resolve("example.com")
+            resolver.resolve("example.com")
+        with patch("ethicrawl.core.resolver.monotonic", return_value=111.0):
+            resolver.resolve("example.com")
+        assert len(backend.calls) == 2
+
+    def test_timeout_is_not_cached(self):
+        release = Event()
+
+        def slow(hostname):
+            release.wait(5)
+            return "127.0.0.1"
+
+        resolver = Resolver(backend=slow, timeout=0.05)
+        assert resolver.resolve("slow.example") is None
+        release.set()
+        assert resolver.resolve("slow.example") == "127.0.0.1"
+
+    def test_resolve_many(self):
+        backend = StubBackend({"a.example": "10.0.0.1", "b.example": "10.0.0.2"})
+        resolver = Resolver(backend=backend, max_workers=4)
+        resolver.resolve("a.example")
+        results = resolver.resolve_many(
+            ["a.example", "b.example", "c.example", "b.example"]
+        )
+        assert results == {
+            "a.example": "10.0.0.1",
+            "b.example": "10.0.0.2",
+            "c.example": None,
+        }
+        assert sorted(backend.calls) == ["a.example", "b.example", "c.example"]
+        assert resolver.resolve_many([]) == {}
+
+    def test_resolve_many_timeout(self):
+        release = Event()
+
+        def slow(hostname):
+            if hostname == "slow.example":
+                release.wait(5)
+            return "127.0.0.1"
+
+        resolver = Resolver(backend=slow)
+        results = resolver.resolve_many(["fast.example", "slow.example"], timeout=0.2)
+        release.set()
+        assert results == {"fast.example": "127.0.0.1", "slow.example": None}
+
+    def test_cache_size_is_bounded(self):
+        backend = StubBackend({f"{i}.example": "127.0.0.1" for i in range(5)})
+        resolver = Resolver(backend=backend, ttl=10, max_entries=3)
+        with patch("ethicrawl.core.resolver.monotonic", return_value=100.0):
+            for i in range(3):
+                resolver.resolve(f"{i}.example")
+            # Full: the oldest entry makes room
+            resolver.resolve("3.example")
+        assert list(resolver._cache) == ["1.example", "2.example", "3.example"]
+
+        with patch("ethicrawl.core.resolver.monotonic", return_value=111.0):
+            resolver.resolve("4.example")
+        # Every entry had expired, so all of them went
+        assert list(resolver._cache) == ["4.example"]
+
+    def test_concurrent_lookups_of_a_host_are_shared(self):
+        release = Event()
+        calls = []
+
+        def slow(hostname):
+            calls.append(hostname)
+            release.wait(5)
+            return "127.0.0.1"
+
+        resolver = Resolver(backend=slow, timeout=0.05)
+        assert resolver.resolve("slow.example") is None
+        assert resolver.resolve("slow.example") is None
+        assert calls == ["slow.example"]
+        lookup = resolver._inflight["slow.example"]
+        release.set()
+        lookup.result(1)
+        assert resolver.resolve("slow.example") == "127.0.0.1"
+        assert calls == ["slow.example"]
+
+    def test_close_shuts_down_pool(self):
+        resolver = Resolver(backend=lambda host: "127.0.0.1")
+        assert resolver.resolve("a.example") == "127.0.0.1"
+        pool = resolver._pool
+        resolver.close()
+        assert resolver._pool is None
+        assert pool._shutdown
+        resolver.close()  # closing twice is harmless
+        # Still usable: new threads are started on demand
+        assert resolver.resolve("b.example") == "127.0.0.1"
+
+        Resolver.set_default(resolver)
+        Resolver.set_default(None)
+        assert resolver._pool is None
+
+    def test_invalid_arguments(self):
+        with pytest.raises(TypeError, match="Expected callable backend, got int"):
+            Resolver(backend=1)
+        with pytest.raises(ValueError, match="ttl cannot be negative"):
+            Resolver(ttl=-1)
+        with pytest.raises(TypeError, match="negative_ttl must be a number, got str"):
+            Resolver(negative_ttl="1")
+        with pytest.raises(ValueError, match="timeout must be positive"):
+            Resolver(timeout=0)
+        with pytest.raises(ValueError, match="max_workers must be at least 1"):
+            Resolver(max_workers=0)
+        with pytest.raises(TypeError, match="max_entries must be an integer, got str"):
+            Resolver(max_entries="1")
+        with pytest.raises(ValueError, match="max_entries must be at least 1"):
+            Resolver(max_entries=0)
+        with pytest.raises(TypeError, match="Expected str, got int"):
+            Resolver().resolve(1)
+        with pytest.raises(TypeError, match="Expected Resolver, got str"):
+            Resolver.set_default("resolver")
+
+    def test_url_validation_uses_default_resolver(self):
+        backend = StubBackend({"www.example.com": "127.0.0.1"})
+        Resolver.set_default(Resolver(backend=backend))
+        Url("https://www.example.com/a", validate=True)
+        Url("https://www.example.com/b", validate=True)
+        assert backend.calls == ["www.example.com"]
+        with pytest.raises(
+            DomainResolutionError,
+            match=re.escape(
+                "Cannot resolve hostname 'nx.example.com' for URL 'https://nx.example.com'"
+            ),
+        ):
+            Url("https://nx.example.com", validate=True)
@@ -0,0 +1,96 @@
+import io
+
+import pytest
+
+from ethicrawl.core import (
+    Resource,
+    ResourceList,
+    ResourceReader,
+    ResourceWriter,
+    Url,
+)
+from ethicrawl.sitemaps import IndexEntry, UrlsetEntry
+
+
+class TestResourceIO:
+    def resources(self):
+        return ResourceList(
+            [
+                Resource("https://example.com/plain"),
+                UrlsetEntry(
+                    "https://example.com/page",
+                    lastmod="2024-03-01T10:00:00Z",
+                    changefreq="daily",
+                    priority="0.7",
+                ),
+                IndexEntry("https://example.com/sitemap.xml", lastmod="2024-03-01"),
+            ]
+        )
+
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "inventory.jsonl"
+        original = self.resources()
+        assert original.save(path) == 3
+        for validate in (True, False):
+            restored = ResourceList.load(path, validate=validate)
+            assert [type(r) for r in restored] == [Resource, UrlsetEntry, IndexEntry]
+            assert restored.to_list() == original.to_list()
+            entry = restored[1]
+            assert isinstance(entry.url, Url)
+            assert entry.priority == 0.7
+            assert entry.changefreq == "daily"
+
+    def test_streaming_file_objects(self):
+        buffer = io.StringIO()
+        with ResourceWriter(buffer) as writer:
+            writer.write(Resource("https://example.com/1"))
+            assert writer.write_all(self.resources()) == 3
+            assert writer.count == 4
+        buffer.seek(0)
+        reader = ResourceReader(buffer, validate=False)
+        assert [str(r.url) for r in reader][:2] == [
+            "https://example.com/1",
+            "https://example.com/plain",
+        ]
+
+    def test_load_into_spilling_list(self, tmp_path):
+        path = tmp_path / "inventory.jsonl"
+        self.resources().save(path)
+        restored = ResourceList.load(path, spill_threshold=2, indexed=True)
+        assert restored.spilled
+        assert restored.index_of("https://example.com/sitemap.xml") == 2
+
+    def test_validation_on_load(self):
+        line = '{"type":"UrlsetEntry","url":"https://example.com","priority":5}\n'
+        data = '{"format":"ethicrawl.resources","version":1}\n' + line
+        with pytest.raises(ValueError, match="Priority must be between 0.0 and 1.0"):
+            list(ResourceReader(io.StringIO(data)))
+        # Trusted loads skip the validators
+        (entry,) = ResourceReader(io.StringIO(data), validate=False)
+        assert entry.priority == 5
+
+    def test_invalid_files(self):
+        with pytest.raises(ValueError, match="Not an ethicrawl resource file"):
+            ResourceReader(io.StringIO("not json\n"))
+        with pytest.raises(ValueError, match="Not an ethicrawl resource file"):
+            ResourceReader(io.StringIO(""))
+        with pytest.raises(ValueError, match="Unsupported resource file version: 9"):
+            ResourceReader(io.StringIO('{"format":"ethicrawl.resources","version":9}'))
+        with pytest.raises(TypeError, match="Expected path or file object, got int"):
+            ResourceReader(1)
+        with pytest.raises(TypeError, match="Expected path or file object, got int"):
+            ResourceWriter(1)
+        with pytest.raises(TypeError, match="Expected Resource, got str"):
+            ResourceWriter(io.StringIO()).write("https://example.com")
+
+    def test_from_dict(self):
+        with pytest.raises(ValueError, match="Unknown resource type: Nope"):
+            Resource.from_dict({"type": "Nope", "url": "https://example.com"})
+        with pytest.raises(ValueError, match="Unknown resource type: Resource"):
+            UrlsetEntry.from_dict({"type": "Resource", "url": "https://example.com"})
+        with pytest.raises(ValueError, match="Missing field for Resource: url"):
+            Resource.from_dict({}, validate=False)
+        with pytest.raises(TypeError, match="Expected dict, got list"):
+            Resource.from_dict([])
+        entry = UrlsetEntry.from_dict({"url": "https://example.com"})
+        assert type(entry) is UrlsetEntry
@@ -1,6 +1,16 @@
 import pytest
 
-from ethicrawl.core import Resource, ResourceList
+import re
+from unittest.mock import patch
+
+from ethicrawl.core import (
+    Resource,
+    ResourceFilter,
+    ResourceList,
+    ResourceListView,
+    Url,
+)
+from ethicrawl.core.spill_store import SpillStore
 
 
 class TestResourceList:
@@ -120,3 +130,386 @@ class TestResourceList:
         assert len(rl) == 5
         assert rl[0] == r1
         assert rl[4] == r5
+
+    def test_contains_and_index_of(self):
+        r1 = Resource("https://www.example.com/one")
+        r2 = Resource("https://www.example.com/two")
+        for indexed in (False, True):
+            rl = ResourceList([r1, r2, r1], indexed=indexed)
+            assert rl.indexed == indexed
+            assert r2 in rl
+            assert Url("https://www.example.com/one") in rl
+            assert "https://www.example.com/two" in rl
+            assert "https://www.example.com/three" not in rl
+            assert 1 not in rl
+            assert rl.index_of(r1) == 0
+            assert rl.index_of("https://www.example.com/two") == 1
+            assert rl.index_of(Url("https://www.example.com/two")) == 1
+            with pytest.raises(ValueError, match="is not in ResourceList"):
+                rl.index_of("https://www.example.com/three")
+            with pytest.raises(
+                TypeError, match="Expected Resource, Url, or str, got int"
+            ):
+                rl.index_of(1)
+
+    def test_index_preserved_by_slice_and_filter(self):
+        rl = ResourceList(
+            [Resource(f"https://www.example.com/{i}") for i in range(5)], indexed=True
+        )
+        sliced = rl[2:]
+        assert sliced.indexed
+        assert sliced.index_of("https://www.example.com/3") == 1
+        filtered = rl.filter("4")
+        assert filtered.indexed
+        assert "https://www.example.com/4" in filtered
+
+    def test_dedupe(self):
+        r1 = Resource("https://www.example.com/one")
+        r2 = Resource("https://www.example.com/two")
+        r3 = Resource("https://www.example.com:443/one?utm_source=feed")
+        rl = ResourceList([r1, r2, r1, r3])
+        assert rl.dedupe().to_list() == [r1, r2, r3]
+        assert rl.dedupe(canonical=True).to_list() == [r1, r2]
+        assert len(rl) == 4
+
+    def test_set_operations(self):
+        a, b, c, d = (Resource(f"https://www.example.com/{x}") for x in "abcd")
+        today = ResourceList([a, b, c, c])
+        yesterday = ResourceList([b, c, d], indexed=True)
+
+        assert today.union(yesterday).to_list() == [a, b, c, d]
+        assert today.difference(yesterday).to_list() == [a]
+        assert yesterday.difference(today).to_list() == [d]
+        assert today.intersection(yesterday).to_list() == [b, c]
+
+        variant = ResourceList([Resource("https://WWW.example.com/a#top")])
+        assert today.intersection(variant).to_list() == []
+        assert today.intersection(variant, canonical=True).to_list() == [a]
+        assert len(today.union(variant, canonical=True)) == 3
+
+        with pytest.raises(TypeError, match="Expected ResourceList, got list"):
+            today.union([a])
+        with pytest.raises(TypeError, match="Expected ResourceList, got list"):
+            today.difference([a])
+
+    def test_bulk_extend(self):
+        r1 = Resource("https://www.example.com/one")
+        r2 = Resource("https://www.example.com/two")
+        rl = ResourceList([r1], indexed=True)
+        rl.extend(ResourceList([r2, r1]))
+        assert rl.to_list() == [r1, r2, r1]
+        assert rl.index_of(r2) == 1
+        rl.extend(r for r in [r2])
+        assert len(rl) == 4
+
+        # validation happens before anything is added
+        with pytest.raises(TypeError, match="Expected Resource, got str"):
+            rl.extend([r1, "https://www.example.com/three"])
+        assert len(rl) == 4
+
+        trusted = ResourceList([r1, r2], validate=False)
+        assert len(trusted) == 2
+
+    def test_slice_does_not_share_storage(self):
+        rl = ResourceList([Resource(f"https://www.example.com/{i}") for i in range(3)])
+        sliced = rl[:2]
+        sliced.append(Resource("https://www.example.com/new"))
+        assert len(rl) == 3
+
+    def test_view(self):
+        resources = [Resource(f"https://www.example.com/{i}") for i in range(10)]
+        rl = ResourceList(resources)
+        view = rl.view(2, 8)
+        assert isinstance(view, ResourceListView)
+        assert len(view) == 6
+        assert view[0] == resources[2]
+        assert view[-1] == resources[7]
+        assert list(view) == resources[2:8]
+        assert list(view[::2]) == resources[2:8:2]
+        assert list(rl.view(step=-3)) == resources[::-3]
+        assert view.to_list() == resources[2:8]
+        copy = view.to_resource_list()
+        assert isinstance(copy, ResourceList)
+        assert len(copy) == 6
+        assert repr(rl.view(0, 1)) == (
+            "ResourceListView([Resource('https://www.example.com/0')])"
+        )
+
+        # appending to the list does not change an existing view
+        rl.append(Resource("https://www.example.com/10"))
+        assert len(rl.view()) == 11
+        assert len(rl.view(5)) == 6
+        assert len(view) == 6
+
+    def test_resource_filter_include_exclude(self):
+        urls = [
+            "https://example.com/products/1",
+            "https://example.com/products/2?page=3",
+            "https://example.com/blog/post",
+            "https://example.com/blog/drafts/x",
+            "https://example.com/about",
+        ]
+        resources = ResourceList([Resource(u) for u in urls])
+        rule = ResourceFilter(
+            include=[r"/products/", r"/blog/"], exclude=[r"\?page=", r"/drafts/"]
+        )
+        assert [str(r.url) for r in resources.filter(rule)] == [urls[0], urls[2]]
+        # No include patterns means everything not excluded
+        assert len(resources.filter(ResourceFilter(exclude="/blog/"))) == 3
+        assert len(resources.filter(ResourceFilter())) == 5
+
+    def test_resource_filter_mixed_flags(self):
+        resources = ResourceList(
+            [Resource("https://example.com/FOO"), Resource("https://example.com/bar")]
+        )
+        rule = ResourceFilter(include=[re.compile("foo", re.I), "bar"])
+        assert len(resources.filter(rule)) == 2
+        assert len(rule._include) == 2
+
+    def test_resource_filter_patterns_that_cannot_merge_naively(self):
+        urls = [
+            "https://example.com/B/",
+            "https://example.com/bb",
+            "https://example.com/x-1",
+            "https://example.com/c",
+        ]
+        resources = ResourceList([Resource(url) for url in urls])
+
+        def included(*patterns):
+            rule = ResourceFilter(include=list(patterns))
+            return [str(r.url) for r in resources.filter(rule)]
+
+        # Inline global flags
+        assert included(r"(?i)/b/", r"(?i)/c$") == [urls[0], urls[3]]
+        assert included(r"(?i)/b/") == [
+            str(r.url) for r in resources.filter(r"(?i)/b/")
+        ]
+        # The same group name in several patterns
+        assert included(r"/(?P<part>bb)", r"/(?P<part>c)") == [urls[1], urls[3]]
+        # Numbered backreferences keep their numbering
+        assert included(r"/(x)-1", r"(b)\1") == [urls[1], urls[2]]
+        # Verbose patterns ending in a comment
+        assert included(r"(?x) /bb  # doubled", r"(?x) /c$  # single") == [
+            urls[1],
+            urls[3],
+        ]
+        assert len(ResourceFilter(include=[r"(?i)/b/", r"(?i)/c$"])._include) == 1
+
+    def test_resource_filter_predicates(self):
+        resources = ResourceList(
+            [Resource(f"https://example.com/{i}") for i in range(5)]
+        )
+        rule = ResourceFilter(
+            include="example", predicates=[lambda r: r.url.path in ("/1", "/3")]
+        )
+        assert [r.url.path for r in resources.filter(rule)] == ["/1", "/3"]
+        assert rule(resources[1]) and not rule(resources[0])
+        with pytest.raises(TypeError, match="Expected callable predicate, got int"):
+            ResourceFilter(predicates=[1])
+        with pytest.raises(TypeError, match="Expected str or Pattern, got int"):
+            ResourceFilter(include=[1])
+
+    def test_filter_iter_is_lazy(self):
+        seen = []
+
+        def predicate(resource):
+            seen.append(resource)
+            return True
+
+        resources = ResourceList(
+            [Resource(f"https://example.com/{i}") for i in range(5)]
+        )
+        matches = resources.filter_iter(ResourceFilter(predicates=[predicate]))
+        assert seen == []
+        assert next(matches) == resources[0]
+        assert len(seen) == 1
+        assert list(resources.filter_iter("/[24]")) == [resources[2], resources[4]]
+
+    def test_filter_rejects_invalid_rule(self):
+        with pytest.raises(
+            TypeError, match="Expected str, Pattern, or ResourceFilter, got int"
+        ):
+            ResourceList().filter(1)
+
+    def spilling(self, count, threshold=4, **kwargs):
+        resources = ResourceList(spill_threshold=threshold, **kwargs)
+        for i in range(count):
+            resources.append(Resource(f"https://example.com/{i}"))
+        return resources
+
+    def test_spill_transparent(self, tmp_path):
+        resources = self.spilling(10, spill_dir=str(tmp_path))
+        assert resources.spilled
+        assert len(resources) == 10
+        assert [r.url.path for r in resources] == [f"/{i}" for i in range(10)]
+        assert resources[0] == Resource("https://example.com/0")
+        assert resources[-1] == Resource("https://example.com/9")
+        assert resources[2:5].to_list() == [
+            Resource(f"https://example.com/{i}") for i in range(2, 5)
+        ]
+        assert resources.to_list() == self.spilling(10).to_list()
+        assert "https://example.com/3" in resources
+        assert resources.index_of("https://example.com/7") == 7
+        with pytest.raises(IndexError):
+            resources[10]
+
+    def test_spill_below_threshold(self):
+        resources = self.spilling(3)
+        assert not resources.spilled
+        assert len(resources) == 3
+        assert not ResourceList().spilled
+
+    def test_spill_results_keep_spilling(self):
+        resources = self.spilling(10)
+        resources.extend(self.spilling(10))
+        assert len(resources) == 20
+        filtered = resources.filter(r"/[0-4]$")
+        assert filtered.spilled
+        assert [r.url.path for r in filtered] == [f"/{i}" for i in range(5)] * 2
+        deduped = resources.dedupe()
+        assert len(deduped) == 10 and deduped.spilled
+        resources.extend(resources)
+        assert len(resources) == 40
+
+    def test_spill_indexed_and_views(self):
+        resources = self.spilling(10, indexed=True)
+        assert resources.index_of("https://example.com/9") == 9
+        assert [r.url.path for r in resources.view(3, 9, 2)] == ["/3", "/5", "/7"]
+        assert [r.url.path for r in resources.view(8)] == ["/8", "/9"]
+
+    def test_spill_round_trips_subclasses(self):
+        from ethicrawl.sitemaps import UrlsetEntry
+
+        entries = [
+            UrlsetEntry(
+                f"https://example.com/{i}",
+                lastmod="2025-03-03",
+                changefreq="daily",
+                priority=0.5,
+            )
+            for i in range(6)
+        ]
+        resources = ResourceList(entries, spill_threshold=2)
+        assert resources.spilled
+        restored = resources[1]
+        assert isinstance(restored, UrlsetEntry)
+        assert restored == entries[1]
+        assert (restored.lastmod, restored.changefreq, restored.priority) == (
+            entries[1].lastmod,
+            "daily",
+            0.5,
+        )
+
+    def test_spill_indexing_streams(self):
+        """Indexing new items does not slice (load) the spilled list."""
+        resources = self.spilling(10, indexed=True)
+        with patch.object(
+            SpillStore, "__getitem__", side_effect=AssertionError("sliced")
+        ):
+            resources.extend(self.spilling(10))
+        assert resources.index_of("https://example.com/9") == 9
+
+    def test_spill_failure_leaves_store_intact(self):
+        from dataclasses import dataclass
+        from datetime import datetime
+
+        @dataclass
+        class Stamped(Resource):
+            seen: datetime | None = None
+
+        store = SpillStore(3)
+        store.append(Resource("https://example.com/0"))
+        store.append(Stamped("https://example.com/1", seen=datetime(2025, 1, 1)))
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            store.append(Resource("https://example.com/2"))
+        assert len(store) == 2
+        assert store.spilled == 0
+        assert [r.url.path for r in store] == ["/0", "/1"]
+
+        # A failed write is overwritten by the next one
+        good = SpillStore(2)
+        good.extend(Resource(f"https://example.com/{i}") for i in range(2))
+        good._file.write(b"partial")
+        good.extend(Resource(f"https://example.com/{i}") for i in range(2, 4))
+        assert [r.url.path for r in good] == ["/0", "/1", "/2", "/3"]
+
+    def test_spill_close(self):
+        resources = self.spilling(10, indexed=True)
+        resources.close()
+        assert len(resources) == 0
+        assert "https://example.com/1" not in resources
+        plain = self.spilling(2, threshold=None)
+        plain.close()
+        assert len(plain) == 0
+
+    def test_spill_invalid_threshold(self):
+        with pytest.raises(ValueError, match="spill_threshold must be at least 1"):
+            ResourceList(spill_threshold=0)
+        with pytest.raises(
+            TypeError, match="spill_threshold must be an integer, got float"
+        ):
+            ResourceList(spill_threshold=1.5)
+
+    def test_group_by_base(self):
+        resources = ResourceList(
+            [
+                Resource("https://a.example/1"),
+                Resource("https://b.example/1"),
+                Resource("https://a.example/2"),
+                Resource("http://a.example/3"),
+            ]
+        )
+        groups = resources.group_by_base()
+        assert list(groups) == [
+            "https://a.example",
+            "https://b.example",
+            "http://a.example",
+        ]
+        assert [r.url.path for r in groups["https://a.example"]] == ["/1", "/2"]
+
+    def test_partition_by_host(self):
+        resources = ResourceList(
+            [
+                Resource(f"{scheme}://host{i % 7}.example/{i}")
+                for i in range(70)
+                for scheme in ("http", "https")
+            ]
+        )
+        parts = resources.partition(3)
+        assert len(parts) == 3
+        assert sum(len(part) for part in parts) == len(resources)
+        hosts = [{r.url.hostname for r in part} for part in parts]
+        for i, part_hosts in enumerate(hosts):
+            for host in part_hosts:
+                assert ResourceList.shard_for(host, 3) == i
+                assert all(host not in other for other in hosts[i + 1 :])
+        # Relative order is kept within each part
+        for part in parts:
+            positions = [resources.index_of(r) for r in part]
+            assert positions == sorted(positions)
+
+    def test_partition_custom_key_and_spill(self):
+        resources = self.spilling(10)
+        parts = resources.partition(2, key=lambda r: r.url.path)
+        assert sum(len(part) for part in parts) == 10
+        assert [len(p) for p in parts] == [
+            sum(ResourceList.shard_for(f"/{i}", 2) == n for i in range(10))
+            for n in range(2)
+        ]
+        assert len(ResourceList().partition(4)) == 4
+
+    def test_shard_for(self):
+        assert ResourceList.shard_for("example.com", 1) == 0
+        shards = [ResourceList.shard_for(f"host{i}", 10) for i in range(1000)]
+        assert set(shards) == set(range(10))
+        # Growing from 10 to 11 shards moves only a fraction of keys
+        moved = sum(
+            ResourceList.shard_for(f"host{i}", 11) != shards[i] for i in range(1000)
+        )
+        assert moved < 200
+        with pytest.raises(ValueError, match="n must be at least 1"):
+            ResourceList().partition(0)
+        with pytest.raises(TypeError, match="n must be an integer, got str"):
+            ResourceList.shard_for("x", "2")
+        with pytest.raises(TypeError, match="Expected callable key, got int"):
+            ResourceList().partition(2, key=1)
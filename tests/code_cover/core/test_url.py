@@ -20,6 +20,19 @@ class TestUrl:
         url = Url(Url("https://www.example.com"))
         assert str(url) == "https://www.example.com"
 
+    def test_url_initialisation_with_url_reuses_parse(self):
+        original = Url("https://www.example.com/foo?a=b")
+        copy = Url(original)
+        assert copy._parsed is original._parsed
+        assert copy == original
+        assert hash(copy) == hash(original)
+
+    def test_url_parse_cache(self):
+        a = Url("https://www.example.com/cached")
+        b = Url("https://www.example.com/cached")
+        assert a is not b
+        assert a._parsed is b._parsed
+
     def test_url_initialisation_with_unsupported_protocol(self):
         url = "gopher://gopher.example.com"
         with pytest.raises(
@@ -86,6 +99,8 @@ class TestUrl:
     def test_hash(self):
         url = "https://www.example.com"
         set({Url(url)})
+        assert hash(Url(url)) == hash(url)
+        assert Url(url) in {url}
 
     # 3. Add single query parameter: extend("param_name", "param_value")
 
@@ -179,3 +194,51 @@ class TestUrl:
         for param in invalid:
             with pytest.raises(ValueError, match=f"Invalid arguments for extend()"):
                 url.extend(param)
+
+    def test_canonical(self):
+        variant = Url("HTTP://Example.com:80/a/../b?y=2&x=1#frag")
+        canonical = Url("http://example.com/b?x=1&y=2")
+        assert variant != canonical
+        assert variant.canonical() == canonical
+        assert canonical.canonical() == canonical
+        assert Url("https://example.com").canonical() == "https://example.com/"
+        assert Url("https://example.com:8443/").canonical() == (
+            "https://example.com:8443/"
+        )
+        assert Url("http://[::1]:80/x").canonical() == "http://[::1]/x"
+        assert Url("https://example.com/a/b/..").canonical() == (
+            "https://example.com/a/"
+        )
+        assert Url("file:///foo/./bar/../baz").canonical() == "file:///foo/baz"
+
+    def test_canonical_tracking_params(self):
+        url = Url("https://example.com/?UTM_Source=x&id=1&gclid=abc&fbclid=")
+        assert url.canonical() == "https://example.com/?id=1"
+        assert url.canonical(strip_params=()) == (
+            "https://example.com/?UTM_Source=x&fbclid=&gclid=abc&id=1"
+        )
+        assert url.canonical(strip_params=("id",)) == (
+            "https://example.com/?UTM_Source=x&fbclid=&gclid=abc"
+        )
+
+    def test_canonical_rules_can_be_disabled(self):
+        url = Url("HTTP://Example.com:80/a/../b?y=2&x=1#frag")
+        assert (
+            url.canonical(
+                lowercase=False,
+                drop_default_port=False,
+                resolve_dots=False,
+                sort_query=False,
+                drop_fragment=False,
+            )
+            == "http://Example.com:80/a/../b?y=2&x=1#frag"
+        )
+        assert url.canonical(lowercase=False) == "http://Example.com/b?x=1&y=2"
+        assert url.canonical(sort_query=False) == "http://example.com/b?y=2&x=1"
+        assert url.canonical(drop_fragment=False) == (
+            "http://example.com/b?x=1&y=2#frag"
+        )
+
+    def test_canonical_invalid_port(self):
+        with pytest.raises(ValueError):
+            Url("http://example.com:port/").canonical()
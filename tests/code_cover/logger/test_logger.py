@@ -113,3 +113,106 @@ class TestLogger:
         # Clean up
         Logger().reset()
         Config().reset()
+
+    def test_queue_logging(self, tmp_path):
+        log_path = tmp_path / "queued.log"
+        Config().logger.console_enabled = False
+        Config().logger.file_enabled = True
+        Config().logger.file_path = str(log_path)
+        Config().logger.queue_enabled = True
+
+        logger = Logger.logger(Resource("https://www.example.com"), "test")
+        assert Logger._queue_listener is not None
+        logger.warning("Queued message")
+        Logger.flush()
+        assert "Queued message" in log_path.read_text()
+
+        # The listener keeps running after a flush
+        logger.warning("Second message")
+        Logger.reset()
+        assert Logger._queue_listener is None
+        assert "Second message" in log_path.read_text()
+
+    def test_flush_with_full_queue(self, tmp_path):
+        from threading import Event, Timer
+        from time import sleep
+
+        log_path = tmp_path / "full.log"
+        Config().logger.console_enabled = False
+        Config().logger.file_enabled = True
+        Config().logger.file_path = str(log_path)
+        Config().logger.queue_enabled = True
+        Config().logger.queue_size = 2
+
+        logger = Logger.logger(Resource("https://www.example.com"), "test")
+        file_handler = Logger._file_handler
+        release = Event()
+        emit = file_handler.emit
+
+        def slow_emit(record):
+            release.wait(5)
+            emit(record)
+
+        file_handler.emit = slow_emit
+        # The listener holds the first record; the other two fill the queue
+        for i in range(3):
+            logger.warning("Message %d", i)
+        while not Logger._queue_listener.queue.full():
+            sleep(0.01)
+
+        Timer(0.2, release.set).start()
+        Logger.flush()
+        text = log_path.read_text()
+        assert all(f"Message {i}" in text for i in range(3))
+
+        # With the listener stopped for good, records are written directly
+        Logger._stop_listener()
+        logger.warning("After stop")
+        assert "After stop" in log_path.read_text()
+
+    def test_queue_drops_debug_when_full(self):
+        import logging
+        from queue import Queue
+
+        from ethicrawl.logger.queue_handler import BoundedQueueHandler
+
+        queue = Queue(2)
+        handler = BoundedQueueHandler(queue)
+        logger = logging.getLogger("ethicrawl.test_queue_drop")
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        try:
+            for i in range(5):
+                logger.debug("debug %d", i)
+            assert handler.dropped == 3
+            assert queue.qsize() == 2
+
+            queue.get_nowait()
+            queue.get_nowait()
+            logger.info("info")
+            messages = [queue.get_nowait().getMessage() for _ in range(queue.qsize())]
+            assert messages == [
+                "info",
+                "Dropped 3 log records while the log queue was full",
+            ]
+        finally:
+            logger.removeHandler(handler)
+
+    def test_logger_cache(self):
+        from logging import DEBUG
+
+        resource = Resource("https://www.example.com/a")
+        first = Logger.logger(resource, "cached")
+        assert Logger.logger(Resource("https://www.example.com/b"), "cached") is first
+        assert Logger.logger(resource) is not first
+
+        # A config change invalidates the cache so new levels apply
+        Config().logger.set_component_level("cached", DEBUG)
+        again = Logger.logger(resource, "cached")
+        assert again is first  # logging keeps one logger per name
+        assert again.level == DEBUG
+        assert Logger._cache_generation == Config().snapshot().generation
+
+        Logger.reset()
+        assert Logger._cache == {}
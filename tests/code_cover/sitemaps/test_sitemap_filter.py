@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from ethicrawl.core import Resource, ResourceList
+from ethicrawl.sitemaps import SitemapEntry, SitemapFilter, UrlsetEntry
+
+
+class TestSitemapFilter:
+    def entries(self):
+        return ResourceList(
+            [
+                UrlsetEntry(
+                    "https://example.com/a",
+                    lastmod="2024-03-01",
+                    changefreq="daily",
+                    priority=0.9,
+                ),
+                UrlsetEntry(
+                    "https://example.com/b",
+                    lastmod="2023-06-15T14:30:00+02:00",
+                    changefreq="weekly",
+                    priority="0.4",
+                ),
+                UrlsetEntry("https://example.com/c"),
+                Resource("https://example.com/d"),
+            ]
+        )
+
+    def paths(self, resources):
+        return [r.url.path for r in resources]
+
+    def test_lastmod_bounds(self):
+        entries = self.entries()
+        assert self.paths(
+            entries.filter(SitemapFilter(lastmod_after="2024-01-01"))
+        ) == ["/a"]
+        rule = SitemapFilter(lastmod_before=datetime(2024, 1, 1))
+        assert self.paths(entries.filter(rule)) == ["/b"]
+        rule = SitemapFilter(
+            lastmod_after=datetime(2023, 6, 15, 12, 30, tzinfo=timezone.utc)
+        )
+        assert self.paths(entries.filter(rule)) == ["/a", "/b"]
+
+    def test_priority_and_changefreq(self):
+        entries = self.entries()
+        assert self.paths(entries.filter(SitemapFilter(min_priority=0.5))) == ["/a"]
+        assert self.paths(entries.filter(SitemapFilter(max_priority=0.5))) == ["/b"]
+        rule = SitemapFilter(changefreq=["Weekly", "daily"], exclude="/a$")
+        assert self.paths(entries.filter(rule)) == ["/b"]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(TypeError, match="min_priority must be a number, got str"):
+            SitemapFilter(min_priority="0.5")
+        with pytest.raises(
+            ValueError, match="max_priority must be between 0.0 and 1.0, got 2"
+        ):
+            SitemapFilter(max_priority=2)
+        with pytest.raises(ValueError, match="Invalid lastmod_after date format"):
+            SitemapFilter(lastmod_after="yesterday")
+        with pytest.raises(
+            TypeError, match="lastmod_before must be a datetime or str, got int"
+        ):
+            SitemapFilter(lastmod_before=1)
+        with pytest.raises(ValueError, match="Invalid change frequency"):
+            SitemapFilter(changefreq="sometimes")
+
+    def test_lastmod_datetime(self):
+        assert SitemapEntry("https://example.com").lastmod_datetime is None
+        entry = SitemapEntry("https://example.com", lastmod="2024-03-01T10:00:00")
+        assert entry.lastmod_datetime == datetime(2024, 3, 1, 10, tzinfo=timezone.utc)
@@ -285,6 +285,19 @@ class TestSitemapParser:
             # Verify _get was not called
             mock_get.assert_not_called()
 
+    def test_process_entry_invalid_port_skipped(self):
+        """An entry whose URL cannot be canonicalised is skipped, not fatal."""
+        parser = SitemapParser(self.context())
+        entry = IndexEntry("https://www.example.com:99999/sitemap.xml")
+        visited = set()
+
+        with patch.object(parser, "_get") as mock_get:
+            result = parser._process_entry(entry, 0, visited)
+
+        assert len(result) == 0
+        assert visited == set()
+        mock_get.assert_not_called()
+
     def test_traverse_empty_index(self):
         context = self.context()
         parser = SitemapParser(context)
@@ -409,3 +422,19 @@ class TestSitemapParser:
 
             result = sp._get(r)
             assert isinstance(result, UrlsetDocument)
+
+    def test_traverse_spills_past_threshold(self):
+        from ethicrawl.config import Config
+
+        Config().sitemap.spill_threshold = 2
+        context = self.context()
+        parser = SitemapParser(context)
+        document = IndexDocument(context)
+        document.entries = ResourceList([IndexEntry("https://www.example.com/a")])
+        with patch.object(parser, "_process_entry") as mock_process:
+            mock_process.return_value = ResourceList(
+                [Resource(f"https://www.example.com/{i}") for i in range(5)]
+            )
+            result = parser._traverse(document)
+        assert result.spilled
+        assert [r.url.path for r in result] == [f"/{i}" for i in range(5)]
@@ -0,0 +1,81 @@
+import pytest
+
+from ethicrawl.core import Resource, ResourceList
+from ethicrawl.sitemaps import UrlsetEntry
+
+
+class TestSitemapSorting:
+    def entries(self):
+        return ResourceList(
+            [
+                UrlsetEntry(
+                    "https://example.com/a", lastmod="2024-03-01", priority=0.5
+                ),
+                UrlsetEntry(
+                    "https://example.com/b",
+                    lastmod="2024-03-01T01:00:00+02:00",  # 2024-02-29T23:00Z
+                    priority="0.9",
+                ),
+                UrlsetEntry("https://example.com/c"),
+                UrlsetEntry(
+                    "https://example.com/d",
+                    lastmod="2024-03-02T00:00:00.5Z",
+                    priority=0.1,
+                ),
+                Resource("https://example.com/e"),
+            ]
+        )
+
+    def paths(self, resources):
+        return [r.url.path for r in resources]
+
+    def test_sort_by_lastmod(self):
+        entries = self.entries()
+        assert self.paths(entries.sort_by("lastmod")) == ["/b", "/a", "/d", "/c", "/e"]
+        assert self.paths(entries.sort_by("lastmod", reverse=True)) == [
+            "/d",
+            "/a",
+            "/b",
+            "/c",
+            "/e",
+        ]
+        # The original list is untouched
+        assert self.paths(entries) == ["/a", "/b", "/c", "/d", "/e"]
+
+    def test_sort_by_priority_and_callable(self):
+        entries = self.entries()
+        assert self.paths(entries.sort_by("priority")) == ["/d", "/a", "/b", "/c", "/e"]
+        by_path = entries.sort_by(lambda r: r.url.path, reverse=True)
+        assert self.paths(by_path) == ["/e", "/d", "/c", "/b", "/a"]
+
+    def test_top_k(self):
+        entries = self.entries()
+        assert self.paths(entries.top_k(2, "lastmod")) == ["/d", "/a"]
+        assert self.paths(entries.top_k(2, "lastmod", largest=False)) == ["/b", "/a"]
+        assert self.paths(entries.top_k(10, "priority")) == ["/b", "/a", "/d"]
+        assert len(entries.top_k(0, "priority")) == 0
+
+    def test_top_k_matches_sort(self):
+        entries = ResourceList(
+            [
+                UrlsetEntry(f"https://example.com/{i}", priority=(i * 7 % 11) / 10)
+                for i in range(50)
+            ]
+        )
+        expected = entries.sort_by("priority", reverse=True)[:10]
+        assert entries.top_k(10, "priority").to_list() == expected.to_list()
+
+    def test_invalid_arguments(self):
+        entries = self.entries()
+        with pytest.raises(TypeError, match="k must be an integer, got str"):
+            entries.top_k("1", "lastmod")
+        with pytest.raises(ValueError, match="k cannot be negative"):
+            entries.top_k(-1, "lastmod")
+        with pytest.raises(TypeError, match="Expected str or callable key, got int"):
+            entries.sort_by(1)
+
+    def test_lastmod_datetime_cached(self):
+        entry = UrlsetEntry("https://example.com/a", lastmod="2024-03-01")
+        assert entry.lastmod_datetime is entry.lastmod_datetime
+        entry.lastmod = "2025-01-01"
+        assert entry.lastmod_datetime.year == 2025
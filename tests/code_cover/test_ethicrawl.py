@@ -252,3 +252,25 @@ class TestEthicrawl:
         # Verify we got the expected response
         assert result.status_code == 200
         assert result.text == "Custom client response"
+
+    def test_unbind_closes_clients(self, test_server):
+        """Unbinding closes bound clients, releasing their browsers."""
+        from ethicrawl.client.client import Client
+
+        class ClosingClient(Client):
+            closed = 0
+
+            def get(self, resource, **kwargs):
+                response = Mock()
+                response.status_code = 404
+                response.text = ""
+                return response
+
+            def close(self):
+                self.closed += 1
+
+        client = ClosingClient()
+        with Ethicrawl() as crawler:
+            crawler.bind(test_server, client=client)
+        assert not crawler.bound
+        assert client.closed >= 1
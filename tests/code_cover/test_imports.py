@@ -0,0 +1,44 @@
+import json
+import subprocess
+import sys
+
+# Generous, so slow CI machines pass; a regression to eager Selenium
+# imports is caught by the module checks below rather than the timing
+IMPORT_BUDGET = 2.0
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import ethicrawl
+elapsed = time.perf_counter() - start
+from ethicrawl.logger import color_formatter
+print(json.dumps({
+    "elapsed": elapsed,
+    "modules": sorted(m for m in ("selenium", "lxml.html") if m in sys.modules),
+    "colorama_initialized": color_formatter._colorama_initialized,
+}))
+"""
+
+
+def run_probe(code=PROBE):
+    # A fresh interpreter, as this one has already imported everything
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestImports:
+    def test_import_is_lazy(self):
+        result = run_probe()
+        assert result["modules"] == []
+        assert result["colorama_initialized"] is False
+        assert result["elapsed"] < IMPORT_BUDGET
+
+    def test_chrome_loads_selenium(self):
+        result = run_probe(
+            "import json, sys\n"
+            "from ethicrawl.client.http.chrome_transport import ChromeTransport\n"
+            "print(json.dumps('selenium' in sys.modules))"
+        )
+        assert result is True
@@ -4,7 +4,9 @@ from flask import Flask, Response
 import time
 
 
+from ethicrawl.client.http.chrome_registry import registry
 from ethicrawl.config import Config
+from ethicrawl.core import Resolver
 from ethicrawl.logger import Logger
 
 
@@ -14,6 +16,8 @@ def reset_all_singletons():
     # Reset before test
     Config().reset()
     Logger().reset()
+    Resolver.set_default(None)
+    registry.clear()
 
     # Run the test
     yield
@@ -21,6 +25,8 @@ def reset_all_singletons():
     # Reset after test
     Config().reset()
     Logger().reset()
+    Resolver.set_default(None)
+    registry.clear()
 
 
 @pytest.fixture(scope="session")